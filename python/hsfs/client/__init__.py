@@ -32,11 +32,12 @@ def init(
     cert_folder=None,
     api_key_file=None,
     api_key_value=None,
+    http_options=None,
 ):
     global _client
     if not _client:
         if client_type == "hopsworks":
-            _client = hopsworks.Client()
+            _client = hopsworks.Client(http_options)
         elif client_type == "external":
             _client = external.Client(
                 host,
@@ -50,6 +51,7 @@ def init(
                 cert_folder,
                 api_key_file,
                 api_key_value,
+                http_options,
             )
 
 
@@ -14,12 +14,15 @@
 #   limitations under the License.
 #
 
+import gzip
 import os
 import furl
 from abc import ABC, abstractmethod
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from hsfs.client import exceptions, auth
 from hsfs.decorators import connected
@@ -36,6 +39,19 @@ class Client(ABC):
     DEFAULT_DATABRICKS_ROOT_VIRTUALENV_ENV = "DEFAULT_DATABRICKS_ROOT_VIRTUALENV_ENV"
     HOPSWORKS_PUBLIC_HOST = "HOPSWORKS_PUBLIC_HOST"
 
+    # defaults of the http_options, see `hsfs.connection()`
+    HTTP_OPTIONS_DEFAULT = {
+        "pool_connections": 10,
+        "pool_maxsize": 32,
+        "keep_alive": True,
+        "max_retries": 3,
+        "backoff_factor": 0.5,
+        "connect_timeout": 10,
+        "read_timeout": None,
+        "compression_threshold": None,
+    }
+    RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
     @abstractmethod
     def __init__(self):
         """To be implemented by clients."""
@@ -64,6 +80,66 @@ class Client(ABC):
 
         return False
 
+    def _get_session(self, http_options=None):
+        """Create the HTTP session used to send requests to Hopsworks.
+
+        :param http_options: options of the connection pool, retries, timeouts and
+            compression overriding `HTTP_OPTIONS_DEFAULT`, defaults to None
+        :type http_options: dict, optional
+        :return: session with a connection pool retrying idempotent requests
+        :rtype: requests.Session
+        """
+        self._http_options = {**self.HTTP_OPTIONS_DEFAULT, **(http_options or {})}
+        unknown_options = set(self._http_options) - set(self.HTTP_OPTIONS_DEFAULT)
+        if unknown_options:
+            raise ValueError(
+                "Unknown http options {}, supported options are {}.".format(
+                    sorted(unknown_options), sorted(self.HTTP_OPTIONS_DEFAULT)
+                )
+            )
+
+        # only idempotent methods are retried, as a POST might have been processed
+        # by the server even though the response was lost
+        retries = Retry(
+            total=self._http_options["max_retries"],
+            backoff_factor=self._http_options["backoff_factor"],
+            status_forcelist=self.RETRY_STATUS_CODES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self._http_options["pool_connections"],
+            pool_maxsize=self._http_options["pool_maxsize"],
+            max_retries=retries,
+        )
+        session = requests.session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self._http_options["keep_alive"]:
+            session.headers["Connection"] = "close"
+        return session
+
+    def _get_timeout(self):
+        """Get the (connect, read) timeout in seconds of requests to Hopsworks."""
+        http_options = getattr(self, "_http_options", self.HTTP_OPTIONS_DEFAULT)
+        return http_options["connect_timeout"], http_options["read_timeout"]
+
+    def _compress(self, headers, data):
+        """Gzip the payload if it is larger than the compression threshold.
+
+        :return: headers and payload to send
+        :rtype: tuple
+        """
+        http_options = getattr(self, "_http_options", self.HTTP_OPTIONS_DEFAULT)
+        threshold = http_options["compression_threshold"]
+        if threshold is None or not isinstance(data, (str, bytes)):
+            return headers, data
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if len(data) < threshold:
+            return headers, data
+        return {**(headers or {}), "Content-Encoding": "gzip"}, gzip.compress(data)
+
     def _get_host_port_pair(self):
         """
         Removes "http or https" from the rest endpoint and returns a list
@@ -146,6 +222,7 @@ class Client(ABC):
         f_url.path.segments = base_path_params + path_params
         url = str(f_url)
 
+        headers, data = self._compress(headers, data)
         request = requests.Request(
             method,
             url=url,
@@ -157,7 +234,9 @@ class Client(ABC):
         )
 
         prepped = self._session.prepare_request(request)
-        response = self._session.send(prepped, verify=self._verify, stream=stream)
+        response = self._session.send(
+            prepped, verify=self._verify, stream=stream, timeout=self._get_timeout()
+        )
 
         if response.status_code == 401 and self.REST_ENDPOINT in os.environ:
             # refresh token and retry request - only on hopsworks
@@ -165,9 +244,12 @@ class Client(ABC):
             # Update request with the new token
             request.auth = self._auth
             prepped = self._session.prepare_request(request)
-            response = self._session.send(prepped, verify=self._verify, stream=stream)
+            response = self._session.send(
+                prepped, verify=self._verify, stream=stream, timeout=self._get_timeout()
+            )
 
-        if response.status_code // 100 != 2:
+        # 304 is only returned to conditional requests, which handle it themselves
+        if response.status_code // 100 != 2 and response.status_code != 304:
             raise exceptions.RestAPIError(url, response)
 
         if stream:
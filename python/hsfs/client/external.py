@@ -15,10 +15,8 @@
 #
 
 import os
-import boto3
 import base64
 import json
-import requests
 
 try:
     from pyspark.sql import SparkSession
@@ -48,6 +46,7 @@ class Client(base.Client):
         cert_folder,
         api_key_file,
         api_key_value,
+        http_options=None,
     ):
         """Initializes a client in an external environment such as AWS Sagemaker."""
         if not host:
@@ -67,7 +66,7 @@ class Client(base.Client):
             api_key = self._get_secret(secrets_store, "api-key", api_key_file)
         self._auth = auth.ApiKeyAuth(api_key)
 
-        self._session = requests.session()
+        self._session = self._get_session(http_options)
         self._connected = True
         self._verify = self._get_verify(self._host, trust_store_path)
 
@@ -219,6 +218,8 @@ class Client(base.Client):
             )
 
     def _query_secrets_manager(self, secret_key):
+        import boto3
+
         secret_name = "hopsworks/role/" + self._assumed_role()
         args = {"service_name": "secretsmanager"}
         region_name = self._get_region()
@@ -229,6 +230,8 @@ class Client(base.Client):
         return json.loads(get_secret_value_response["SecretString"])[secret_key]
 
     def _assumed_role(self):
+        import boto3
+
         client = boto3.client("sts")
         response = client.get_caller_identity()
         # arns for assumed roles in SageMaker follow the following schema
@@ -247,6 +250,8 @@ class Client(base.Client):
             return None
 
     def _query_parameter_store(self, secret_key):
+        import boto3
+
         args = {"service_name": "ssm"}
         region_name = self._get_region()
         if region_name:
@@ -19,15 +19,8 @@ import os
 import textwrap
 from pathlib import Path
 
-import requests
-
 from hsfs.client import base, auth
 
-try:
-    import jks
-except ImportError:
-    pass
-
 
 class Client(base.Client):
     REQUESTS_VERIFY = "REQUESTS_VERIFY"
@@ -46,7 +39,7 @@ class Client(base.Client):
     MATERIAL_PWD = "material_passwd"
     SECRETS_DIR = "SECRETS_DIR"
 
-    def __init__(self):
+    def __init__(self, http_options=None):
         """Initializes a client being run from a job/notebook directly on Hopsworks."""
         self._base_url = self._get_hopsworks_rest_endpoint()
         self._host, self._port = self._get_host_port_pair()
@@ -67,7 +60,7 @@ class Client(base.Client):
         except FileNotFoundError:
             self._auth = auth.ApiKeyAuth(self._read_apikey())
         self._verify = self._get_verify(hostname_verification, trust_store_path)
-        self._session = requests.session()
+        self._session = self._get_session(http_options)
 
         self._connected = True
 
@@ -123,6 +116,8 @@ class Client(base.Client):
         Returns:
              strings: (ca_cert)
         """
+        import jks
+
         # load the keystore and decrypt it with password
         ks = jks.KeyStore.load(jks_path, keystore_pw, try_decrypt_keys=True)
         ca_certs = ""
@@ -21,7 +21,16 @@ from requests.exceptions import ConnectionError
 
 from hsfs.decorators import connected, not_connected
 from hsfs import engine, client, util
-from hsfs.core import feature_store_api, project_api, hosts_api, services_api
+from hsfs.core import (
+    feature_store_api,
+    project_api,
+    hosts_api,
+    services_api,
+    query_constructor_api,
+    metadata_cache,
+    variable_api,
+    vector_server,
+)
 
 AWS_DEFAULT_REGION = "default"
 HOPSWORKS_PORT_DEFAULT = 443
@@ -111,6 +120,28 @@ class Connection:
         api_key_value: API Key as string, if provided, `secrets_store` will be ignored`,
             however, this should be used with care, especially if the used notebook or
             job script is accessible by multiple parties. Defaults to `None`.
+        http_options: Options of the HTTP client sending requests to the Hopsworks REST
+            API, defaults to `None`. Supported options:
+            * key `pool_connections` and value the number of hosts to keep connection
+              pools for, defaults to `10`.
+            * key `pool_maxsize` and value the maximum number of connections kept open
+              per host, defaults to `32`. Increase it when calling the feature store
+              from many threads.
+            * key `keep_alive` and value `True` or `False` to reuse connections
+              across requests, defaults to `True`.
+            * key `max_retries` and value the number of retries of idempotent requests
+              on connection errors and `429`, `500`, `502`, `503` and `504`
+              responses, defaults to `3`.
+            * key `backoff_factor` and value the factor of the exponential backoff
+              between retries in seconds, defaults to `0.5`.
+            * key `connect_timeout` and value the timeout to establish a connection
+              in seconds, defaults to `10`.
+            * key `read_timeout` and value the timeout to wait for a response in
+              seconds, defaults to `None`, waiting indefinitely.
+            * key `compression_threshold` and value the size in bytes above which
+              request payloads, such as statistics, are gzip compressed, defaults to
+              `None`, not compressing requests. Responses are always requested
+              compressed.
 
     # Returns
         `Connection`. Feature Store connection handle to perform operations on a
@@ -130,6 +161,7 @@ class Connection:
         cert_folder: str = CERT_FOLDER_DEFAULT,
         api_key_file: str = None,
         api_key_value: str = None,
+        http_options: dict = None,
     ):
         self._host = host
         self._port = port
@@ -142,6 +174,7 @@ class Connection:
         self._cert_folder = cert_folder
         self._api_key_file = api_key_file
         self._api_key_value = api_key_value
+        self._http_options = http_options
         self._connected = False
 
         self.connect()
@@ -230,9 +263,10 @@ class Connection:
                     self._cert_folder,
                     self._api_key_file,
                     self._api_key_value,
+                    self._http_options,
                 )
             else:
-                client.init("hopsworks")
+                client.init("hopsworks", http_options=self._http_options)
 
             # init engine
             engine.init(self._engine)
@@ -264,6 +298,10 @@ class Connection:
         client.stop()
         self._feature_store_api = None
         engine.stop()
+        query_constructor_api.QueryConstructorApi.invalidate_cache()
+        metadata_cache.get_instance().invalidate()
+        variable_api.VariableApi.invalidate_cache()
+        vector_server.VectorServer.invalidate_transformation_statistics()
         self._connected = False
         print("Connection closed.")
 
@@ -330,6 +368,7 @@ class Connection:
         cert_folder: str = CERT_FOLDER_DEFAULT,
         api_key_file: str = None,
         api_key_value: str = None,
+        http_options: dict = None,
     ):
         """Connection factory method, accessible through `hsfs.connection()`."""
         return cls(
@@ -344,6 +383,7 @@ class Connection:
             cert_folder,
             api_key_file,
             api_key_value,
+            http_options,
         )
 
     def _get_clients(self, dbfs_folder: str):
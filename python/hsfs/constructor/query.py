@@ -20,7 +20,12 @@ from typing import Optional, List, Union
 from datetime import datetime, date
 
 from hsfs import util, engine, feature_group
-from hsfs.core import query_constructor_api, storage_connector_api, arrow_flight_client
+from hsfs.core import (
+    query_constructor_api,
+    storage_connector_api,
+    arrow_flight_client,
+    query_result_cache,
+)
 from hsfs.constructor import join
 from hsfs.constructor.filter import Filter, Logic
 from hsfs.client.exceptions import FeatureStoreException
@@ -126,6 +131,9 @@ class Query:
                   [ArrowFlight Server](https://docs.hopsworks.ai/latest/setup_installation/common/arrow_flight_duckdb/).
                 * key "hive_config" to pass a dictionary of hive or tez configurations.
                   For example: `{"hive_config": {"hive.tez.cpu.vcores": 2, "tez.grouping.split-count": "3"}}`
+                * key `"use_result_cache"` and value `True` to cache the result of offline
+                  reads on the local file system. The cached result is reused until any of
+                  the feature groups in the query has a new commit.
                 Defaults to `{}`.
 
         # Returns
@@ -134,8 +142,6 @@ class Query:
         if not read_options:
             read_options = {}
 
-        sql_query, online_conn = self._prep_read(online, read_options)
-
         schema = None
         if (
             read_options
@@ -148,6 +154,16 @@ class Query:
                     "Pandas types casting only supported for feature_group.read()/query.select_all()"
                 )
 
+        if (
+            read_options.get("use_result_cache", False)
+            and not online
+            and self._python_engine
+            and query_result_cache.get_instance().is_cacheable(self)
+        ):
+            return self._read_with_result_cache(dataframe_type, read_options, schema)
+
+        sql_query, online_conn = self._prep_read(online, read_options)
+
         return engine.get_instance().sql(
             sql_query,
             self._feature_store_name,
@@ -157,6 +173,23 @@ class Query:
             schema,
         )
 
+    def _read_with_result_cache(self, dataframe_type, read_options, schema):
+        result_cache = query_result_cache.get_instance()
+        cache_key = result_cache.get_key(self, read_options)
+        result_df = result_cache.get(cache_key)
+        if result_df is None:
+            sql_query, _ = self._prep_read(False, read_options)
+            result_df = engine.get_instance().sql(
+                sql_query,
+                self._feature_store_name,
+                None,
+                "default",
+                read_options,
+                schema,
+            )
+            result_cache.put(cache_key, result_df)
+        return engine.get_instance()._return_dataframe_type(result_df, dataframe_type)
+
     def show(self, n: int, online: Optional[bool] = False):
         """Show the first N rows of the Query.
 
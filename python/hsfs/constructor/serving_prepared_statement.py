@@ -65,6 +65,7 @@ class ServingPreparedStatement:
             "preparedStatementIndex": self._prepared_statement_index,
             "preparedStatementParameters": self._prepared_statement_parameters,
             "queryOnline": self._query_online,
+            "prefix": self._prefix,
         }
 
     @property
@@ -17,7 +17,13 @@
 import datetime
 import json
 import base64
+import queue
+import random
+import threading
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import wraps
 
 import pyarrow
@@ -44,21 +50,61 @@ class ArrowFlightClient:
     FILTER_NUMERIC_TYPES = ["bigint", "tinyint", "smallint", "int", "float", "double"]
     READ_ERROR = 'Could not read data using ArrowFlight. If the issue persists, use read_options={"use_hive": True} instead.'
     WRITE_ERROR = 'Could not write data using ArrowFlight. If the issue persists, use write_options={"use_spark": True} instead.'
+    CREATE_TRAINING_DATASET_ACTION = "create-training-dataset"
+    # training datasets with splits and built-in transformation functions are only
+    # materialized by servers which list this action, older servers would ignore them
+    CREATE_SPLIT_TRAINING_DATASET_ACTION = "create-split-training-dataset"
+    SUPPORTED_TRANSFORMATION_FUNCTIONS = [
+        "min_max_scaler",
+        "standard_scaler",
+        "robust_scaler",
+        "label_encoder",
+    ]
+    DEFAULT_POOL_SIZE = 4
+    DEFAULT_MAX_RETRIES = 3
+    DEFAULT_RETRY_BACKOFF = 0.5
+    # gRPC status codes UNAVAILABLE and DEADLINE_EXCEEDED, safe to retry for reads
+    TRANSIENT_ERRORS = (
+        pyarrow.flight.FlightUnavailableError,
+        pyarrow.flight.FlightTimedOutError,
+    )
+
+    def __init__(
+        self,
+        pool_size=DEFAULT_POOL_SIZE,
+        max_retries=DEFAULT_MAX_RETRIES,
+        retry_backoff=DEFAULT_RETRY_BACKOFF,
+    ):
+        self._pool_size = max(1, pool_size)
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        # additional flight clients used to read endpoints concurrently,
+        # created lazily up to pool_size
+        self._connection_pool = queue.Queue()
+        self._connection_pool_count = 0
+        self._connection_pool_lock = threading.Lock()
+        self._supported_actions = None
 
-    def __init__(self):
         try:
             self._variable_api = VariableApi()
             self._is_enabled = self._variable_api.get_flyingduck_enabled()
         except Exception:
             # if feature flag cannot be retrieved, assume it is disabled
             self._is_enabled = False
-            return
-
-        if self._is_enabled:
+        # the connection is established when the server is needed for the first time,
+        # such that clients which never read from the offline store do not wait for it
+        self._is_initialized = not self._is_enabled
+        self._initialization_lock = threading.Lock()
+
+    def _initialize(self):
+        with self._initialization_lock:
+            if self._is_initialized:
+                return
             try:
                 self._initialize_connection()
             except Exception as e:
                 self._disable(str(e))
+            self._is_initialized = True
 
     def _disable(self, message):
         self._is_enabled = False
@@ -89,39 +135,113 @@ class ArrowFlightClient:
                 )
             host_url = f"grpc+tls://flyingduck.service.{service_discovery_domain}:5005"
 
-        (tls_root_certs, cert_chain, private_key) = self._extract_certs(self._client)
-        self._connection = pyarrow.flight.FlightClient(
-            location=host_url,
+        self._host_url = host_url
+        self._certificates = self._extract_certs(self._client)
+        self._connection = self._create_connection()
+        self._health_check()
+        self._register_certificates()
+
+    def _create_connection(self):
+        (tls_root_certs, cert_chain, private_key) = self._certificates
+        return pyarrow.flight.FlightClient(
+            location=self._host_url,
             tls_root_certs=tls_root_certs,
             cert_chain=cert_chain,
             private_key=private_key,
             override_hostname="flyingduck.service.consul",
         )
-        self._health_check()
-        self._register_certificates()
+
+    @contextmanager
+    def _pooled_connection(self):
+        connection = self._acquire_connection()
+        try:
+            yield connection
+        finally:
+            self._connection_pool.put(connection)
+
+    def _acquire_connection(self):
+        try:
+            return self._connection_pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._connection_pool_lock:
+            create = self._connection_pool_count < self._pool_size
+            if create:
+                self._connection_pool_count += 1
+        if create:
+            return self._create_connection()
+        # pool is exhausted, wait for another thread to return a client
+        return self._connection_pool.get()
+
+    def _call_with_retry(self, fn, *args, **kwargs):
+        attempt = 0
+        while True:
+            try:
+                return fn(*args, **kwargs)
+            except ArrowFlightClient.TRANSIENT_ERRORS:
+                if attempt >= self._max_retries:
+                    raise
+                # exponential backoff with jitter
+                backoff = self._retry_backoff * (2**attempt)
+                time.sleep(backoff + random.uniform(0, backoff))
+                attempt += 1
 
     def _health_check(self):
         action = pyarrow.flight.Action("healthcheck", b"")
         options = pyarrow.flight.FlightCallOptions(timeout=1)
         list(self._connection.do_action(action, options=options))
 
+    def _supports_action(self, action_type):
+        if self._supported_actions is None:
+            try:
+                self._supported_actions = {
+                    action.type
+                    for action in self._call_with_retry(self._connection.list_actions)
+                }
+            except Exception:
+                self._supported_actions = set()
+        return action_type in self._supported_actions
+
+    def is_training_dataset_supported(self, training_dataset_obj, write_options):
+        """Whether the server can materialize the training dataset, including its
+        splits and transformation functions."""
+        if not self._should_be_used(write_options) or (
+            training_dataset_obj.data_format not in ArrowFlightClient.SUPPORTED_FORMATS
+        ):
+            return False
+        transformation_functions = training_dataset_obj.transformation_functions
+        if not training_dataset_obj.splits and not transformation_functions:
+            return True
+        return all(
+            training_dataset_obj._transformation_function_engine.is_builtin(
+                transformation_fn
+            )
+            and transformation_fn.name
+            in ArrowFlightClient.SUPPORTED_TRANSFORMATION_FUNCTIONS
+            for transformation_fn in transformation_functions.values()
+        ) and self._supports_action(
+            ArrowFlightClient.CREATE_SPLIT_TRAINING_DATASET_ACTION
+        )
+
     def _should_be_used(self, read_options):
         if read_options and (
             read_options.get("use_hive", False) or read_options.get("use_spark", False)
         ):
             return False
 
+        if not self._is_initialized:
+            self._initialize()
         return self._is_enabled
 
     def is_query_supported(self, query, read_options):
-        return self._should_be_used(read_options) and self._is_query_supported_rec(
-            query
+        return self._is_query_supported_rec(query) and self._should_be_used(
+            read_options
         )
 
     def is_data_format_supported(self, data_format, read_options):
         return (
-            self._should_be_used(read_options)
-            and data_format in ArrowFlightClient.SUPPORTED_FORMATS
+            data_format in ArrowFlightClient.SUPPORTED_FORMATS
+            and self._should_be_used(read_options)
         )
 
     def _is_query_supported_rec(self, query):
@@ -192,9 +312,26 @@ class ArrowFlightClient:
         return decorator
 
     def _get_dataset(self, descriptor):
-        info = self._connection.get_flight_info(descriptor)
-        reader = self._connection.do_get(self._info_to_ticket(info))
-        return reader.read_pandas()
+        info = self._call_with_retry(self._connection.get_flight_info, descriptor)
+        tickets = self._info_to_tickets(info)
+        if len(tickets) == 1:
+            tables = [self._call_with_retry(self._read_ticket, tickets[0])]
+        else:
+            # read all endpoints concurrently, each on its own flight client
+            with ThreadPoolExecutor(
+                max_workers=min(len(tickets), self._pool_size)
+            ) as executor:
+                tables = list(
+                    executor.map(
+                        lambda ticket: self._call_with_retry(self._read_ticket, ticket),
+                        tickets,
+                    )
+                )
+        return pyarrow.concat_tables(tables).to_pandas()
+
+    def _read_ticket(self, ticket):
+        with self._pooled_connection() as connection:
+            return connection.do_get(ticket).read_all()
 
     @_handle_afs_exception(user_message=READ_ERROR)
     def read_query(self, query_object):
@@ -202,6 +339,32 @@ class ArrowFlightClient:
         descriptor = pyarrow.flight.FlightDescriptor.for_command(query_encoded)
         return self._get_dataset(descriptor)
 
+    @_handle_afs_exception(user_message=READ_ERROR)
+    def read_query_batches(self, query_object, batch_size):
+        """Read the result of a query as pandas dataframes of at least `batch_size`
+        rows, except for the last one, without holding the full result in memory."""
+        query_encoded = json.dumps(query_object).encode("ascii")
+        descriptor = pyarrow.flight.FlightDescriptor.for_command(query_encoded)
+        info = self._call_with_retry(self._connection.get_flight_info, descriptor)
+        return self._read_batches(self._info_to_tickets(info), batch_size)
+
+    def _read_batches(self, tickets, batch_size):
+        # record batches of the stream are small, they are combined into larger
+        # batches to keep the number of dataframes and shards written from them low
+        batches = []
+        num_rows = 0
+        for ticket in tickets:
+            with self._pooled_connection() as connection:
+                for chunk in connection.do_get(ticket):
+                    batches.append(chunk.data)
+                    num_rows += chunk.data.num_rows
+                    if num_rows >= batch_size:
+                        yield pyarrow.Table.from_batches(batches).to_pandas()
+                        batches = []
+                        num_rows = 0
+        if batches:
+            yield pyarrow.Table.from_batches(batches).to_pandas()
+
     @_handle_afs_exception(user_message=READ_ERROR)
     def read_path(self, path):
         descriptor = pyarrow.flight.FlightDescriptor.for_path(path)
@@ -209,7 +372,12 @@ class ArrowFlightClient:
 
     @_handle_afs_exception(user_message=WRITE_ERROR)
     def create_training_dataset(
-        self, feature_view_obj, training_dataset_obj, query_obj
+        self,
+        feature_view_obj,
+        training_dataset_obj,
+        query_obj,
+        event_time=None,
+        drop_event_time=False,
     ):
         training_dataset = {}
         training_dataset["fs_name"] = util.strip_feature_store_suffix(
@@ -220,17 +388,48 @@ class ArrowFlightClient:
         training_dataset["tds_version"] = training_dataset_obj.version
         training_dataset["query"] = query_obj
 
+        action_type = ArrowFlightClient.CREATE_TRAINING_DATASET_ACTION
+        if training_dataset_obj.splits or training_dataset_obj.transformation_functions:
+            # splits are assigned and statistics of the transformation functions are
+            # computed on the train split by the server, which returns the statistics
+            action_type = ArrowFlightClient.CREATE_SPLIT_TRAINING_DATASET_ACTION
+            training_dataset["splits"] = [
+                self._serialize_split(split) for split in training_dataset_obj.splits
+            ]
+            training_dataset["seed"] = training_dataset_obj.seed
+            training_dataset["train_split"] = training_dataset_obj.train_split
+            training_dataset["event_time"] = event_time
+            training_dataset["drop_event_time"] = drop_event_time
+            training_dataset["transformation_functions"] = [
+                self._serialize_transformation_function(feature_name, transformation_fn)
+                for feature_name, transformation_fn in training_dataset_obj.transformation_functions.items()
+            ]
+
         try:
             training_dataset_encoded = json.dumps(training_dataset).encode("ascii")
             training_dataset_buf = pyarrow.py_buffer(training_dataset_encoded)
-            action = pyarrow.flight.Action(
-                "create-training-dataset", training_dataset_buf
-            )
+            action = pyarrow.flight.Action(action_type, training_dataset_buf)
             for result in self._connection.do_action(action):
                 return result.body.to_pybytes()
         except pyarrow.lib.ArrowIOError as e:
             print("Error calling action:", e)
 
+    def _serialize_split(self, split):
+        return {
+            "name": split.name,
+            "split_type": split.split_type,
+            "percentage": split.percentage,
+            "start_time": split.start_time,
+            "end_time": split.end_time,
+        }
+
+    def _serialize_transformation_function(self, feature_name, transformation_fn):
+        return {
+            "feature": feature_name,
+            "name": transformation_fn.name,
+            "output_type": transformation_fn.output_type,
+        }
+
     def is_flyingduck_query_object(self, query_obj):
         return isinstance(query_obj, dict) and "query_string" in query_obj
 
@@ -334,5 +533,5 @@ class ArrowFlightClient:
             f"`{query._left_feature_group._get_project_name()}.",
         ).replace("`", '"')
 
-    def _info_to_ticket(self, info):
-        return info.endpoints[0].ticket
+    def _info_to_tickets(self, info):
+        return [endpoint.ticket for endpoint in info.endpoints]
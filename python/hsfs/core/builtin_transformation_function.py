@@ -14,7 +14,11 @@
 #   limitations under the License.
 #
 
+import numpy as np
+import pandas as pd
+
 from hsfs.client.exceptions import FeatureStoreException
+from hsfs.core import encoding_dictionary
 
 
 class BuiltInTransformationFunction:
@@ -82,8 +86,48 @@ class BuiltInTransformationFunction:
     def encoder_stats(content, feature_name):
         for col in content["columns"]:
             if col["column"] == feature_name and "unique_values" in col:
-                unique_data = [value for value in col["unique_values"]]
-                value_to_index = dict(
-                    (value, index) for index, value in enumerate(unique_data)
+                return encoding_dictionary.EncodingDictionary.from_unique_values(
+                    col["unique_values"], feature_name
+                )
+
+    # Vectorized implementations of the built-in transformation functions, which
+    # operate on a whole pandas Series or NumPy array at once. A zero range or
+    # standard deviation results in 0, same as the per value functions.
+
+    @staticmethod
+    def min_max_scaler(values, min_value, max_value):
+        return BuiltInTransformationFunction._scale(
+            values, min_value, max_value - min_value
+        )
+
+    @staticmethod
+    def standard_scaler(values, mean, std_dev):
+        return BuiltInTransformationFunction._scale(values, mean, std_dev)
+
+    @staticmethod
+    def robust_scaler(values, p25, p50, p75):
+        return BuiltInTransformationFunction._scale(values, p50, p75 - p25)
+
+    @staticmethod
+    def label_encoder(values, value_to_index):
+        if isinstance(value_to_index, encoding_dictionary.EncodingDictionary):
+            return value_to_index.encode(values)
+        indexer = pd.Index(list(value_to_index.keys())).get_indexer(values)
+        if (indexer == -1).any():
+            raise KeyError(
+                "Values {} are not part of the label encoder dictionary.".format(
+                    pd.unique(np.asarray(values)[indexer == -1]).tolist()
                 )
-                return value_to_index
+            )
+        encoded = np.asarray(list(value_to_index.values()))[indexer]
+        if isinstance(values, pd.Series):
+            return pd.Series(encoded, index=values.index, name=values.name)
+        return encoded
+
+    @staticmethod
+    def _scale(values, center, scale):
+        values = pd.to_numeric(values)
+        if scale == 0:
+            # keeps missing values missing
+            return (values - center) * 0
+        return (values - center) / scale
@@ -0,0 +1,597 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import base64
+import json
+import math
+import zlib
+
+import numpy as np
+import pandas as pd
+
+
+class TDigest:
+    """Mergeable quantile sketch, keeping at most `compression` centroids."""
+
+    DEFAULT_COMPRESSION = 300
+
+    def __init__(
+        self,
+        compression=DEFAULT_COMPRESSION,
+        means=None,
+        weights=None,
+        minimum=None,
+        maximum=None,
+    ):
+        self._compression = compression
+        self._means = np.asarray(means if means is not None else [], dtype="float64")
+        self._weights = np.asarray(
+            weights if weights is not None else [], dtype="float64"
+        )
+        self._minimum = minimum
+        self._maximum = maximum
+
+    def update(self, values):
+        values = np.asarray(values, dtype="float64")
+        if len(values) == 0:
+            return
+        self._update_min_max(values.min(), values.max())
+        self._compress(
+            np.concatenate([self._means, values]),
+            np.concatenate([self._weights, np.ones(len(values))]),
+        )
+
+    def merge(self, other):
+        if other.count == 0:
+            return
+        self._update_min_max(other._minimum, other._maximum)
+        self._compress(
+            np.concatenate([self._means, other._means]),
+            np.concatenate([self._weights, other._weights]),
+        )
+
+    def quantiles(self, qs):
+        if self.count == 0:
+            return [None] * len(qs)
+        centers = (np.cumsum(self._weights) - self._weights / 2) / self.count
+        return np.interp(
+            qs,
+            np.concatenate([[0.0], centers, [1.0]]),
+            np.concatenate([[self._minimum], self._means, [self._maximum]]),
+        ).tolist()
+
+    @property
+    def count(self):
+        return float(self._weights.sum())
+
+    def to_sketch(self):
+        return {
+            "compression": self._compression,
+            "means": self._means.tolist(),
+            "weights": self._weights.tolist(),
+            "minimum": self._minimum,
+            "maximum": self._maximum,
+        }
+
+    @classmethod
+    def from_sketch(cls, sketch):
+        return cls(**sketch)
+
+    def _update_min_max(self, minimum, maximum):
+        self._minimum = (
+            minimum if self._minimum is None else min(self._minimum, minimum)
+        )
+        self._maximum = (
+            maximum if self._maximum is None else max(self._maximum, maximum)
+        )
+
+    def _compress(self, means, weights):
+        order = np.argsort(means)
+        means, weights = means[order], weights[order]
+        q_left = (np.cumsum(weights) - weights) / weights.sum()
+        # k1 scale function, adjacent centroids falling into the same unit of k are
+        # merged, which keeps the tails more accurate than the center
+        k = np.floor(
+            self._compression
+            / (2 * math.pi)
+            * np.arcsin(np.clip(2 * q_left - 1, -1, 1))
+        )
+        starts = np.flatnonzero(np.concatenate([[True], k[1:] != k[:-1]]))
+        self._weights = np.add.reduceat(weights, starts)
+        self._means = np.add.reduceat(means * weights, starts) / self._weights
+
+
+class HyperLogLog:
+    """Mergeable approximate distinct counter."""
+
+    PRECISION = 14
+
+    def __init__(self, registers=None):
+        self._registers = (
+            np.asarray(registers, dtype="uint8")
+            if registers is not None
+            else np.zeros(1 << self.PRECISION, dtype="uint8")
+        )
+
+    def update(self, values):
+        if len(values) == 0:
+            return
+        hashes = self._hash(values)
+        index = (hashes >> np.uint64(64 - self.PRECISION)).astype("int64")
+        remainder = hashes & np.uint64((1 << (64 - self.PRECISION)) - 1)
+        rank = (64 - self.PRECISION) - self._bit_length(remainder) + 1
+        # maximum rank per register, without an unbuffered np.maximum.at
+        seen = np.zeros((len(self._registers), 64), dtype=bool)
+        seen[index, rank.astype("int64")] = True
+        updated = seen.any(axis=1)
+        max_rank = 63 - np.argmax(seen[:, ::-1], axis=1)
+        self._registers[updated] = np.maximum(
+            self._registers[updated], max_rank[updated].astype("uint8")
+        )
+
+    def merge(self, other):
+        np.maximum(self._registers, other._registers, out=self._registers)
+
+    def to_sketch(self):
+        # registers hold small ranks and are mostly zero for low cardinalities
+        return base64.b64encode(zlib.compress(self._registers.tobytes())).decode(
+            "ascii"
+        )
+
+    @classmethod
+    def from_sketch(cls, sketch):
+        return cls(
+            np.frombuffer(
+                zlib.decompress(base64.b64decode(sketch)), dtype="uint8"
+            ).copy()
+        )
+
+    def estimate(self):
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = (
+            alpha * m * m / np.sum(np.power(2.0, -self._registers.astype("float64")))
+        )
+        zeros = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * m and zeros > 0:
+            # linear counting for small cardinalities
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    @staticmethod
+    def _hash(values):
+        values = np.asarray(values)
+        if values.dtype.kind in "biu":
+            # hash the integer itself, float64 can't represent integers above 2**53
+            return pd.util.hash_array(values.astype("int64"))
+        if values.dtype.kind == "f":
+            # integral floats hash like the same integer, regardless of the dtype
+            values = values.astype("float64")
+            integral = (
+                np.isfinite(values)
+                & (np.floor(values) == values)
+                & (np.abs(values) < 2.0**63)
+            )
+            hashes = np.empty(len(values), dtype="uint64")
+            hashes[integral] = pd.util.hash_array(values[integral].astype("int64"))
+            hashes[~integral] = pd.util.hash_array(values[~integral])
+            return hashes
+        if values.dtype.kind == "M":
+            values = values.view("int64")
+        return pd.util.hash_array(values)
+
+    @staticmethod
+    def _bit_length(values):
+        high = (values >> np.uint64(32)).astype("float64")
+        low = (values & np.uint64(0xFFFFFFFF)).astype("float64")
+        return np.where(high > 0, np.frexp(high)[1] + 32, np.frexp(low)[1])
+
+
+class ColumnStatistics:
+    """Statistics of a single column, which can be updated with new chunks of data
+    and merged with the statistics of other chunks."""
+
+    NUMERIC_TYPES = ["Integral", "Fractional"]
+    # upper bound of exact value counts kept in serialized sketches
+    MAX_SKETCH_VALUE_COUNTS = 10000
+
+    def __init__(self, data_type, histogram_threshold, exact_uniqueness):
+        self._data_type = data_type
+        self._histogram_threshold = histogram_threshold
+        self._exact_uniqueness = exact_uniqueness
+        self._num_records = 0
+        self._num_non_null = 0
+        self._sum = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._digest = TDigest()
+        self._hll = HyperLogLog()
+        # exact value counts are only kept while they are needed, that is for
+        # exact uniqueness, or as long as the column qualifies for a histogram
+        self._value_counts = pd.Series(dtype="int64")
+
+    @staticmethod
+    def infer_data_type(dtype):
+        if pd.api.types.is_bool_dtype(dtype):
+            return "Boolean"
+        if pd.api.types.is_integer_dtype(dtype):
+            return "Integral"
+        if pd.api.types.is_float_dtype(dtype):
+            return "Fractional"
+        if (
+            pd.api.types.is_object_dtype(dtype)
+            or pd.api.types.is_string_dtype(dtype)
+            or isinstance(dtype, pd.CategoricalDtype)
+        ):
+            return "String"
+        return "Unknown"
+
+    def update(self, column):
+        self._num_records += len(column)
+        values = column.dropna()
+        try:
+            self._update_distinct_values(values)
+        except TypeError:
+            # unhashable values, such as lists, are profiled by their string representation
+            self._update_distinct_values(values.astype(str))
+
+        if self._data_type not in self.NUMERIC_TYPES or len(values) == 0:
+            self._num_non_null += len(values)
+            return
+
+        values = values.to_numpy(dtype="float64")
+        chunk_mean = values.mean()
+        self._merge_moments(
+            len(values), chunk_mean, float(np.sum((values - chunk_mean) ** 2))
+        )
+        self._sum += float(values.sum())
+        self._digest.update(values)
+
+    def merge(self, other):
+        self._num_records += other._num_records
+        self._hll.merge(other._hll)
+        self._update_value_counts(other._value_counts)
+        self._sum += other._sum
+        self._digest.merge(other._digest)
+        if other._num_non_null > 0:
+            self._merge_moments(other._num_non_null, other._mean, other._m2)
+
+    def to_sketch(self):
+        value_counts = None
+        if (
+            self._value_counts is not None
+            and len(self._value_counts) <= self.MAX_SKETCH_VALUE_COUNTS
+            and pd.api.types.infer_dtype(self._value_counts.index)
+            in [
+                "integer",
+                "floating",
+                "mixed-integer-float",
+                "string",
+                "boolean",
+                "empty",
+            ]
+        ):
+            # only keep values which survive the json round trip unchanged
+            value_counts = [
+                [value, int(count)]
+                for value, count in zip(
+                    self._value_counts.index.tolist(), self._value_counts.tolist()
+                )
+            ]
+        return {
+            "dataType": self._data_type,
+            "numRecords": self._num_records,
+            "numRecordsNonNull": self._num_non_null,
+            "sum": self._sum,
+            "mean": self._mean,
+            "m2": self._m2,
+            "digest": self._digest.to_sketch(),
+            "hll": self._hll.to_sketch(),
+            "valueCounts": value_counts,
+        }
+
+    @classmethod
+    def from_sketch(cls, sketch, histogram_threshold, exact_uniqueness):
+        stats = cls(sketch["dataType"], histogram_threshold, exact_uniqueness)
+        stats._num_records = sketch["numRecords"]
+        stats._num_non_null = sketch["numRecordsNonNull"]
+        stats._sum = sketch["sum"]
+        stats._mean = sketch["mean"]
+        stats._m2 = sketch["m2"]
+        stats._digest = TDigest.from_sketch(sketch["digest"])
+        stats._hll = HyperLogLog.from_sketch(sketch["hll"])
+        if sketch["valueCounts"] is None:
+            stats._value_counts = None
+        elif sketch["valueCounts"]:
+            values, counts = zip(*sketch["valueCounts"])
+            stats._value_counts = pd.Series(counts, index=list(values), dtype="int64")
+        return stats
+
+    def to_dict(self, column_name, correlations=None):
+        stats = {
+            "column": column_name,
+            "dataType": self._data_type,
+            "isDataTypeInferred": "false",
+            "completeness": (
+                self._num_non_null / self._num_records if self._num_records else 0.0
+            ),
+            "numRecordsNonNull": self._num_non_null,
+            "numRecordsNull": self._num_records - self._num_non_null,
+            "approximateNumDistinctValues": self._hll.estimate(),
+        }
+        if self._data_type in self.NUMERIC_TYPES and self._num_non_null > 0:
+            stats["mean"] = self._mean
+            stats["maximum"] = float(self._digest._maximum)
+            stats["minimum"] = float(self._digest._minimum)
+            stats["sum"] = self._sum
+            # population standard deviation, same as Deequ
+            stats["stdDev"] = math.sqrt(self._m2 / self._num_non_null)
+            stats["approxPercentiles"] = self._digest.quantiles(np.arange(1, 101) / 100)
+        if (
+            self._exact_uniqueness
+            and self._value_counts is not None
+            and self._num_records > 0
+        ):
+            counts = self._value_counts.to_numpy(dtype="float64")
+            frequencies = counts / self._num_records
+            stats["distinctness"] = len(counts) / self._num_records
+            stats["entropy"] = float(-np.sum(frequencies * np.log(frequencies)))
+            stats["uniqueness"] = int(np.count_nonzero(counts == 1)) / self._num_records
+            stats["exactNumDistinctValues"] = len(counts)
+        if (
+            self._histogram_threshold
+            and self._value_counts is not None
+            and len(self._value_counts) <= self._histogram_threshold
+        ):
+            stats["histogram"] = self._histogram()
+        if correlations is not None:
+            stats["correlations"] = correlations
+        return stats
+
+    def _merge_moments(self, count, mean, m2):
+        # parallel variant of Welford's algorithm
+        total = self._num_non_null + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta**2 * self._num_non_null * count / total
+        self._num_non_null = total
+
+    def _update_distinct_values(self, values):
+        if self._value_counts is None:
+            self._hll.update(values.to_numpy())
+        else:
+            value_counts = values.value_counts(sort=False)
+            # only the distinct values of the chunk need to be hashed
+            self._hll.update(value_counts.index.to_numpy())
+            self._update_value_counts(value_counts)
+
+    def _update_value_counts(self, value_counts):
+        if self._value_counts is None or value_counts is None:
+            self._value_counts = None
+            return
+        self._value_counts = self._value_counts.add(value_counts, fill_value=0)
+        if (
+            not self._exact_uniqueness
+            and len(self._value_counts) > self._histogram_threshold
+        ):
+            self._value_counts = None
+
+    def _histogram(self):
+        histogram = [
+            {
+                "value": str(value),
+                "count": int(count),
+                "ratio": count / self._num_records,
+            }
+            for value, count in self._value_counts.items()
+        ]
+        num_nulls = self._num_records - self._num_non_null
+        if num_nulls > 0:
+            histogram.append(
+                {
+                    "value": "NullValue",
+                    "count": num_nulls,
+                    "ratio": num_nulls / self._num_records,
+                }
+            )
+        return histogram
+
+
+class ColumnProfiler:
+    """Single pass profiler for pandas dataframes, producing Deequ compatible statistics.
+
+    Dataframes are processed in chunks of `chunk_size` rows, each chunk updates
+    sketches (quantiles, distinct values) and moment accumulators, such that the
+    additional memory needed is bounded by the chunk size. Exact value counts are only
+    kept for exact uniqueness and for histograms of low cardinality columns. With
+    exact uniqueness, the count of every distinct value is kept, the memory needed
+    therefore grows with the number of distinct values and is not bounded.
+    """
+
+    # same limits as used by the Spark engine for Deequ
+    HISTOGRAM_THRESHOLD = 20
+    MAX_CORRELATION_COLUMNS = 100
+    DEFAULT_CHUNK_SIZE = 1000000
+
+    def __init__(
+        self,
+        relevant_columns=None,
+        correlations=True,
+        histograms=True,
+        exact_uniqueness=True,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+    ):
+        self._relevant_columns = relevant_columns
+        self._correlations = correlations
+        self._histograms = histograms
+        self._exact_uniqueness = exact_uniqueness
+        self._chunk_size = chunk_size
+        self._columns = {}
+        self._correlation_columns = None
+        self._co_moments = None
+
+    def update(self, df):
+        if self._relevant_columns:
+            df = df[[col for col in df.columns if col in self._relevant_columns]]
+        for col in df.columns:
+            if col not in self._columns:
+                self._columns[col] = ColumnStatistics(
+                    ColumnStatistics.infer_data_type(df[col].dtype),
+                    self.HISTOGRAM_THRESHOLD if self._histograms else 0,
+                    self._exact_uniqueness,
+                )
+        if self._correlations and self._correlation_columns is None:
+            self._correlation_columns = [
+                col
+                for col, stats in self._columns.items()
+                if stats._data_type in ColumnStatistics.NUMERIC_TYPES
+            ][: self.MAX_CORRELATION_COLUMNS]
+
+        for start in range(0, len(df), self._chunk_size):
+            chunk = df.iloc[start : start + self._chunk_size]
+            for col in chunk.columns:
+                self._columns[col].update(chunk[col])
+            if self._correlation_columns:
+                self._update_co_moments(chunk[self._correlation_columns])
+        return self
+
+    def merge(self, other):
+        for col, stats in other._columns.items():
+            if col in self._columns:
+                self._columns[col].merge(stats)
+            else:
+                self._columns[col] = stats
+        if self._correlation_columns is None:
+            self._correlation_columns = other._correlation_columns
+            self._co_moments = other._co_moments
+        elif other._correlation_columns is not None:
+            if self._correlation_columns == other._correlation_columns:
+                if self._co_moments is None:
+                    self._co_moments = other._co_moments
+                elif other._co_moments is not None:
+                    self._co_moments = self._co_moments + other._co_moments
+            else:
+                # co-moments of different column sets can't be combined
+                self._correlation_columns = []
+                self._co_moments = None
+        return self
+
+    def to_json(self, include_sketches=False):
+        final_stats = []
+        for col, stats in self._columns.items():
+            final_stats.append(
+                stats.to_dict(col.split(".")[-1], self._column_correlations(col))
+            )
+        content = {"columns": final_stats}
+        if include_sketches:
+            content["sketches"] = self.compress_sketches(self.to_sketches())
+        return json.dumps(content)
+
+    def to_sketches(self):
+        """Serializable state of the profiler, which can be merged with the state of
+        profilers of other batches of data."""
+        return {
+            "columns": {col: stats.to_sketch() for col, stats in self._columns.items()},
+            "correlationColumns": self._correlation_columns,
+            "coMoments": (
+                self._co_moments.tolist() if self._co_moments is not None else None
+            ),
+        }
+
+    @staticmethod
+    def compress_sketches(sketches):
+        """Compress the sketches to a base64 string, such that they don't bloat the
+        statistics content they are stored with."""
+        return base64.b64encode(
+            zlib.compress(json.dumps(sketches).encode("utf-8"))
+        ).decode("ascii")
+
+    @staticmethod
+    def decompress_sketches(sketches):
+        return json.loads(zlib.decompress(base64.b64decode(sketches)))
+
+    @classmethod
+    def from_sketches(
+        cls,
+        sketches,
+        relevant_columns=None,
+        correlations=True,
+        histograms=True,
+        exact_uniqueness=True,
+    ):
+        if isinstance(sketches, str):
+            sketches = cls.decompress_sketches(sketches)
+        profiler = cls(relevant_columns, correlations, histograms, exact_uniqueness)
+        profiler._columns = {
+            col: ColumnStatistics.from_sketch(
+                sketch,
+                cls.HISTOGRAM_THRESHOLD if histograms else 0,
+                exact_uniqueness,
+            )
+            for col, sketch in sketches["columns"].items()
+        }
+        if correlations:
+            profiler._correlation_columns = sketches["correlationColumns"]
+            if sketches["coMoments"] is not None:
+                profiler._co_moments = np.array(sketches["coMoments"], dtype="float64")
+        return profiler
+
+    def _update_co_moments(self, chunk):
+        values = chunk.to_numpy(dtype="float64", na_value=np.nan)
+        mask = (~np.isnan(values)).astype("float64")
+        values = np.nan_to_num(values)
+        # sums over the rows in which both columns are not null
+        co_moments = np.stack(
+            [
+                mask.T @ mask,
+                values.T @ mask,
+                (values**2).T @ mask,
+                values.T @ values,
+            ]
+        )
+        if self._co_moments is None:
+            self._co_moments = co_moments
+        else:
+            self._co_moments += co_moments
+
+    def _column_correlations(self, col):
+        if (
+            not self._correlation_columns
+            or col not in self._correlation_columns
+            # no rows were profiled
+            or self._co_moments is None
+        ):
+            return None
+        i = self._correlation_columns.index(col)
+        count, sums, squares, products = self._co_moments
+        correlations = []
+        for j, other in enumerate(self._correlation_columns):
+            # sums[i, j] is the sum of column i over rows in which column j is set
+            covariance = count[i, j] * products[i, j] - sums[i, j] * sums[j, i]
+            variance = (count[i, j] * squares[i, j] - sums[i, j] ** 2) * (
+                count[i, j] * squares[j, i] - sums[j, i] ** 2
+            )
+            correlations.append(
+                {
+                    "column": other.split(".")[-1],
+                    "correlation": (
+                        float(covariance / math.sqrt(variance))
+                        if variance > 0
+                        else None
+                    ),
+                }
+            )
+        return correlations
@@ -0,0 +1,114 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+
+class EncodingDictionary(Mapping):
+    """Mapping of the categories of a label encoded feature to their index.
+
+    The categories are kept in a pandas Index, which stores them in a single array and
+    only builds its hash table on the first lookup. Lookups of single values, as done
+    when serving, and of whole columns with `encode` are O(1) per value. Dictionaries
+    built from the same statistics are shared, such that serving and batch scoring of
+    a feature view only build them once.
+    """
+
+    CACHE_MAX_SIZE = 32
+
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    def __init__(self, categories, feature_name=None):
+        self._categories = pd.Index(categories, tupleize_cols=False)
+        self._feature_name = feature_name
+
+    @classmethod
+    def from_unique_values(cls, unique_values, feature_name=None):
+        # the statistics object owning the list outlives the lookup, so its identity
+        # is a stable key, the entry keeps a reference to prevent its reuse
+        key = (id(unique_values), feature_name)
+        with cls._cache_lock:
+            if key in cls._cache:
+                cls._cache.move_to_end(key)
+                return cls._cache[key][1]
+        dictionary = cls(unique_values, feature_name)
+        with cls._cache_lock:
+            cls._cache[key] = (unique_values, dictionary)
+            while len(cls._cache) > cls.CACHE_MAX_SIZE:
+                cls._cache.popitem(last=False)
+        return dictionary
+
+    def encode(self, values):
+        """Encode a pandas Series or array of categories at once.
+
+        # Raises
+            `KeyError`. If any of the values is not a known category.
+        """
+        indexer = self._categories.get_indexer(values)
+        unseen = indexer == -1
+        if unseen.any():
+            self._raise_unseen(pd.unique(np.asarray(values, dtype="object")[unseen]))
+        if isinstance(values, pd.Series):
+            return pd.Series(indexer, index=values.index, name=values.name)
+        return indexer
+
+    def __getitem__(self, value):
+        try:
+            index = self._categories.get_loc(value)
+        except (KeyError, TypeError):
+            self._raise_unseen([value])
+        if not isinstance(index, (int, np.integer)):
+            # get_loc returns a mask or slice for unhashable or ambiguous values
+            self._raise_unseen([value])
+        return int(index)
+
+    def __contains__(self, value):
+        try:
+            return value in self._categories
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return iter(self._categories)
+
+    def __len__(self):
+        return len(self._categories)
+
+    def keys(self):
+        return self._categories.tolist()
+
+    def values(self):
+        return list(range(len(self._categories)))
+
+    def items(self):
+        return zip(self._categories.tolist(), range(len(self._categories)))
+
+    def _raise_unseen(self, values):
+        raise KeyError(
+            "Values {} of feature '{}' were not seen when the statistics of the label "
+            "encoder were computed.".format(list(values), self._feature_name)
+        )
+
+    @classmethod
+    def invalidate_cache(cls):
+        with cls._cache_lock:
+            cls._cache.clear()
@@ -16,7 +16,7 @@
 
 from hsfs import client
 from hsfs import feature_group, feature_group_commit
-from hsfs.core import ingestion_job
+from hsfs.core import ingestion_job, metadata_cache
 
 from hsfs.core import explicit_provenance
 
@@ -47,6 +47,7 @@ class FeatureGroupApi:
             "featuregroups",
         ]
         headers = {"content-type": "application/json"}
+        self._invalidate_cache(feature_group_instance)
         return feature_group_instance.update_from_response_json(
             _client._send_request(
                 "POST",
@@ -77,8 +78,18 @@ class FeatureGroupApi:
             "featuregroups",
             name,
         ]
-        query_params = None if version is None else {"version": version}
-        json_list = _client._send_request("GET", path_params, query_params)
+        if version is None:
+            # the list of versions grows with every new version, it is not cached
+            json_list = _client._send_request("GET", path_params)
+        else:
+            json_list = metadata_cache.get_instance().send_request(
+                metadata_cache.FEATURE_GROUP,
+                self._feature_store_id,
+                name,
+                version,
+                path_params,
+                {"version": version},
+            )
 
         if fg_type == self.CACHED:
             fg_list = feature_group.FeatureGroup.from_response_json(json_list)
@@ -133,6 +144,11 @@ class FeatureGroupApi:
             feature_group_instance.id,
         ]
         _client._send_request("DELETE", path_params)
+        self._invalidate_cache(feature_group_instance)
+        # links of other entities to the deleted feature group are outdated
+        metadata_cache.get_instance().invalidate(
+            metadata_cache.PROVENANCE, self._feature_store_id
+        )
 
     def update_metadata(
         self,
@@ -170,6 +186,7 @@ class FeatureGroupApi:
         ]
         headers = {"content-type": "application/json"}
         query_params = {query_parameter: query_parameter_value}
+        self._invalidate_cache(feature_group_instance)
         return feature_group_instance.update_from_response_json(
             _client._send_request(
                 "PUT",
@@ -298,7 +315,14 @@ class FeatureGroupApi:
             "upstreamLvls": 1,
             "downstreamLvls": 0,
         }
-        links_json = _client._send_request("GET", path_params, query_params)
+        links_json = metadata_cache.get_instance().send_request(
+            metadata_cache.PROVENANCE,
+            self._feature_store_id,
+            feature_group_instance.name,
+            feature_group_instance.version,
+            path_params,
+            query_params,
+        )
         return explicit_provenance.Links.from_response_json(
             links_json,
             explicit_provenance.Links.Direction.UPSTREAM,
@@ -378,3 +402,11 @@ class FeatureGroupApi:
             explicit_provenance.Links.Direction.DOWNSTREAM,
             explicit_provenance.Links.Type.FEATURE_GROUP,
         )
+
+    def _invalidate_cache(self, feature_group_instance):
+        metadata_cache.get_instance().invalidate(
+            metadata_cache.FEATURE_GROUP,
+            self._feature_store_id,
+            feature_group_instance.name,
+            feature_group_instance.version,
+        )
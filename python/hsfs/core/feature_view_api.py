@@ -20,7 +20,7 @@ from hsfs import (
     transformation_function_attached,
     training_dataset,
 )
-from hsfs.core import job
+from hsfs.core import job, metadata_cache
 from hsfs.constructor import serving_prepared_statement, query
 from hsfs.client.exceptions import RestAPIError
 
@@ -56,6 +56,7 @@ class FeatureViewApi:
 
     def post(self, feature_view_obj):
         headers = {"content-type": "application/json"}
+        self._invalidate_cache(feature_view_obj.name, feature_view_obj.version)
         return feature_view_obj.update_from_response_json(
             self._client._send_request(
                 self._POST,
@@ -67,6 +68,7 @@ class FeatureViewApi:
 
     def update(self, feature_view_obj):
         headers = {"content-type": "application/json"}
+        self._invalidate_cache(feature_view_obj.name, feature_view_obj.version)
         self._client._send_request(
             self._PUT,
             self._base_path
@@ -98,8 +100,13 @@ class FeatureViewApi:
         path = self._base_path + [name, self._VERSION, version]
         try:
             return feature_view.FeatureView.from_response_json(
-                self._client._send_request(
-                    self._GET, path, {"expand": ["query", "features"]}
+                metadata_cache.get_instance().send_request(
+                    metadata_cache.FEATURE_VIEW,
+                    self._feature_store_id,
+                    name,
+                    version,
+                    path,
+                    {"expand": ["query", "features"]},
                 )
             )
         except RestAPIError as e:
@@ -115,10 +122,12 @@ class FeatureViewApi:
     def delete_by_name(self, name):
         path = self._base_path + [name]
         self._client._send_request(self._DELETE, path)
+        self._invalidate_cache(name)
 
     def delete_by_name_version(self, name, version):
         path = self._base_path + [name, self._VERSION, version]
         self._client._send_request(self._DELETE, path)
+        self._invalidate_cache(name, version)
 
     def get_batch_query(
         self,
@@ -158,16 +167,28 @@ class FeatureViewApi:
             version,
             self._PREPARED_STATEMENT,
         ]
-        headers = {"content-type": "application/json"}
-        query_params = {"batch": batch}
         return serving_prepared_statement.ServingPreparedStatement.from_response_json(
-            self._client._send_request("GET", path, query_params, headers=headers)
+            metadata_cache.get_instance().send_request(
+                metadata_cache.FEATURE_VIEW,
+                self._feature_store_id,
+                name,
+                version,
+                path,
+                {"batch": batch},
+            )
         )
 
     def get_attached_transformation_fn(self, name, version):
         path = self._base_path + [name, self._VERSION, version, self._TRANSFORMATION]
         return transformation_function_attached.TransformationFunctionAttached.from_response_json(
-            self._client._send_request("GET", path)
+            metadata_cache.get_instance().send_request(
+                metadata_cache.FEATURE_VIEW,
+                self._feature_store_id,
+                name,
+                version,
+                path,
+                None,
+            )
         )
 
     def create_training_dataset(self, name, version, training_dataset_obj):
@@ -251,7 +272,6 @@ class FeatureViewApi:
             `ExplicitProvenance.Links`: the feature groups used to generated this
             feature view
         """
-        _client = client.get_instance()
         path_params = self._base_path + [
             name,
             self._VERSION,
@@ -264,9 +284,24 @@ class FeatureViewApi:
             "upstreamLvls": 1,
             "downstreamLvls": 0,
         }
-        links_json = _client._send_request("GET", path_params, query_params)
+        links_json = metadata_cache.get_instance().send_request(
+            metadata_cache.PROVENANCE,
+            self._feature_store_id,
+            name,
+            version,
+            path_params,
+            query_params,
+        )
         return explicit_provenance.Links.from_response_json(
             links_json,
             explicit_provenance.Links.Direction.UPSTREAM,
             explicit_provenance.Links.Type.FEATURE_GROUP,
         )
+
+    def _invalidate_cache(self, name, version=None):
+        metadata_cache.get_instance().invalidate(
+            metadata_cache.FEATURE_VIEW, self._feature_store_id, name, version
+        )
+        metadata_cache.get_instance().invalidate(
+            metadata_cache.PROVENANCE, self._feature_store_id, name, version
+        )
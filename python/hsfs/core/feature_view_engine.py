@@ -15,6 +15,8 @@
 #
 
 import datetime
+import json
+import os
 import warnings
 from hsfs import engine, training_dataset_feature, client, util, feature_group
 from hsfs.client import exceptions
@@ -61,6 +63,7 @@ class FeatureViewEngine:
             feature_store_id
         )
         self._query_constructor_api = query_constructor_api.QueryConstructorApi()
+        self._pending_batch_checkpoint = None
 
     def save(self, feature_view_obj):
         if feature_view_obj.query.is_time_travel():
@@ -306,6 +309,64 @@ class FeatureViewEngine:
             )
             return td_updated, split_df
 
+    def get_training_data_iterator(
+        self,
+        feature_view_obj,
+        training_dataset_version,
+        split=None,
+        batch_size=1024,
+        shuffle_buffer=0,
+        columns=None,
+        dataframe_type="numpy",
+        rank=0,
+        world_size=1,
+        seed=None,
+        prefetch=2,
+        read_options=None,
+    ):
+        # pyarrow is only installed with the python extras
+        from hsfs.core import training_data_iterator
+
+        td = self._get_training_data_metadata(
+            feature_view_obj, training_dataset_version
+        )
+        if td.training_dataset_type == td.IN_MEMORY:
+            raise FeatureStoreException(
+                "Training dataset version {} is not materialized, create it with "
+                "`feature_view.create_training_data` to iterate over it.".format(
+                    td.version
+                )
+            )
+        if td.data_format != "parquet":
+            raise FeatureStoreException(
+                "Only training datasets in parquet format can be iterated over, "
+                "training dataset version {} is in {} format.".format(
+                    td.version, td.data_format
+                )
+            )
+        split_names = [td_split.name for td_split in td.splits]
+        if split_names and split not in split_names:
+            raise ValueError(
+                "Training dataset version {} has splits {}, select one of them with "
+                "`split`.".format(td.version, split_names)
+            )
+        path = td.location + "/" + (split if split_names else td.name)
+
+        return training_data_iterator.TrainingDataIterator(
+            engine.get_instance().get_file_openers(
+                td.storage_connector, path, read_options or {}
+            ),
+            batch_size,
+            columns=columns,
+            labels=feature_view_obj.labels,
+            shuffle_buffer=shuffle_buffer,
+            seed=seed,
+            rank=rank,
+            world_size=world_size,
+            prefetch=prefetch,
+            dataframe_type=dataframe_type,
+        )
+
     def _set_event_time(self, feature_view_obj, training_dataset_obj):
         event_time = feature_view_obj.query._left_feature_group.event_time
         if event_time:
@@ -526,17 +587,37 @@ class FeatureViewEngine:
         transformation_functions,
         read_options=None,
         spine=None,
+        since_commit=None,
     ):
         self._check_feature_group_accessibility(feature_view_obj)
 
-        feature_dataframe = self.get_batch_query(
+        read_options = dict(read_options or {})
+        checkpoint_path = read_options.pop("checkpoint_path", None)
+        if since_commit is None and checkpoint_path is not None:
+            since_commit = self._read_batch_checkpoint(checkpoint_path)
+
+        query = self.get_batch_query(
             feature_view_obj,
             start_time,
             end_time,
             with_label=False,
             training_dataset_version=training_dataset_version,
             spine=spine,
-        ).read(read_options=read_options)
+        )
+        last_commit = None
+        if since_commit is not None or checkpoint_path is not None:
+            last_commit = self._set_incremental_commits(query, since_commit)
+
+        feature_dataframe = query.read(read_options=read_options)
+
+        # the checkpoint is only advanced by `commit_batch_checkpoint` once the batch
+        # was consumed, otherwise the commits of a failed batch would be skipped
+        self._pending_batch_checkpoint = (
+            (checkpoint_path, last_commit)
+            if checkpoint_path is not None and last_commit is not None
+            else None
+        )
+
         if transformation_functions:
             return engine.get_instance()._apply_transformation_function(
                 transformation_functions, dataset=feature_dataframe
@@ -544,6 +625,61 @@ class FeatureViewEngine:
         else:
             return feature_dataframe
 
+    @staticmethod
+    def _set_incremental_commits(query, since_commit):
+        """Restrict the left feature group of the query to the commits after `since_commit`.
+
+        The feature groups joined to the left feature group are read in their latest
+        state. The commits are read up to the latest commit of the left feature group,
+        whose time is returned to continue from in the next batch.
+        """
+        left_feature_group = query._left_feature_group
+        if (
+            isinstance(left_feature_group, feature_group.SpineGroup)
+            or left_feature_group.time_travel_format is None
+            or left_feature_group.time_travel_format.upper() != "HUDI"
+        ):
+            raise FeatureStoreException(
+                "Incremental batch data can only be read if the left feature group of "
+                "the feature view is a time travel enabled feature group."
+            )
+
+        commits = left_feature_group.commit_details(limit=1)
+        last_commit = max(commits) if commits else None
+        since_timestamp = util.convert_event_time_to_timestamp(since_commit)
+        if last_commit is None:
+            # nothing was committed yet, the next batch starts from the beginning
+            return since_timestamp
+
+        query.left_feature_group_start_time = since_timestamp
+        query.left_feature_group_end_time = last_commit
+        return last_commit
+
+    def commit_batch_checkpoint(self):
+        if self._pending_batch_checkpoint is None:
+            raise FeatureStoreException(
+                "There is no batch checkpoint to commit. Read batch data with the "
+                "`checkpoint_path` read option before committing the checkpoint."
+            )
+        self._write_batch_checkpoint(*self._pending_batch_checkpoint)
+        self._pending_batch_checkpoint = None
+
+    @staticmethod
+    def _read_batch_checkpoint(checkpoint_path):
+        if not os.path.exists(checkpoint_path):
+            return None
+        with open(checkpoint_path, "r") as checkpoint_file:
+            return json.load(checkpoint_file)["commit_time"]
+
+    @staticmethod
+    def _write_batch_checkpoint(checkpoint_path, commit_time):
+        # replace the checkpoint atomically, such that a failure while writing does
+        # not lose the previous checkpoint
+        tmp_path = checkpoint_path + ".tmp"
+        with open(tmp_path, "w") as checkpoint_file:
+            json.dump({"commit_time": commit_time}, checkpoint_file)
+        os.replace(tmp_path, checkpoint_path)
+
     def add_tag(
         self, feature_view_obj, name: str, value, training_dataset_version=None
     ):
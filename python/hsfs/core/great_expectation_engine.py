@@ -16,8 +16,7 @@
 
 from hsfs import engine, validation_report
 from hsfs import expectation_suite as es
-from typing import Dict, Any, Optional, Union
-import great_expectations as ge
+from typing import Dict, Any, Optional, Union, TypeVar
 
 
 class GreatExpectationEngine:
@@ -36,14 +35,14 @@ class GreatExpectationEngine:
         feature_group,
         dataframe,
         expectation_suite: Union[
-            ge.core.ExpectationSuite, es.ExpectationSuite, None
+            TypeVar("ge.core.ExpectationSuite"), es.ExpectationSuite, None
         ] = None,
         save_report: bool = False,
         validation_options: Dict[str, Any] = {},
         ge_type: bool = True,
         ingestion_result: str = "UNKNOWN",
     ) -> Union[
-        ge.core.ExpectationSuiteValidationResult,
+        TypeVar("ge.core.ExpectationSuiteValidationResult"),
         validation_report.ValidationReport,
         None,
     ]:
@@ -86,7 +85,7 @@ class GreatExpectationEngine:
         self,
         feature_group,
         expectation_suite: Union[
-            ge.core.ExpectationSuite, es.ExpectationSuite, None
+            TypeVar("ge.core.ExpectationSuite"), es.ExpectationSuite, None
         ] = None,
         validation_options: dict = {},
     ) -> Optional[es.ExpectationSuite]:
@@ -117,13 +116,14 @@ class GreatExpectationEngine:
     def save_or_convert_report(
         self,
         feature_group,
-        report: ge.core.ExpectationSuiteValidationResult,
+        report: TypeVar("ge.core.ExpectationSuiteValidationResult"),
         save_report: bool,
         ge_type: bool,
         validation_options: Dict[str, Any],
         ingestion_result: str = "UNKNOWN",
     ) -> Union[
-        ge.core.ExpectationSuiteValidationResult, validation_report.ValidationReport
+        TypeVar("ge.core.ExpectationSuiteValidationResult"),
+        validation_report.ValidationReport,
     ]:
         save_report = validation_options.get("save_report", save_report)
         if save_report:
@@ -14,10 +14,16 @@
 #   limitations under the License.
 #
 
+import logging
+import math
+
 from hsfs import feature_group_commit, util
 from hsfs.core import feature_group_api
 
 
+_logger = logging.getLogger(__name__)
+
+
 class HudiEngine:
     HUDI_SPARK_FORMAT = "org.apache.hudi"
     HUDI_TABLE_NAME = "hoodie.table.name"
@@ -64,6 +70,18 @@ class HudiEngine:
         "hoodie.insert.shuffle.parallelism": "5",
         "hoodie.upsert.shuffle.parallelism": "5",
     }
+    HUDI_BULK_INSERT_SORT_MODE = "hoodie.bulkinsert.sort.mode"
+    HUDI_PARQUET_MAX_FILE_SIZE = "hoodie.parquet.max.file.size"
+    HUDI_PARQUET_SMALL_FILE_LIMIT = "hoodie.parquet.small.file.limit"
+    HUDI_TARGET_FILE_SIZE = 128 * 1024 * 1024
+    HUDI_SMALL_FILE_LIMIT = 100 * 1024 * 1024
+    # write option to disable the tuning of the parallelism and file sizes
+    HUDI_AUTO_TUNING = "hudi_auto_tuning"
+    HUDI_TUNED_OPTIONS = list(HUDI_DEFAULT_PARALLELISM) + [
+        HUDI_BULK_INSERT_SORT_MODE,
+        HUDI_PARQUET_MAX_FILE_SIZE,
+        HUDI_PARQUET_SMALL_FILE_LIMIT,
+    ]
 
     def __init__(
         self,
@@ -88,7 +106,10 @@ class HudiEngine:
             dataset, save_mode, operation, write_options
         )
         fg_commit.validation_id = validation_id
-        return self._feature_group_api.commit(self._feature_group, fg_commit)
+        fg_commit = self._feature_group_api.commit(self._feature_group, fg_commit)
+        # exposes the tuned options of the write to the user
+        self._feature_group._last_commit = fg_commit
+        return fg_commit
 
     def delete_record(self, delete_df, write_options):
         write_options[self.PAYLOAD_CLASS_OPT_KEY] = self.PAYLOAD_CLASS_OPT_VAL
@@ -107,7 +128,9 @@ class HudiEngine:
         )
 
     def _write_hudi_dataset(self, dataset, save_mode, operation, write_options):
-        hudi_options = self._setup_hudi_write_opts(operation, write_options)
+        hudi_options = self._setup_hudi_write_opts(
+            operation, write_options, dataset=dataset
+        )
         dataset.write.format(HudiEngine.HUDI_SPARK_FORMAT).options(**hudi_options).mode(
             save_mode
         ).save(self._feature_group.location)
@@ -115,10 +138,21 @@ class HudiEngine:
         feature_group_commit = self._get_last_commit_metadata(
             self._spark_context, self._feature_group.location
         )
+        feature_group_commit.write_options = {
+            key: hudi_options[key]
+            for key in self.HUDI_TUNED_OPTIONS
+            if key in hudi_options
+        }
+        _logger.info(
+            "Wrote commit of feature group %s version %s with options %s",
+            self._feature_group.name,
+            self._feature_group.version,
+            feature_group_commit.write_options,
+        )
 
         return feature_group_commit
 
-    def _setup_hudi_write_opts(self, operation, write_options):
+    def _setup_hudi_write_opts(self, operation, write_options, dataset=None):
         table_name = self._feature_group._get_online_table_name()
 
         primary_key = ",".join(self._feature_group.primary_key)
@@ -162,11 +196,67 @@ class HudiEngine:
         }
         hudi_options.update(HudiEngine.HUDI_DEFAULT_PARALLELISM)
 
-        if write_options:
-            hudi_options.update(write_options)
+        write_options = dict(write_options or {})
+        if write_options.pop(self.HUDI_AUTO_TUNING, True) and dataset is not None:
+            hudi_options.update(self._get_tuned_write_opts(dataset))
+
+        # options provided by the user take precedence over the tuned options
+        hudi_options.update(write_options)
 
         return hudi_options
 
+    def _get_tuned_write_opts(self, dataset):
+        """Tune the shuffle parallelism and file sizes of Hudi to the dataset.
+
+        The parallelism is chosen such that every task writes about one file of the
+        target size, based on the size of the dataset estimated by the Spark
+        optimizer. The estimate is an upper bound which can be far too high, e.g.
+        after filters or joins, so the parallelism is at most the number of input
+        partitions or the default parallelism of the cluster, whichever is larger.
+        The same maximum is used if the size is unknown.
+        """
+        max_parallelism = max(
+            dataset.rdd.getNumPartitions(),
+            self._spark_context.defaultParallelism,
+        )
+        size_in_bytes = self._estimate_size_in_bytes(dataset)
+        if size_in_bytes is not None:
+            parallelism = min(
+                max(math.ceil(size_in_bytes / self.HUDI_TARGET_FILE_SIZE), 1),
+                max_parallelism,
+            )
+        else:
+            parallelism = max_parallelism
+
+        tuned_options = {key: str(parallelism) for key in self.HUDI_DEFAULT_PARALLELISM}
+        tuned_options[self.HUDI_PARQUET_MAX_FILE_SIZE] = str(self.HUDI_TARGET_FILE_SIZE)
+        tuned_options[self.HUDI_PARQUET_SMALL_FILE_LIMIT] = str(
+            self.HUDI_SMALL_FILE_LIMIT
+        )
+        # sorting by partition path avoids that every task writes a small file into
+        # every partition, without partitions the records can be written unsorted
+        tuned_options[self.HUDI_BULK_INSERT_SORT_MODE] = (
+            "GLOBAL_SORT" if self._feature_group.partition_key else "NONE"
+        )
+        return tuned_options
+
+    @staticmethod
+    def _estimate_size_in_bytes(dataset):
+        try:
+            size_in_bytes = int(
+                dataset._jdf.queryExecution()
+                .optimizedPlan()
+                .stats()
+                .sizeInBytes()
+                .toString()
+            )
+        except Exception:
+            return None
+        # spark falls back to the maximum size if it can't estimate the size
+        if size_in_bytes >= 2**63 - 1:
+            return None
+        return size_in_bytes
+
     def _setup_hudi_read_opts(self, hudi_fg_alias, read_options):
         if hudi_fg_alias.left_feature_group_end_timestamp is None and (
             hudi_fg_alias.left_feature_group_start_timestamp is None
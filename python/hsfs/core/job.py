@@ -14,6 +14,10 @@
 #   limitations under the License.
 #
 
+import random
+import time
+from typing import List
+
 import humps
 from hsfs import engine
 from hsfs.client.exceptions import FeatureStoreException
@@ -21,6 +25,10 @@ from hsfs.core import job_api
 
 
 class Job:
+    # seconds between polls of the job executions, doubled after every poll
+    POLL_INITIAL_INTERVAL = 0.5
+    POLL_MAX_INTERVAL = 10
+
     def __init__(
         self,
         id,
@@ -106,6 +114,98 @@ class Job:
         )
         engine.get_instance().wait_for_job(self, await_termination=await_termination)
 
+    def wait_for_completion(self, timeout: float = None):
+        """Wait for the last execution of the job to finish.
+
+        !!! example
+            ```python
+            # start the materialization without waiting
+            job, _ = fg.insert(df, write_options={"wait_for_job": False})
+
+            # ... do other work
+
+            job.wait_for_completion(timeout=3600)
+            ```
+
+        # Arguments
+            timeout: Maximum number of seconds to wait, defaults to `None`, waiting
+                until the job finished.
+
+        # Raises
+            `hsfs.client.exceptions.FeatureStoreException`. If the job failed, was
+                stopped or did not finish within the timeout.
+        """
+        Job.wait_for_jobs([self], timeout=timeout)
+
+    @staticmethod
+    def wait_for_jobs(jobs: List["Job"], timeout: float = None):
+        """Wait for the last executions of the jobs to finish.
+
+        All jobs are polled in one round, and the interval between rounds grows
+        exponentially with jitter, such that short jobs return quickly and long jobs
+        don't load the REST API.
+
+        !!! example
+            ```python
+            from hsfs.core.job import Job
+
+            # start the materialization of several feature groups
+            jobs = [
+                fg.insert(df, write_options={"wait_for_job": False})[0]
+                for fg, df in [(fg1, df1), (fg2, df2)]
+            ]
+
+            Job.wait_for_jobs(jobs, timeout=3600)
+            ```
+
+        # Arguments
+            jobs: Jobs to wait for.
+            timeout: Maximum number of seconds to wait, defaults to `None`, waiting
+                until all jobs finished.
+
+        # Raises
+            `hsfs.client.exceptions.FeatureStoreException`. If a job failed, was
+                stopped or the jobs did not finish within the timeout.
+        """
+        _job_api = job_api.JobApi()
+        pending = list(jobs)
+        interval = Job.POLL_INITIAL_INTERVAL
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            pending = [job for job in pending if not Job._is_terminated(_job_api, job)]
+            if not pending:
+                return
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise FeatureStoreException(
+                    "Timed out after {} seconds waiting for the Hopsworks Jobs {} to "
+                    "finish".format(timeout, [job.name for job in pending])
+                )
+
+            # jitter spreads the requests of many clients waiting at the same time
+            sleep = interval * random.uniform(0.5, 1.0)
+            time.sleep(sleep if remaining is None else min(sleep, remaining))
+            interval = min(interval * 2, Job.POLL_MAX_INTERVAL)
+
+    @staticmethod
+    def _is_terminated(_job_api, job):
+        executions = _job_api.last_execution(job)
+        if len(executions) > 0:
+            execution = executions[0]
+        else:
+            return True
+
+        if execution.final_status.lower() == "succeeded":
+            return True
+        elif execution.final_status.lower() == "failed":
+            raise FeatureStoreException(
+                "The Hopsworks Job failed, use the Hopsworks UI to access the job logs"
+            )
+        elif execution.final_status.lower() == "killed":
+            raise FeatureStoreException("The Hopsworks Job was stopped")
+        return False
+
     def get_state(self):
         """Get the state of the job.
 
@@ -0,0 +1,206 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import contextlib
+import copy
+import json
+import threading
+import time
+
+from hsfs import client
+
+FEATURE_GROUP = "feature_group"
+FEATURE_VIEW = "feature_view"
+STORAGE_CONNECTOR = "storage_connector"
+PROVENANCE = "provenance"
+
+_metadata_cache_instance = None
+
+
+def get_instance():
+    global _metadata_cache_instance
+    if not _metadata_cache_instance:
+        _metadata_cache_instance = MetadataCache()
+    return _metadata_cache_instance
+
+
+class MetadataCache:
+    """In-memory cache of metadata responses of the feature store.
+
+    Entries are keyed by entity type, feature store, name and version of the entity,
+    and are returned without a request until their time to live expires. Expired
+    entries are revalidated with their `ETag`, such that unchanged metadata is not
+    transferred again. The time to live is short by default, metadata changed by other
+    clients is therefore picked up quickly. Responses requesting temporary credentials
+    are never cached. Every lookup returns a copy of the cached response, objects
+    built from it can therefore be modified freely.
+
+    Updates and deletes through the client invalidate the entries of the entity,
+    `bypass()` skips the cache for all requests of the current thread.
+    """
+
+    DEFAULT_TTL = 10
+
+    def __init__(self, ttl=DEFAULT_TTL, enabled=True):
+        self._ttl = ttl
+        self._enabled = enabled
+        self._entries = {}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def send_request(
+        self, entity_type, feature_store_id, name, version, path_params, query_params
+    ):
+        """Send a GET request, or return the cached response of the entity.
+
+        :param entity_type: type of the requested entity, for example `FEATURE_GROUP`
+        :type entity_type: str
+        :param feature_store_id: id of the feature store of the entity
+        :type feature_store_id: int
+        :param name: name of the entity
+        :type name: str
+        :param version: version of the entity, `None` if not versioned
+        :type version: int
+        :param path_params: path params of the request
+        :type path_params: list
+        :param query_params: query params of the request
+        :type query_params: dict
+        :return: Response json
+        :rtype: dict
+        """
+        _client = client.get_instance()
+        if (
+            not self._enabled
+            or getattr(self._local, "bypass", False)
+            # temporary credentials expire and must not be kept in memory
+            or (query_params or {}).get("temporaryCredentials", False)
+        ):
+            return _client._send_request("GET", path_params, query_params)
+
+        key = (
+            entity_type,
+            feature_store_id,
+            name,
+            version,
+            _client._base_url,
+            json.dumps(path_params, default=str),
+            json.dumps(query_params, sort_keys=True, default=str),
+        )
+        with self._lock:
+            entry = self._entries.get(key)
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        if entry is not None and entry["expires"] > time.monotonic():
+            return copy.deepcopy(entry["json"])
+
+        # concurrent lookups of the same entity wait for a single request
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is not None and entry["expires"] > time.monotonic():
+                return copy.deepcopy(entry["json"])
+
+            headers = None
+            if entry is not None and entry["etag"] is not None:
+                headers = {"If-None-Match": entry["etag"]}
+            response = _client._send_request(
+                "GET", path_params, query_params, headers=headers, stream=True
+            )
+
+            if response.status_code == 304:
+                json_response = entry["json"]
+                etag = entry["etag"]
+            else:
+                json_response = response.json() if len(response.content) > 0 else None
+                etag = response.headers.get("ETag")
+            with self._lock:
+                self._entries[key] = {
+                    "json": json_response,
+                    "etag": etag,
+                    "expires": time.monotonic() + self._ttl,
+                }
+        return copy.deepcopy(json_response)
+
+    def invalidate(
+        self, entity_type=None, feature_store_id=None, name=None, version=None
+    ):
+        """Remove the matching entries, or all entries if no argument is provided.
+
+        Entries of all versions of the entity are removed if `version` is `None`.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if (
+                    (entity_type is None or key[0] == entity_type)
+                    and (feature_store_id is None or key[1] == feature_store_id)
+                    and (name is None or key[2] == name)
+                    and (version is None or key[3] == version)
+                ):
+                    del self._entries[key]
+                    self._key_locks.pop(key, None)
+
+    @contextlib.contextmanager
+    def bypass(self):
+        """Send all metadata requests of the current thread to the feature store.
+
+        !!! example
+            ```python
+            with metadata_cache.get_instance().bypass():
+                fg = fs.get_feature_group("example_feature_group", 1)
+            ```
+        """
+        previous = getattr(self._local, "bypass", False)
+        self._local.bypass = True
+        try:
+            yield
+        finally:
+            self._local.bypass = previous
+
+    def propagate(self, fn):
+        """Wrap `fn` to run with the bypass state of the calling thread.
+
+        Used for requests submitted to other threads, such that they bypass the
+        cache if the submitting thread does.
+        """
+        bypass = getattr(self._local, "bypass", False)
+
+        def wrapper(*args, **kwargs):
+            if not bypass:
+                return fn(*args, **kwargs)
+            with self.bypass():
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    @property
+    def ttl(self):
+        """Time in seconds after which cached metadata is revalidated."""
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, ttl):
+        self._ttl = ttl
+
+    @property
+    def enabled(self):
+        """Whether metadata responses are cached."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled):
+        self._enabled = enabled
+        if not enabled:
+            self.invalidate()
@@ -14,17 +14,51 @@
 #   limitations under the License.
 #
 
+import copy
+import threading
+from collections import OrderedDict
+
 from hsfs import client
 from hsfs.constructor import fs_query
 
 
 class QueryConstructorApi:
-    def construct_query(self, query):
+    CACHE_MAX_SIZE = 128
+
+    # responses of constructed queries shared by all instances, keyed by cluster,
+    # project and query json. Every lookup builds a new `FsQuery`, as spines are
+    # registered on it.
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    def construct_query(self, query, use_cache=True):
         _client = client.get_instance()
+        query_json = query.json()
+        cache_key = (_client._base_url, _client._project_id, query_json)
+
+        if use_cache:
+            with QueryConstructorApi._cache_lock:
+                response = QueryConstructorApi._cache.get(cache_key)
+                if response is not None:
+                    QueryConstructorApi._cache.move_to_end(cache_key)
+            if response is not None:
+                return fs_query.FsQuery.from_response_json(copy.deepcopy(response))
+
         path_params = ["project", _client._project_id, "featurestores", "query"]
         headers = {"content-type": "application/json"}
-        return fs_query.FsQuery.from_response_json(
-            _client._send_request(
-                "PUT", path_params, headers=headers, data=query.json()
-            )
+        response = _client._send_request(
+            "PUT", path_params, headers=headers, data=query_json
         )
+
+        with QueryConstructorApi._cache_lock:
+            QueryConstructorApi._cache[cache_key] = copy.deepcopy(response)
+            QueryConstructorApi._cache.move_to_end(cache_key)
+            while len(QueryConstructorApi._cache) > QueryConstructorApi.CACHE_MAX_SIZE:
+                QueryConstructorApi._cache.popitem(last=False)
+        return fs_query.FsQuery.from_response_json(response)
+
+    @classmethod
+    def invalidate_cache(cls):
+        """Drop all cached constructed queries."""
+        with cls._cache_lock:
+            cls._cache.clear()
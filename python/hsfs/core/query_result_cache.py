@@ -0,0 +1,162 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import hashlib
+import json
+import os
+import threading
+import uuid
+
+import pandas as pd
+
+from hsfs import client, feature_group
+
+_query_result_cache_instance = None
+
+
+def get_instance():
+    global _query_result_cache_instance
+    if not _query_result_cache_instance:
+        _query_result_cache_instance = QueryResultCache()
+    return _query_result_cache_instance
+
+
+class QueryResultCache:
+    """Local parquet cache of offline query results.
+
+    Entries are keyed by the cluster, the serialized query and the read options,
+    combined with the latest commit id of every feature group in the query. A new
+    commit on any of the feature groups therefore results in a cache miss, and the
+    stale entry of the same query is removed when the new result is stored. Failures
+    of the cache never fail the read, the query is executed instead.
+
+    Looking up the commit ids costs one REST call per distinct feature group of the
+    query on every read, cache hits included, as there is no other way to find out
+    whether a feature group changed since the result was cached.
+    """
+
+    # per user, such that users of a shared host don't share the directory
+    DEFAULT_CACHE_DIR = os.path.join(
+        os.path.expanduser("~"), ".cache", "hsfs", "query_result_cache"
+    )
+    DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+    FILE_SUFFIX = ".parquet"
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_size=DEFAULT_MAX_SIZE):
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+        self._lock = threading.Lock()
+
+    def is_cacheable(self, query):
+        # commit ids are only available for hudi feature groups
+        return all(
+            isinstance(fg, feature_group.FeatureGroup)
+            and fg.time_travel_format is not None
+            and fg.time_travel_format.upper() == "HUDI"
+            for fg in query.featuregroups
+        )
+
+    def get_key(self, query, read_options):
+        query_hash = self._get_query_hash(query, read_options)
+        # a feature group joined with itself, possibly as separate objects, is only
+        # looked up once
+        featuregroups = {fg.id: fg for fg in query.featuregroups}
+        commits = sorted(
+            (fg_id, max(fg.commit_details(limit=1).keys(), default=None))
+            for fg_id, fg in featuregroups.items()
+        )
+        return query_hash, self._hash(json.dumps(commits))
+
+    def get(self, key):
+        path = self._get_path(key)
+        # no lock needed, entries are replaced atomically by `put` and an entry
+        # evicted or replaced during the read results in a cache miss
+        if not os.path.exists(path):
+            return None
+        try:
+            # mark entry as recently used for eviction
+            os.utime(path)
+            return pd.read_parquet(path)
+        except Exception:
+            return None
+
+    def put(self, key, dataframe):
+        path = self._get_path(key)
+        tmp_path = os.path.join(self._cache_dir, f".{uuid.uuid4()}")
+        with self._lock:
+            try:
+                os.makedirs(self._cache_dir, mode=0o700, exist_ok=True)
+                dataframe.to_parquet(tmp_path, index=False)
+                os.replace(tmp_path, path)
+                self._remove_entries(
+                    lambda name: name.startswith(key[0])
+                    and name != os.path.basename(path)
+                )
+                self._evict()
+            except Exception:
+                # not all dataframes can be serialized to parquet and the directory
+                # may not be writable, skip caching
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def invalidate(self, query=None, read_options=None):
+        """Remove the cached results of `query`, or all results if not provided."""
+        with self._lock:
+            if not os.path.exists(self._cache_dir):
+                return
+            if query is None:
+                self._remove_entries(lambda name: True)
+            else:
+                query_hash = self._get_query_hash(query, read_options or {})
+                self._remove_entries(lambda name: name.startswith(query_hash))
+
+    def _get_query_hash(self, query, read_options):
+        return self._hash(
+            str(client.get_instance()._base_url)
+            + query.json()
+            + json.dumps(read_options, sort_keys=True, default=str)
+        )
+
+    def _get_path(self, key):
+        return os.path.join(self._cache_dir, "-".join(key) + self.FILE_SUFFIX)
+
+    def _list_entries(self):
+        return [
+            os.path.join(self._cache_dir, name)
+            for name in os.listdir(self._cache_dir)
+            if name.endswith(self.FILE_SUFFIX)
+        ]
+
+    def _remove_entries(self, predicate):
+        for path in self._list_entries():
+            if predicate(os.path.basename(path)):
+                os.remove(path)
+
+    def _evict(self):
+        entries = sorted(
+            ((os.stat(path), path) for path in self._list_entries()),
+            key=lambda entry: entry[0].st_mtime,
+        )
+        total_size = sum(stat.st_size for stat, _ in entries)
+        for stat, path in entries:
+            if total_size <= self._max_size:
+                break
+            os.remove(path)
+            total_size -= stat.st_size
+
+    @staticmethod
+    def _hash(value):
+        return hashlib.sha256(value.encode("utf-8")).hexdigest()
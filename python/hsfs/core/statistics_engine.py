@@ -20,7 +20,7 @@ import warnings
 
 from hsfs import engine, statistics, util, split_statistics
 from hsfs.client import exceptions
-from hsfs.core import statistics_api
+from hsfs.core import column_profiler, statistics_api, training_data_shards
 
 
 class StatisticsEngine:
@@ -69,6 +69,67 @@ class StatisticsEngine:
             # Python engine
             engine.get_instance().profile_by_spark(metadata_instance)
 
+    def compute_incremental_statistics(
+        self,
+        metadata_instance,
+        feature_dataframe,
+        overwrite=False,
+        feature_group_commit_id=None,
+        materialized=False,
+    ):
+        """Compute statistics of a newly inserted pandas dataframe and merge them with
+        the sketches stored with the last statistics of the feature group.
+
+        If `overwrite` is set, the dataframe contains all data of the feature group
+        and no previous sketches are merged. If no previous sketches exist, the
+        feature group is profiled once in full, which requires the inserted data to be
+        `materialized` to the offline storage. Otherwise no statistics are computed
+        and `None` is returned.
+        """
+        config = metadata_instance.statistics_config
+        profiler = column_profiler.ColumnProfiler(
+            config.columns,
+            config.correlations,
+            config.histograms,
+            config.exact_uniqueness,
+        )
+
+        if not overwrite:
+            last_stats = self.get_last(metadata_instance)
+            sketches = (
+                last_stats.content.get("sketches") if last_stats is not None else None
+            )
+            if sketches is not None:
+                profiler = column_profiler.ColumnProfiler.from_sketches(
+                    sketches,
+                    config.columns,
+                    config.correlations,
+                    config.histograms,
+                    config.exact_uniqueness,
+                ).merge(profiler.update(feature_dataframe))
+            elif materialized:
+                # bootstrap the sketches, the inserted data is part of the read
+                profiler.update(metadata_instance.read(dataframe_type="default"))
+            else:
+                warnings.warn(
+                    "Incremental statistics of feature group `{}` are computed once "
+                    "an insert waits for the materialization job to finish.".format(
+                        metadata_instance.name
+                    ),
+                    category=util.StatisticsWarning,
+                )
+                return None
+        else:
+            profiler.update(feature_dataframe)
+
+        stats = statistics.Statistics(
+            commit_time=int(float(datetime.datetime.now().timestamp()) * 1000),
+            content=profiler.to_json(include_sketches=True),
+            feature_group_commit_id=feature_group_commit_id,
+        )
+        self._save_statistics(stats, metadata_instance, None)
+        return stats
+
     @staticmethod
     def profile_statistics(metadata_instance, feature_dataframe):
         if len(feature_dataframe.head(1)) == 0:
@@ -79,6 +140,12 @@ class StatisticsEngine:
                 category=util.StatisticsWarning,
             )
             return "{}"
+        if (
+            isinstance(feature_dataframe, training_data_shards.TrainingDataShards)
+            and feature_dataframe.statistics is not None
+        ):
+            # profiled batch by batch while the shards were written
+            return feature_dataframe.statistics
         return engine.get_instance().profile(
             feature_dataframe,
             metadata_instance.statistics_config.columns,
@@ -147,11 +214,13 @@ class StatisticsEngine:
         label_encoder_features,
         feature_dataframe=None,
         feature_view_obj=None,
+        content_str=None,
     ):
         commit_time = int(float(datetime.datetime.now().timestamp()) * 1000)
-        content_str = self.profile_transformation_fn_statistics(
-            feature_dataframe, columns, label_encoder_features
-        )
+        if content_str is None:
+            content_str = self.profile_transformation_fn_statistics(
+                feature_dataframe, columns, label_encoder_features
+            )
         stats = statistics.Statistics(
             commit_time=commit_time,
             content=content_str,
@@ -194,20 +263,27 @@ class StatisticsEngine:
 
     @staticmethod
     def profile_unique_values(feature_dataframe, label_encoder_features, content_str):
+        return StatisticsEngine.add_unique_values(
+            content_str,
+            {
+                column: engine.get_instance().get_unique_values(
+                    feature_dataframe, column
+                )
+                for column in label_encoder_features
+            },
+        )
+
+    @staticmethod
+    def add_unique_values(content_str, unique_values):
+        """Add the unique values of label encoded features, given as a dict of feature
+        name to values, to the statistics `content_str`."""
         # parsing JSON string:
         content_dict = json.loads(content_str)
         if not content_dict:
             content_dict = {"columns": []}
-        for column in label_encoder_features:
-            unique_values = {
-                "column": column,
-                "unique_values": [
-                    value
-                    for value in engine.get_instance().get_unique_values(
-                        feature_dataframe, column
-                    )
-                ],
-            }
-            content_dict["columns"].append(unique_values)
+        for column, values in unique_values.items():
+            content_dict["columns"].append(
+                {"column": column, "unique_values": [value for value in values]}
+            )
         # the result is a JSON string:
         return json.dumps(content_dict)
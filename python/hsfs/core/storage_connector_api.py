@@ -15,6 +15,7 @@
 #
 
 from hsfs import client, storage_connector
+from hsfs.core import metadata_cache
 
 
 class StorageConnectorApi:
@@ -66,5 +67,12 @@ class StorageConnectorApi:
         ]
 
         return storage_connector.StorageConnector.from_response_json(
-            _client._send_request("GET", path_params)
+            metadata_cache.get_instance().send_request(
+                metadata_cache.STORAGE_CONNECTOR,
+                self._feature_store_id,
+                "onlinefeaturestore",
+                None,
+                path_params,
+                None,
+            )
         )
@@ -0,0 +1,209 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+class TrainingDataIterator:
+    """Iterator over batches of a training dataset materialized as parquet files.
+
+    The files are read row group by row group, such that memory usage is bounded by
+    the shuffle buffer and the number of prefetched batches instead of the size of the
+    training dataset. Files are opened, and downloaded if necessary, ahead of time by
+    background threads, and decoded into batches by a background thread while the
+    previous batches are consumed. Files on S3, or on HopsFS without pydoop, are
+    downloaded whole into memory, so memory usage additionally grows with the size of
+    the files opened ahead of time.
+
+    Workers of distributed training, or of a PyTorch `DataLoader`, each iterate over
+    a distinct subset of the files by setting `rank` and `world_size`. The files have
+    to be passed in the same order to every worker, e.g. sorted by path.
+
+    Every iteration is an epoch, with a new order of the files and rows if shuffling
+    is enabled.
+    """
+
+    DATAFRAME_TYPES = ["numpy", "arrow", "pandas"]
+
+    _END = object()
+
+    def __init__(
+        self,
+        file_openers,
+        batch_size,
+        columns=None,
+        labels=None,
+        shuffle_buffer=0,
+        seed=None,
+        rank=0,
+        world_size=1,
+        prefetch=2,
+        dataframe_type="numpy",
+    ):
+        if dataframe_type not in self.DATAFRAME_TYPES:
+            raise TypeError(
+                "Dataframe type `{}` not supported by the training data iterator, "
+                "use one of {}.".format(dataframe_type, self.DATAFRAME_TYPES)
+            )
+        if not 0 <= rank < world_size:
+            raise ValueError(
+                "Rank `{}` has to be in range [0, {}).".format(rank, world_size)
+            )
+        self._file_openers = list(file_openers)[rank::world_size]
+        self._batch_size = batch_size
+        self._labels = list(labels or [])
+        self._columns = (
+            None
+            if columns is None
+            else list(columns)
+            + [label for label in self._labels if label not in columns]
+        )
+        self._shuffle_buffer = shuffle_buffer
+        self._rng = np.random.default_rng(seed)
+        self._prefetch = prefetch
+        self._dataframe_type = dataframe_type
+
+    def __iter__(self):
+        batches = queue.Queue(maxsize=max(self._prefetch, 1))
+        stop = threading.Event()
+        # the generator of each epoch is seeded from the iterator, such that epochs
+        # differ, but are reproducible when a seed is provided
+        rng = np.random.default_rng(self._rng.integers(2**32))
+        producer = threading.Thread(
+            target=self._produce, args=(batches, stop, rng), daemon=True
+        )
+        producer.start()
+        try:
+            while True:
+                batch = batches.get()
+                if batch is self._END:
+                    return
+                if isinstance(batch, BaseException):
+                    raise batch
+                yield self._convert(batch)
+        finally:
+            stop.set()
+            # unblock the producer if it is waiting for a free slot
+            while producer.is_alive():
+                try:
+                    batches.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+    def _produce(self, batches, stop, rng):
+        try:
+            for batch in self._read_batches(rng):
+                if stop.is_set():
+                    return
+                batches.put(batch)
+            batches.put(self._END)
+        except BaseException as e:
+            batches.put(e)
+
+    def _read_batches(self, rng):
+        file_openers = self._file_openers
+        if self._shuffle_buffer:
+            file_openers = [file_openers[i] for i in rng.permutation(len(file_openers))]
+
+        buffer = []
+        buffer_size = 0
+        # keep at least the shuffle buffer to mix rows of different row groups
+        threshold = max(self._shuffle_buffer, self._batch_size)
+        for file in self._open_files(file_openers):
+            try:
+                for record_batch in pq.ParquetFile(file).iter_batches(
+                    batch_size=self._batch_size, columns=self._columns
+                ):
+                    buffer.append(record_batch)
+                    buffer_size += record_batch.num_rows
+                    if buffer_size >= threshold:
+                        table = self._shuffle(pa.Table.from_batches(buffer), rng)
+                        num_batches = (
+                            table.num_rows - self._shuffle_buffer
+                        ) // self._batch_size or 1
+                        for i in range(num_batches):
+                            yield table.slice(i * self._batch_size, self._batch_size)
+                        buffer = table.slice(
+                            num_batches * self._batch_size
+                        ).to_batches()
+                        buffer_size = table.num_rows - num_batches * self._batch_size
+            finally:
+                file.close()
+
+        if buffer_size > 0:
+            table = self._shuffle(pa.Table.from_batches(buffer), rng)
+            for offset in range(0, table.num_rows, self._batch_size):
+                yield table.slice(offset, self._batch_size)
+
+    def _open_files(self, file_openers):
+        # open the next files while the current one is read
+        with ThreadPoolExecutor(max_workers=max(self._prefetch, 1)) as executor:
+            files = deque(
+                executor.submit(opener) for opener in file_openers[: self._prefetch]
+            )
+            for opener in file_openers[self._prefetch :]:
+                file = files.popleft().result()
+                files.append(executor.submit(opener))
+                yield file
+            while files:
+                yield files.popleft().result()
+
+    def _shuffle(self, table, rng):
+        if not self._shuffle_buffer:
+            return table
+        return table.take(rng.permutation(table.num_rows))
+
+    def _convert(self, table):
+        features = table.select(
+            [name for name in table.column_names if name not in self._labels]
+        )
+        labels = table.select(self._labels) if self._labels else None
+        if self._dataframe_type == "numpy":
+            convert = self._to_numpy
+        elif self._dataframe_type == "pandas":
+            convert = self._to_pandas
+        else:
+            convert = self._to_record_batch
+        if labels is None:
+            return convert(features)
+        return convert(features), convert(labels)
+
+    @staticmethod
+    def _to_numpy(table):
+        return {
+            name: column.to_numpy(zero_copy_only=False)
+            for name, column in zip(table.column_names, table.columns)
+        }
+
+    @staticmethod
+    def _to_pandas(table):
+        return table.to_pandas()
+
+    @staticmethod
+    def _to_record_batch(table):
+        batches = table.combine_chunks().to_batches()
+        return (
+            batches[0]
+            if batches
+            else pa.RecordBatch.from_pylist([], schema=table.schema)
+        )
@@ -0,0 +1,122 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import os
+
+import pandas as pd
+
+
+class TrainingDataShards:
+    """Lazy handle of training data stored as parquet shards on the local file system.
+
+    The handle is returned instead of a dataframe when training data is created with
+    the `"streaming"` read option. The shards are only read when calling `read` or
+    `iter_batches`, such that training data larger than the memory of the client can
+    be consumed batch by batch.
+    """
+
+    def __init__(self, paths, columns, num_rows=0, statistics=None):
+        self._paths = list(paths)
+        self._columns = list(columns)
+        self._num_rows = num_rows
+        self._statistics = statistics
+
+    def read(self):
+        """Read all shards into a single pandas dataframe."""
+        dataframes = list(self.iter_batches())
+        if not dataframes:
+            return pd.DataFrame(columns=self._columns)
+        return pd.concat(dataframes, ignore_index=True)
+
+    def iter_batches(self):
+        """Iterate over the shards, yielding one pandas dataframe per shard."""
+        for path in self._paths:
+            yield pd.read_parquet(path, columns=self._columns)
+
+    def head(self, n=5):
+        for dataframe in self.iter_batches():
+            return dataframe.head(n)
+        return pd.DataFrame(columns=self._columns)
+
+    def select(self, columns):
+        """Handle of the same shards, projected on `columns`."""
+        return TrainingDataShards(self._paths, columns, self._num_rows)
+
+    def drop(self, columns):
+        """Handle of the same shards, without `columns`."""
+        return self.select(
+            [column for column in self._columns if column not in columns]
+        )
+
+    def delete(self):
+        """Delete the shards from the local file system."""
+        for path in self._paths:
+            if os.path.exists(path):
+                os.remove(path)
+        self._paths = []
+        self._num_rows = 0
+
+    def __len__(self):
+        return self._num_rows
+
+    @property
+    def paths(self):
+        """Paths of the parquet shards."""
+        return self._paths
+
+    @property
+    def columns(self):
+        """Columns of the training data."""
+        return self._columns
+
+    @property
+    def num_rows(self):
+        """Number of rows in all shards."""
+        return self._num_rows
+
+    @property
+    def statistics(self):
+        """Statistics of the training data, as profiled while writing the shards."""
+        return self._statistics
+
+
+class TrainingDataShardWriter:
+    """Writes the batches of a training dataset split to parquet shards in `path`,
+    one shard per batch."""
+
+    SHARD_NAME = "part-{:05d}.parquet"
+
+    def __init__(self, path):
+        self._path = path
+        self._paths = []
+        self._columns = None
+        self._num_rows = 0
+
+    def write(self, dataframe):
+        if self._columns is None:
+            self._columns = list(dataframe.columns)
+        if len(dataframe) == 0:
+            return
+        os.makedirs(self._path, exist_ok=True)
+        path = os.path.join(self._path, self.SHARD_NAME.format(len(self._paths)))
+        dataframe.to_parquet(path, index=False)
+        self._paths.append(path)
+        self._num_rows += len(dataframe)
+
+    def close(self, statistics=None):
+        return TrainingDataShards(
+            self._paths, self._columns or [], self._num_rows, statistics
+        )
@@ -143,6 +143,11 @@ class TransformationFunctionEngine:
                 min_value=min_value,
                 max_value=max_value,
             )
+            transformation_function_instance.vectorized_transformation_fn = partial(
+                BuiltInTransformationFunction.min_max_scaler,
+                min_value=min_value,
+                max_value=max_value,
+            )
         elif transformation_function_instance.name == "standard_scaler":
             mean, std_dev = BuiltInTransformationFunction.standard_scaler_stats(
                 stat_content, feature_name
@@ -152,6 +157,11 @@ class TransformationFunctionEngine:
                 mean=mean,
                 std_dev=std_dev,
             )
+            transformation_function_instance.vectorized_transformation_fn = partial(
+                BuiltInTransformationFunction.standard_scaler,
+                mean=mean,
+                std_dev=std_dev,
+            )
         elif transformation_function_instance.name == "robust_scaler":
             robust_scaler_stats = BuiltInTransformationFunction.robust_scaler_stats(
                 stat_content, feature_name
@@ -162,6 +172,12 @@ class TransformationFunctionEngine:
                 p50=robust_scaler_stats[49],
                 p75=robust_scaler_stats[74],
             )
+            transformation_function_instance.vectorized_transformation_fn = partial(
+                BuiltInTransformationFunction.robust_scaler,
+                p25=robust_scaler_stats[24],
+                p50=robust_scaler_stats[49],
+                p75=robust_scaler_stats[74],
+            )
         elif transformation_function_instance.name == "label_encoder":
             value_to_index = BuiltInTransformationFunction.encoder_stats(
                 stat_content, feature_name
@@ -170,6 +186,10 @@ class TransformationFunctionEngine:
                 transformation_function_instance.transformation_fn,
                 value_to_index=value_to_index,
             )
+            transformation_function_instance.vectorized_transformation_fn = partial(
+                BuiltInTransformationFunction.label_encoder,
+                value_to_index=value_to_index,
+            )
         else:
             raise ValueError("Not implemented")
 
@@ -232,6 +252,7 @@ class TransformationFunctionEngine:
         label_encoder_features,
         feature_dataframe,
         feature_view_obj,
+        content_str=None,
     ):
         return training_dataset_obj._statistics_engine.compute_transformation_fn_statistics(
             td_metadata_instance=training_dataset_obj,
@@ -239,13 +260,13 @@ class TransformationFunctionEngine:
             label_encoder_features=label_encoder_features,
             feature_dataframe=feature_dataframe,
             feature_view_obj=feature_view_obj,
+            content_str=content_str,
         )
 
     @staticmethod
-    def populate_builtin_transformation_functions(
-        training_dataset, feature_view_obj, dataset
-    ):
-        # check if there any transformation functions that require statistics attached to td features
+    def get_builtin_transformation_features(training_dataset):
+        """Features of the built-in transformation functions which require statistics,
+        as a tuple of the scaled features and the label encoded features."""
         builtin_tffn_label_encoder_features = [
             ft_name
             for ft_name in training_dataset.transformation_functions
@@ -264,9 +285,34 @@ class TransformationFunctionEngine:
             and training_dataset.transformation_functions[ft_name].name
             != "label_encoder"
         ]
+        return builtin_tffn_features, builtin_tffn_label_encoder_features
+
+    @staticmethod
+    def populate_builtin_transformation_functions(
+        training_dataset, feature_view_obj, dataset, stat_content=None
+    ):
+        # check if there any transformation functions that require statistics attached to td features
+        (
+            builtin_tffn_features,
+            builtin_tffn_label_encoder_features,
+        ) = TransformationFunctionEngine.get_builtin_transformation_features(
+            training_dataset
+        )
 
         if builtin_tffn_features or builtin_tffn_label_encoder_features:
-            if training_dataset.splits:
+            if stat_content is not None:
+                # statistics were already profiled by the engine, e.g. batch by batch
+                stats = (
+                    TransformationFunctionEngine.compute_transformation_fn_statistics(
+                        training_dataset,
+                        builtin_tffn_features,
+                        builtin_tffn_label_encoder_features,
+                        None,
+                        feature_view_obj,
+                        content_str=stat_content,
+                    )
+                )
+            elif training_dataset.splits:
                 # compute statistics before transformations are applied
                 stats = (
                     TransformationFunctionEngine.compute_transformation_fn_statistics(
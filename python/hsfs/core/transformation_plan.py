@@ -0,0 +1,104 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import pandas as pd
+
+
+class TransformationPlan:
+    """Transformation functions of a feature view or training dataset, grouped once
+    into the functions which can be applied to whole columns and the functions which
+    have to be called per value.
+
+    The plan is compiled after the statistics of the built-in functions are bound, such
+    that the engines and the vector server only resolve the functions once and apply
+    all of them in a single pass over a dataframe, a Spark row or a serving vector.
+    """
+
+    def __init__(self, transformation_functions):
+        self._transformation_functions = transformation_functions or {}
+        self._vectorized_fns = {}
+        self._per_value_fns = {}
+        for feature_name, transformation_fn in self._transformation_functions.items():
+            if transformation_fn.vectorized_transformation_fn is not None:
+                self._vectorized_fns[
+                    feature_name
+                ] = transformation_fn.vectorized_transformation_fn
+            else:
+                self._per_value_fns[feature_name] = transformation_fn.transformation_fn
+        self._label_encoder_features = set(
+            feature_name
+            for feature_name, transformation_fn in self._transformation_functions.items()
+            if transformation_fn.name == "label_encoder"
+        )
+        # serving vectors hold single values, for which the per value function is
+        # cheaper, except for user functions which only exist vectorized
+        self._row_fns = [
+            (
+                feature_name,
+                self._apply_on_single_value(transformation_fn.transformation_fn)
+                if transformation_fn.vectorized
+                else transformation_fn.transformation_fn,
+            )
+            for feature_name, transformation_fn in self._transformation_functions.items()
+        ]
+
+    def transform_dataframe(self, dataframe):
+        """Apply all transformation functions to a pandas dataframe, in place."""
+        for feature_name, transformation_fn in self._vectorized_fns.items():
+            dataframe[feature_name] = transformation_fn(dataframe[feature_name])
+        for feature_name, transformation_fn in self._per_value_fns.items():
+            dataframe[feature_name] = dataframe[feature_name].map(transformation_fn)
+        return dataframe
+
+    def transform_row(self, row_dict, allow_missing=False):
+        """Apply all transformation functions to a serving vector, in place.
+
+        With `allow_missing`, categories which are unknown to a label encoder are
+        returned as missing values instead of raising a `KeyError`.
+        """
+        for feature_name, transformation_fn in self._row_fns:
+            if feature_name in row_dict:
+                try:
+                    row_dict[feature_name] = transformation_fn(row_dict[feature_name])
+                except KeyError:
+                    if not (
+                        allow_missing and feature_name in self._label_encoder_features
+                    ):
+                        raise
+                    row_dict[feature_name] = None
+        return row_dict
+
+    @staticmethod
+    def _apply_on_single_value(transformation_fn):
+        def apply(value):
+            return transformation_fn(pd.Series([value])).iloc[0]
+
+        return apply
+
+    @property
+    def transformation_functions(self):
+        """Transformation functions of the plan, keyed by feature name."""
+        return self._transformation_functions
+
+    @property
+    def vectorized_features(self):
+        """Features transformed by functions operating on whole columns."""
+        return list(self._vectorized_fns.keys())
+
+    @property
+    def per_value_features(self):
+        """Features transformed by functions called once per value."""
+        return list(self._per_value_fns.keys())
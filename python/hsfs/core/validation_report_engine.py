@@ -14,10 +14,9 @@
 #   limitations under the License.
 #
 
-from typing import List, Union
+from typing import List, Union, TypeVar
 from hsfs.core import validation_report_api
 from hsfs import client, util
-import great_expectations as ge
 
 from hsfs.validation_report import ValidationReport
 
@@ -50,7 +49,9 @@ class ValidationReportEngine:
 
     def get_last(
         self, ge_type: bool = True
-    ) -> Union[ValidationReport, ge.core.ExpectationSuiteValidationResult, None]:
+    ) -> Union[
+        ValidationReport, TypeVar("ge.core.ExpectationSuiteValidationResult"), None
+    ]:
         """Get the most recent Validation Report of a Feature Group."""
         url = self._get_validation_report_url()
         print(
@@ -67,7 +68,10 @@ class ValidationReportEngine:
 
     def get_all(
         self, ge_type: bool = True
-    ) -> Union[List[ValidationReport], List[ge.core.ExpectationSuiteValidationResult]]:
+    ) -> Union[
+        List[ValidationReport],
+        List[TypeVar("ge.core.ExpectationSuiteValidationResult")],
+    ]:
         """Get all Validation Report of a Feature Group."""
         url = self._get_validation_report_url()
         print(
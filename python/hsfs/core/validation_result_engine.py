@@ -14,13 +14,12 @@
 #   limitations under the License.
 #
 
-from typing import Union, List, Dict
+from typing import Union, List, Dict, TypeVar
 from hsfs.core import validation_result_api
 from datetime import datetime, date
 from hsfs.util import convert_event_time_to_timestamp
 
 from hsfs.ge_validation_result import ValidationResult
-from great_expectations.core import ExpectationValidationResult
 
 
 class ValidationResultEngine:
@@ -43,7 +42,9 @@ class ValidationResultEngine:
         end_validation_time: Union[str, int, datetime, date, None] = None,
         filter_by: List[str] = [],
         ge_type: bool = True,
-    ) -> Union[List[ValidationResult], List[ExpectationValidationResult]]:
+    ) -> Union[
+        List[ValidationResult], List[TypeVar("ge.core.ExpectationValidationResult")]
+    ]:
         """Get Validation Results relevant to an Expectation specified by expectation_id.
 
         :param expectation_id: id of the expectation for which to fetch the validation history
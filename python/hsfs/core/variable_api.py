@@ -16,22 +16,44 @@
 
 from hsfs import client
 import re
+import threading
 
 from hsfs.client.exceptions import RestAPIError
 
 
 class VariableApi:
+    # the cluster configuration does not change while a client is running,
+    # variables are fetched once per process and cluster
+    _cache = {}
+    _cache_lock = threading.Lock()
+
     def __init__(self):
         pass
 
-    def get_version(self, software: str):
+    def _send_request(self, path_params):
         _client = client.get_instance()
+        cache_key = (_client._base_url, tuple(path_params))
+        with VariableApi._cache_lock:
+            if cache_key in VariableApi._cache:
+                return VariableApi._cache[cache_key]
+        resp = _client._send_request("GET", path_params)
+        with VariableApi._cache_lock:
+            VariableApi._cache[cache_key] = resp
+        return resp
+
+    @classmethod
+    def invalidate_cache(cls):
+        """Drop all cached variables."""
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    def get_version(self, software: str):
         path_params = [
             "variables",
             "versions",
         ]
 
-        resp = _client._send_request("GET", path_params)
+        resp = self._send_request(path_params)
         for entry in resp:
             if entry["software"] == software:
                 return entry["version"]
@@ -44,37 +66,34 @@ class VariableApi:
         return matches.group(1), matches.group(2)
 
     def get_flyingduck_enabled(self):
-        _client = client.get_instance()
         path_params = [
             "variables",
             "enable_flyingduck",
         ]
 
-        resp = _client._send_request("GET", path_params)
+        resp = self._send_request(path_params)
         return resp["successMessage"] == "true"
 
     def get_loadbalancer_external_domain(self):
-        _client = client.get_instance()
         path_params = [
             "variables",
             "loadbalancer_external_domain",
         ]
 
         try:
-            resp = _client._send_request("GET", path_params)
+            resp = self._send_request(path_params)
             return resp["successMessage"]
         except RestAPIError:
             return ""
 
     def get_service_discovery_domain(self):
-        _client = client.get_instance()
         path_params = [
             "variables",
             "service_discovery_domain",
         ]
 
         try:
-            resp = _client._send_request("GET", path_params)
+            resp = self._send_request(path_params)
             return resp["successMessage"]
         except RestAPIError:
             return ""
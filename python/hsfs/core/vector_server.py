@@ -15,24 +15,37 @@
 #
 import re
 import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import avro.schema
 import avro.io
 from sqlalchemy import sql, bindparam, exc, text
 import numpy as np
 import pandas as pd
 from hsfs import util
-from hsfs import training_dataset, feature_view, client
+from hsfs import training_dataset, feature_view, client, transformation_function
+from hsfs.client.exceptions import FeatureStoreException
+from hsfs.constructor import serving_prepared_statement
 from hsfs.serving_key import ServingKey
 from hsfs.core import (
     training_dataset_api,
     storage_connector_api,
     transformation_function_engine,
+    transformation_plan,
+    encoding_dictionary,
     feature_view_api,
     feature_view_engine,
+    metadata_cache,
 )
 
 
 class VectorServer:
+    SERVING_STATE_FORMAT_VERSION = 2
+
+    _transformation_statistics = {}
+    _transformation_statistics_lock = threading.Lock()
+
     def __init__(
         self,
         feature_store_id,
@@ -47,6 +60,11 @@ class VectorServer:
         )
         self._prepared_statement_engine = None
         self._prepared_statements = None
+        self._batch_prepared_statements = None
+        self._serving_prepared_statements = None
+        self._online_connection_options = None
+        self._online_connector_url = None
+        self._transformation_statistics_content = None
         self._serving_keys = serving_keys
         self._pkname_by_serving_index = None
         self._prefix_by_serving_index = None
@@ -69,13 +87,44 @@ class VectorServer:
             feature_store_id
         )
 
-    def init_serving(self, entity, batch, external, options=None):
+    def init_serving(self, entity, batch, external, options=None, concurrent_init=True):
+        """Initialise the server to retrieve single vectors, batches of vectors or
+        both if `batch` is `None`. Both kinds of retrieval share the connection pool,
+        the transformation functions and the complex feature schemas."""
         if external is None:
             external = isinstance(client.get_instance(), client.external.Client)
         # `init_prepared_statement` should be the last because other initialisations
         # has to be done successfully before it is able to fetch feature vectors.
-        self.init_transformation(entity)
-        self.init_prepared_statement(entity, batch, external, options=options)
+        if not concurrent_init:
+            self.init_transformation(entity)
+            self.init_prepared_statement(entity, batch, external, options=options)
+            return
+
+        # The metadata it needs is requested while the transformations are initialised.
+        batch_modes = self._get_batch_modes(batch)
+        cache = metadata_cache.get_instance()
+        with ThreadPoolExecutor(max_workers=len(batch_modes) + 1) as executor:
+            prepared_statements = {
+                batch_mode: executor.submit(
+                    cache.propagate(self._get_prepared_statements), entity, batch_mode
+                )
+                for batch_mode in batch_modes
+            }
+            online_conn = executor.submit(
+                cache.propagate(self._storage_connector_api.get_online_connector)
+            )
+            self.init_transformation(entity)
+            self.init_prepared_statement(
+                entity,
+                batch,
+                external,
+                options=options,
+                prepared_statements={
+                    batch_mode: future.result()
+                    for batch_mode, future in prepared_statements.items()
+                },
+                online_conn=online_conn.result(),
+            )
 
     def init_batch_scoring(self, entity):
         self.init_transformation(entity)
@@ -83,27 +132,80 @@ class VectorServer:
     def init_transformation(self, entity):
         # attach transformation functions
         self._transformation_functions = self._get_transformation_fns(entity)
+        self._transformation_plan = transformation_plan.TransformationPlan(
+            self._transformation_functions
+        )
 
-    def init_prepared_statement(self, entity, batch, external, options=None):
-        if isinstance(entity, feature_view.FeatureView):
-            prepared_statements = self._feature_view_api.get_serving_prepared_statement(
-                entity.name, entity.version, batch
-            )
-        elif isinstance(entity, training_dataset.TrainingDataset):
-            prepared_statements = (
-                self._training_dataset_api.get_serving_prepared_statement(entity, batch)
-            )
-        else:
-            raise ValueError(
-                "Object type needs to be `feature_view.FeatureView` or `training_dataset.TrainingDataset`."
-            )
+    def init_prepared_statement(
+        self,
+        entity,
+        batch,
+        external,
+        options=None,
+        prepared_statements=None,
+        online_conn=None,
+    ):
+        if prepared_statements is None:
+            prepared_statements = {
+                batch_mode: self._get_prepared_statements(entity, batch_mode)
+                for batch_mode in self._get_batch_modes(batch)
+            }
         # reset values to default, as user may be re-initialising with different parameters
         self._prepared_statement_engine = None
-        self._prepared_statements = None
         self._external = external
 
-        self._set_mysql_connection(options=options)
+        self._set_mysql_connection(options=options, online_conn=online_conn)
+        self._set_prepared_statements(prepared_statements)
+        # get schemas for complex features once
+        self._complex_features = self.get_complex_feature_schemas()
+
+    def init_missing_prepared_statement(self, entity, batch):
+        """Add the prepared statements of the missing kind of retrieval to an
+        initialised server. The connection, `external` and the transformation
+        functions of the first initialisation are kept."""
+        prepared_statements = dict(self._serving_prepared_statements)
+        prepared_statements[batch] = self._get_prepared_statements(entity, batch)
+        self._set_prepared_statements(prepared_statements)
+
+    def _set_prepared_statements(self, prepared_statements):
+        self._prepared_statements = None
+        self._batch_prepared_statements = None
+        self._serving_key_by_serving_index = {}
+        # kept to be written to the serving state
+        self._serving_prepared_statements = prepared_statements
+
+        for batch_mode, batch_mode_statements in prepared_statements.items():
+            (
+                prepared_statements_dict,
+                serving_keys,
+                feature_name_order_by_psp,
+            ) = self._parametrize_prepared_statements(batch_mode_statements, batch_mode)
+            if batch_mode:
+                self._batch_prepared_statements = prepared_statements_dict
+            else:
+                self._prepared_statements = prepared_statements_dict
+        # assign serving key if it is not provided.
+        if self._serving_keys is None:
+            self._serving_keys = serving_keys
 
+        for sk in self._serving_keys:
+            self._serving_key_by_serving_index[
+                sk.join_index
+            ] = self._serving_key_by_serving_index.get(sk.join_index, []) + [sk]
+        # sort the serving by PreparedStatementParameter.index
+        for join_index in self._serving_key_by_serving_index:
+            self._serving_key_by_serving_index[join_index] = sorted(
+                self._serving_key_by_serving_index[join_index],
+                key=lambda _sk: feature_name_order_by_psp[join_index].get(
+                    _sk.feature_name, 0
+                ),
+            )
+
+    @staticmethod
+    def _get_batch_modes(batch):
+        return [False, True] if batch is None else [batch]
+
+    def _parametrize_prepared_statements(self, prepared_statements, batch):
         prepared_statements_dict = {}
         serving_keys = set()
         feature_name_order_by_psp = dict()
@@ -155,25 +257,145 @@ class VectorServer:
             prepared_statements_dict[
                 prepared_statement.prepared_statement_index
             ] = query_online
-        # assign serving key if it is not provided.
-        if self._serving_keys is None:
-            self._serving_keys = serving_keys
+        return prepared_statements_dict, serving_keys, feature_name_order_by_psp
 
-        self._prepared_statements = prepared_statements_dict
-        for sk in self._serving_keys:
-            self._serving_key_by_serving_index[
-                sk.join_index
-            ] = self._serving_key_by_serving_index.get(sk.join_index, []) + [sk]
-        # sort the serving by PreparedStatementParameter.index
-        for join_index in self._serving_key_by_serving_index:
-            self._serving_key_by_serving_index[join_index] = sorted(
-                self._serving_key_by_serving_index[join_index],
-                key=lambda _sk: feature_name_order_by_psp[join_index].get(
-                    _sk.feature_name, 0
-                ),
+    def _get_prepared_statements(self, entity, batch):
+        if isinstance(entity, feature_view.FeatureView):
+            return self._feature_view_api.get_serving_prepared_statement(
+                entity.name, entity.version, batch
             )
-        # get schemas for complex features once
-        self._complex_features = self.get_complex_feature_schemas()
+        elif isinstance(entity, training_dataset.TrainingDataset):
+            return self._training_dataset_api.get_serving_prepared_statement(
+                entity, batch
+            )
+        else:
+            raise ValueError(
+                "Object type needs to be `feature_view.FeatureView` or `training_dataset.TrainingDataset`."
+            )
+
+    def save_serving_state(self, entity, path):
+        """Write the state of the initialised server to a local json file.
+
+        The password of the online feature store is not written to the file.
+        """
+        if self._serving_prepared_statements is None:
+            raise FeatureStoreException(
+                "Serving is not initialised. Call `init_serving` before saving the"
+                " serving state."
+            )
+        state = {
+            "format_version": self.SERVING_STATE_FORMAT_VERSION,
+            "entity": self._get_serving_state_entity(entity),
+            "training_dataset_version": self._training_dataset_version,
+            "external": self._external,
+            "prepared_statements": {
+                "batch" if batch_mode else "single": statements
+                for batch_mode, statements in self._serving_prepared_statements.items()
+            },
+            "serving_keys": list(self._serving_keys),
+            "transformation_functions": self._transformation_functions,
+            "transformation_statistics": self._transformation_statistics_content,
+            "complex_feature_schemas": self._get_complex_feature_avro_schemas(),
+            "online_connection": {
+                key: value
+                for key, value in self._online_connection_options.items()
+                if key != "password"
+            },
+            # url of the storage connector, to switch `external` when restoring
+            "online_connector_url": self._online_connector_url,
+        }
+        with open(path, "w") as state_file:
+            json.dump(state, state_file, cls=util.FeatureStoreEncoder)
+
+    def init_serving_from_state(
+        self, entity, path, options=None, password=None, external=None
+    ):
+        """Initialise the server from a state written by `save_serving_state`.
+
+        No requests are sent to the feature store if the `password` of the online
+        feature store is provided, otherwise the online storage connector is fetched.
+        If `external` differs from the saved state, the host of the online feature
+        store is resolved again.
+        """
+        with open(path, "r") as state_file:
+            state = json.load(state_file)
+        if state.get("format_version") != self.SERVING_STATE_FORMAT_VERSION:
+            raise FeatureStoreException(
+                "The serving state in '{}' was saved with an incompatible version of"
+                " hsfs, save the serving state again.".format(path)
+            )
+        state_entity = self._get_serving_state_entity(entity)
+        if state["entity"] != state_entity:
+            raise FeatureStoreException(
+                "The serving state in '{}' was saved for {} `{}` version {} and"
+                " does not match {} `{}` version {}.".format(
+                    path,
+                    state["entity"]["type"],
+                    state["entity"]["name"],
+                    state["entity"]["version"],
+                    state_entity["type"],
+                    state_entity["name"],
+                    state_entity["version"],
+                )
+            )
+
+        self._training_dataset_version = state["training_dataset_version"]
+        self._external = state["external"] if external is None else external
+
+        self._transformation_statistics_content = state["transformation_statistics"]
+        self._transformation_functions = self._transformation_function_engine.populate_builtin_attached_fns(
+            {
+                feature_name: transformation_function.TransformationFunction.from_response_json(
+                    tf_json
+                )
+                for feature_name, tf_json in state["transformation_functions"].items()
+            },
+            self._transformation_statistics_content,
+        )
+        self._transformation_plan = transformation_plan.TransformationPlan(
+            self._transformation_functions
+        )
+
+        self._prepared_statement_engine = None
+        if password is None:
+            self._set_mysql_connection(options=options)
+        else:
+            self._online_connector_url = state["online_connector_url"]
+            self._online_connection_options = dict(
+                state["online_connection"], password=password
+            )
+            if self._external != state["external"]:
+                self._online_connection_options["url"] = util.get_online_connection_url(
+                    self._online_connector_url, self._external
+                )
+            self._prepared_statement_engine = util.create_mysql_engine_from_options(
+                self._online_connection_options, options=options
+            )
+
+        self._serving_keys = [
+            ServingKey.from_response_json(sk_json) for sk_json in state["serving_keys"]
+        ]
+        self._set_prepared_statements(
+            {
+                batch_mode
+                == "batch": serving_prepared_statement.ServingPreparedStatement.from_response_json(
+                    {"count": len(statements), "items": statements}
+                )
+                for batch_mode, statements in state["prepared_statements"].items()
+            }
+        )
+        self._complex_features = self._get_complex_feature_readers(
+            state["complex_feature_schemas"]
+        )
+
+    def _get_serving_state_entity(self, entity):
+        # a serving state can only be restored for the same schema it was saved for
+        return {
+            "type": type(entity).__name__,
+            "name": entity.name,
+            "version": entity.version,
+            "features": [[f.name, f.type] for f in self._features],
+        }
 
     def _validate_serving_key(self, entry):
         for key in entry:
@@ -229,7 +451,7 @@ class VectorServer:
         serving_vector.update(passed_features)
 
         # apply transformation functions
-        result_dict = self._apply_transformation(serving_vector)
+        result_dict = self._apply_transformation(serving_vector, allow_missing)
 
         vector = self._generate_vector(result_dict, allow_missing)
 
@@ -258,8 +480,10 @@ class VectorServer:
         # for each prepare statement, do a batch look up
         # then concatenate the results
         with self._prepared_statement_engine.connect() as mysql_conn:
-            for prepared_statement_index in self._prepared_statements:
-                prepared_statement = self._prepared_statements[prepared_statement_index]
+            for prepared_statement_index in self._batch_prepared_statements:
+                prepared_statement = self._batch_prepared_statements[
+                    prepared_statement_index
+                ]
                 entry_values_tuples = list(
                     map(
                         lambda e: tuple(
@@ -317,7 +541,9 @@ class VectorServer:
         # apply transformation functions
         batch_transformed = list(
             map(
-                lambda results_dict: self._apply_transformation(results_dict),
+                lambda results_dict: self._apply_transformation(
+                    results_dict, allow_missing
+                ),
                 batch_results,
             )
         )
@@ -344,14 +570,24 @@ class VectorServer:
             )
 
     def get_complex_feature_schemas(self):
+        return self._get_complex_feature_readers(
+            self._get_complex_feature_avro_schemas()
+        )
+
+    def _get_complex_feature_avro_schemas(self):
         return {
-            f.name: avro.io.DatumReader(
-                avro.schema.parse(f._feature_group._get_feature_avro_schema(f.name))
-            )
+            f.name: f._feature_group._get_feature_avro_schema(f.name)
             for f in self._features
             if f.is_complex()
         }
 
+    @staticmethod
+    def _get_complex_feature_readers(avro_schemas):
+        return {
+            feature_name: avro.io.DatumReader(avro.schema.parse(avro_schema))
+            for feature_name, avro_schema in avro_schemas.items()
+        }
+
     def deserialize_complex_features(self, feature_schemas, row_dict):
         for feature_name, schema in feature_schemas.items():
             if feature_name in row_dict:
@@ -365,15 +601,26 @@ class VectorServer:
             with self._prepared_statement_engine.connect():
                 pass
         except exc.OperationalError:
+            # the credentials of the cached online connector may have changed
+            metadata_cache.get_instance().invalidate(
+                metadata_cache.STORAGE_CONNECTOR,
+                self._feature_store_id,
+                "onlinefeaturestore",
+            )
             self._set_mysql_connection()
 
     def _make_preview_statement(self, statement, n):
         return text(statement.text[: statement.text.find(" WHERE ")] + f" LIMIT {n}")
 
-    def _set_mysql_connection(self, options=None):
-        online_conn = self._storage_connector_api.get_online_connector()
-        self._prepared_statement_engine = util.create_mysql_engine(
-            online_conn, self._external, options=options
+    def _set_mysql_connection(self, options=None, online_conn=None):
+        if online_conn is None:
+            online_conn = self._storage_connector_api.get_online_connector()
+        self._online_connector_url = online_conn.spark_options()["url"]
+        self._online_connection_options = util.get_online_connection_options(
+            online_conn, self._external
+        )
+        self._prepared_statement_engine = util.create_mysql_engine_from_options(
+            self._online_connection_options, options=options
         )
 
     def _generate_vector(self, result_dict, fill_na=False):
@@ -394,14 +641,8 @@ class VectorServer:
                 vector.append(result_dict[feature_name])
         return vector
 
-    def _apply_transformation(self, row_dict):
-        for feature_name in self._transformation_functions:
-            if feature_name in row_dict:
-                transformation_fn = self._transformation_functions[
-                    feature_name
-                ].transformation_fn
-                row_dict[feature_name] = transformation_fn(row_dict[feature_name])
-        return row_dict
+    def _apply_transformation(self, row_dict, allow_missing=False):
+        return self._transformation_plan.transform_row(row_dict, allow_missing)
 
     @staticmethod
     def _get_result_key(primary_keys, result_dict):
@@ -459,25 +700,53 @@ class VectorServer:
                     "or `feature_view.init_batch_scoring(version)` to pass the training dataset version."
                     "Training data can be created by `feature_view.create_training_data` or `feature_view.get_training_data`."
                 )
-            td_tffn_stats = self._feature_view_engine._statistics_engine.get_last(
-                entity,
-                for_transformation=True,
-                training_dataset_version=self._training_dataset_version,
-            )
+            td_tffn_stats = self._get_transformation_statistics(entity)
 
         if is_stat_required and td_tffn_stats is None:
             raise ValueError(
                 "No statistics available for initializing transformation functions."
             )
 
+        # kept to be written to the serving state
+        self._transformation_statistics_content = (
+            td_tffn_stats.content if td_tffn_stats is not None else None
+        )
         transformation_fns = (
             self._transformation_function_engine.populate_builtin_attached_fns(
-                transformation_functions,
-                td_tffn_stats.content if td_tffn_stats is not None else None,
+                transformation_functions, self._transformation_statistics_content
             )
         )
         return transformation_fns
 
+    def _get_transformation_statistics(self, entity):
+        # statistics for transformations don't change once the training dataset
+        # is created, they are shared by the serving and batch scoring servers
+        key = (
+            self._feature_store_id,
+            type(entity).__name__,
+            entity.name,
+            entity.version,
+            self._training_dataset_version,
+        )
+        with VectorServer._transformation_statistics_lock:
+            if key in VectorServer._transformation_statistics:
+                return VectorServer._transformation_statistics[key]
+        td_tffn_stats = self._feature_view_engine._statistics_engine.get_last(
+            entity,
+            for_transformation=True,
+            training_dataset_version=self._training_dataset_version,
+        )
+        if td_tffn_stats is not None:
+            with VectorServer._transformation_statistics_lock:
+                VectorServer._transformation_statistics[key] = td_tffn_stats
+        return td_tffn_stats
+
+    @classmethod
+    def invalidate_transformation_statistics(cls):
+        with cls._transformation_statistics_lock:
+            cls._transformation_statistics.clear()
+        encoding_dictionary.EncodingDictionary.invalidate_cache()
+
     @property
     def prepared_statement_engine(self):
         """JDBC connection engine to retrieve connections to online features store from."""
@@ -498,6 +767,18 @@ class VectorServer:
     def prepared_statements(self, prepared_statements):
         self._prepared_statements = prepared_statements
 
+    @property
+    def batch_prepared_statements(self):
+        """The dict object of prepared statements to retrieve batches of vectors, as
+        values and keys as indices of positions in the query for selecting features
+        from feature groups of the training dataset.
+        """
+        return self._batch_prepared_statements
+
+    @batch_prepared_statements.setter
+    def batch_prepared_statements(self, batch_prepared_statements):
+        self._batch_prepared_statements = batch_prepared_statements
+
     @property
     def serving_keys(self):
         """Set of primary key names that is used as keys in input dict object for `get_feature_vector` method."""
@@ -16,32 +16,24 @@
 
 import pandas as pd
 import numpy as np
-import boto3
-import time
 import re
 import ast
 import warnings
 import logging
 import avro
 import socket
-import pyarrow as pa
 import json
-import random
-import uuid
 import decimal
-import numbers
 import math
+import os
+import shutil
+import tempfile
 from datetime import datetime, timezone
-
-import great_expectations as ge
+from functools import partial
 
 from io import BytesIO
-from pyhive import hive
 from urllib.parse import urlparse
 from typing import TypeVar, Optional, Dict, Any
-from confluent_kafka import Producer, KafkaError
-from tqdm.auto import tqdm
-from botocore.response import StreamingBody
 from sqlalchemy import sql
 
 from hsfs import client, feature, util
@@ -50,7 +42,6 @@ from hsfs.client.exceptions import FeatureStoreException
 from hsfs.core import (
     feature_group_api,
     dataset_api,
-    job_api,
     ingestion_job_conf,
     kafka_api,
     statistics_api,
@@ -60,13 +51,16 @@ from hsfs.core import (
     transformation_function_engine,
     arrow_flight_client,
     variable_api,
+    column_profiler,
+    transformation_plan,
+    statistics_engine,
+    training_data_shards,
 )
 from hsfs.constructor import query
 from hsfs.training_dataset_split import TrainingDatasetSplit
-from hsfs.client import exceptions, hopsworks
+from hsfs.client import hopsworks
 from hsfs.feature_group import FeatureGroup
-from thrift.transport.TTransport import TTransportException
-from pyhive.exc import OperationalError
+from hsfs.core.job import Job
 
 from hsfs.storage_connector import StorageConnector
 
@@ -84,9 +78,11 @@ except ImportError:
 
 
 class Engine:
+    # rows per batch when creating training data with the "streaming" read option
+    STREAMING_BATCH_SIZE = 100000
+
     def __init__(self):
         self._dataset_api = dataset_api.DatasetApi()
-        self._job_api = job_api.JobApi()
         self._kafka_api = kafka_api.KafkaApi()
 
         # cache the sql engine which contains the connection pool
@@ -151,6 +147,22 @@ class Engine:
             result_df = Engine.cast_columns(result_df, schema)
         return self._return_dataframe_type(result_df, dataframe_type)
 
+    def _read_query_batches(self, query_obj, read_options, batch_size):
+        """Read the offline result of a query as pandas dataframes of `batch_size` rows."""
+        sql_query, _ = query_obj._prep_read(False, read_options)
+        if arrow_flight_client.get_instance().is_flyingduck_query_object(sql_query):
+            yield from arrow_flight_client.get_instance().read_query_batches(
+                sql_query, batch_size
+            )
+            return
+        with self._create_hive_connection(
+            query_obj._feature_store_name, hive_config=read_options.get("hive_config")
+        ) as hive_conn:
+            # Suppress SQLAlchemy pandas warning
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)
+                yield from pd.read_sql(sql_query, hive_conn, chunksize=batch_size)
+
     def _jdbc(self, sql_query, connector, dataframe_type, read_options, schema=None):
         if self._mysql_online_fs_engine is None:
             self._mysql_online_fs_engine = util.create_mysql_engine(
@@ -186,6 +198,8 @@ class Engine:
         return pd.concat(df_list, ignore_index=True)
 
     def _read_pandas(self, data_format, obj):
+        from botocore.response import StreamingBody
+
         if data_format.lower() == "csv":
             return pd.read_csv(obj)
         elif data_format.lower() == "tsv":
@@ -251,27 +265,44 @@ class Engine:
         return df_list
 
     def _read_s3(self, storage_connector, location, data_format):
-        # get key prefix
-        path_parts = location.replace("s3://", "").split("/")
-        _ = path_parts.pop(0)  # pop first element -> bucket
+        s3 = self._create_s3_client(storage_connector)
 
-        prefix = "/".join(path_parts)
+        df_list = []
+        for key in self._list_s3_keys(s3, storage_connector, location):
+            obj = s3.get_object(
+                Bucket=storage_connector.bucket,
+                Key=key,
+            )
+            df_list.append(self._read_pandas(data_format, obj["Body"]))
+        return df_list
+
+    @staticmethod
+    def _create_s3_client(storage_connector):
+        import boto3
 
         if storage_connector.session_token is not None:
-            s3 = boto3.client(
+            return boto3.client(
                 "s3",
                 aws_access_key_id=storage_connector.access_key,
                 aws_secret_access_key=storage_connector.secret_key,
                 aws_session_token=storage_connector.session_token,
             )
         else:
-            s3 = boto3.client(
+            return boto3.client(
                 "s3",
                 aws_access_key_id=storage_connector.access_key,
                 aws_secret_access_key=storage_connector.secret_key,
             )
 
-        df_list = []
+    @staticmethod
+    def _list_s3_keys(s3, storage_connector, location):
+        # get key prefix
+        path_parts = location.replace("s3://", "").split("/")
+        _ = path_parts.pop(0)  # pop first element -> bucket
+
+        prefix = "/".join(path_parts)
+
+        keys = []
         object_list = {"is_truncated": True}
         while object_list.get("is_truncated", False):
             if "NextContinuationToken" in object_list:
@@ -290,12 +321,70 @@ class Engine:
 
             for obj in object_list["Contents"]:
                 if not obj["Key"].endswith("_SUCCESS") and obj["Size"] > 0:
-                    obj = s3.get_object(
-                        Bucket=storage_connector.bucket,
-                        Key=obj["Key"],
-                    )
-                    df_list.append(self._read_pandas(data_format, obj["Body"]))
-        return df_list
+                    keys.append(obj["Key"])
+        return keys
+
+    def get_file_openers(self, storage_connector, location, read_options={}):
+        """List the data files in `location`, returning for each file a function which
+        opens it as a binary file object.
+
+        Files are only opened, and downloaded if necessary, when their function is
+        called, such that they can be read one at a time. Files on S3, or on HopsFS
+        without pydoop, are downloaded whole into memory when opened.
+
+        The files are sorted by path, such that workers of distributed training shard
+        the same list.
+        """
+        if storage_connector.type == storage_connector.HOPSFS:
+            try:
+                from pydoop import hdfs
+            except ModuleNotFoundError:
+                return self._get_hopsfs_remote_file_openers(location)
+            util.setup_pydoop()
+            return [
+                partial(hdfs.open, path, "rb")
+                for path in sorted(hdfs.ls(location, recursive=True))
+                if hdfs.path.isfile(path)
+                and not path.endswith("_SUCCESS")
+                and hdfs.path.getsize(path) > 0
+            ]
+        elif storage_connector.type == storage_connector.S3:
+            storage_connector.refetch()
+            s3 = self._create_s3_client(storage_connector)
+            return [
+                partial(self._open_s3_file, s3, storage_connector.bucket, key)
+                for key in sorted(self._list_s3_keys(s3, storage_connector, location))
+            ]
+        else:
+            raise NotImplementedError(
+                "{} Storage Connectors for training datasets are not supported yet for external environments.".format(
+                    storage_connector.type
+                )
+            )
+
+    def _get_hopsfs_remote_file_openers(self, location):
+        total_count = 10000
+        offset = 0
+        paths = []
+
+        while offset < total_count:
+            total_count, inode_list = self._dataset_api.list_files(
+                location, offset, 100
+            )
+
+            for inode in inode_list:
+                if not inode.path.endswith("_SUCCESS"):
+                    paths.append(inode.path)
+                offset += 1
+
+        return [partial(self._open_hopsfs_remote_file, path) for path in sorted(paths)]
+
+    def _open_hopsfs_remote_file(self, path):
+        return BytesIO(self._dataset_api.read_content(path).content)
+
+    @staticmethod
+    def _open_s3_file(s3, bucket, key):
+        return BytesIO(s3.get_object(Bucket=bucket, Key=key)["Body"].read())
 
     def read_options(self, data_format, provided_options):
         return provided_options or {}
@@ -355,51 +444,13 @@ class Engine:
         histograms,
         exact_uniqueness=True,
     ):
-        # TODO: add statistics for correlations, histograms and exact_uniqueness
-        if not relevant_columns:
-            stats = df.describe()
-        else:
-            target_cols = [col for col in df.columns if col in relevant_columns]
-            stats = df[target_cols].describe()
-        final_stats = []
-        for col in stats.columns:
-            stats_dict = json.loads(stats[col].to_json())
-            stat = self._convert_pandas_statistics(stats_dict)
-            stat["dataType"] = (
-                "Fractional"
-                if isinstance(stats[col].dtype, type(np.dtype(np.float64)))
-                else "Integral"
+        return (
+            column_profiler.ColumnProfiler(
+                relevant_columns, correlations, histograms, exact_uniqueness
             )
-            stat["isDataTypeInferred"] = "false"
-            stat["column"] = col.split(".")[-1]
-            stat["completeness"] = 1
-            final_stats.append(stat)
-        return json.dumps({"columns": final_stats})
-
-    def _convert_pandas_statistics(self, stat):
-        # For now transformation only need 25th, 50th, 75th percentiles
-        # TODO: calculate properly all percentiles
-        content_dict = {}
-        percentiles = []
-        if "25%" in stat:
-            percentiles = [0] * 100
-            percentiles[24] = stat["25%"]
-            percentiles[49] = stat["50%"]
-            percentiles[74] = stat["75%"]
-        if "mean" in stat:
-            content_dict["mean"] = stat["mean"]
-        if "mean" in stat and "count" in stat:
-            if isinstance(stat["mean"], numbers.Number):
-                content_dict["sum"] = stat["mean"] * stat["count"]
-        if "max" in stat:
-            content_dict["maximum"] = stat["max"]
-        if "std" in stat:
-            content_dict["stdDev"] = stat["std"]
-        if "min" in stat:
-            content_dict["minimum"] = stat["min"]
-        if percentiles:
-            content_dict["approxPercentiles"] = percentiles
-        return content_dict
+            .update(df)
+            .to_json()
+        )
 
     def validate(self, dataframe: pd.DataFrame, expectations, log_activity=True):
         raise NotImplementedError(
@@ -412,6 +463,8 @@ class Engine:
         expectation_suite: TypeVar("ge.core.ExpectationSuite"),
         ge_validate_kwargs: Optional[Dict[Any, Any]] = {},
     ):
+        import great_expectations as ge
+
         report = ge.from_pandas(
             dataframe, expectation_suite=expectation_suite
         ).validate(**ge_validate_kwargs)
@@ -457,6 +510,8 @@ class Engine:
         )
 
     def parse_schema_feature_group(self, dataframe, time_travel_format=None):
+        import pyarrow as pa
+
         arrow_schema = pa.Schema.from_pandas(dataframe)
         features = []
         for feat_name, feat_type in dataframe.dtypes.items():
@@ -542,6 +597,10 @@ class Engine:
     def get_training_data(
         self, training_dataset_obj, feature_view_obj, query_obj, read_options
     ):
+        if read_options and read_options.get("streaming", False):
+            return self._get_training_data_streaming(
+                training_dataset_obj, feature_view_obj, query_obj, read_options
+            )
         if training_dataset_obj.splits:
             return self._prepare_transform_split_df(
                 query_obj, training_dataset_obj, feature_view_obj, read_options
@@ -556,6 +615,8 @@ class Engine:
             )
 
     def split_labels(self, df, labels):
+        if labels and isinstance(df, training_data_shards.TrainingDataShards):
+            return df.drop(labels), df.select(labels)
         if labels:
             labels_df = df[labels]
             df_new = df.drop(columns=labels)
@@ -574,23 +635,13 @@ class Engine:
             training_dataset_obj.splits[0].split_type
             == TrainingDatasetSplit.TIME_SERIES_SPLIT
         ):
-            event_time = query_obj._left_feature_group.event_time
-            if event_time not in [_feature.name for _feature in query_obj.features]:
-                query_obj.append_feature(
-                    query_obj._left_feature_group.__getattr__(event_time)
-                )
-                result_dfs = self._time_series_split(
-                    query_obj.read(read_options=read_option),
-                    training_dataset_obj,
-                    event_time,
-                    drop_event_time=True,
-                )
-            else:
-                result_dfs = self._time_series_split(
-                    query_obj.read(read_options=read_option),
-                    training_dataset_obj,
-                    event_time,
-                )
+            event_time, drop_event_time = self._add_event_time_to_query(query_obj)
+            result_dfs = self._time_series_split(
+                query_obj.read(read_options=read_option),
+                training_dataset_obj,
+                event_time,
+                drop_event_time=drop_event_time,
+            )
         else:
             result_dfs = self._random_split(
                 query_obj.read(read_options=read_option), training_dataset_obj
@@ -610,10 +661,188 @@ class Engine:
 
         return result_dfs
 
+    def _get_training_data_streaming(
+        self, training_dataset_obj, feature_view_obj, query_obj, read_options
+    ):
+        """Create in-memory training data batch by batch, writing it to local parquet
+        shards instead of holding it in memory.
+
+        The first pass assigns the batches of the query result to the splits, writes
+        the untransformed shards and sketches the statistics of the built-in
+        transformation functions on the training split. Once these statistics are
+        known, the second pass transforms the shards one by one and profiles the
+        statistics of the training data. Without transformation functions, the shards
+        of the first pass are final.
+        """
+        path = read_options.get("streaming_dir") or tempfile.mkdtemp(
+            prefix="hsfs_training_data_"
+        )
+        batch_size = read_options.get("streaming_batch_size", self.STREAMING_BATCH_SIZE)
+        splits = training_dataset_obj.splits
+        transformation_functions = training_dataset_obj.transformation_functions
+        split_batch = self._get_streaming_split_fn(training_dataset_obj, query_obj)
+        (
+            builtin_features,
+            label_encoder_features,
+        ) = transformation_function_engine.TransformationFunctionEngine.get_builtin_transformation_features(
+            training_dataset_obj
+        )
+        statistics_split = training_dataset_obj.train_split if splits else None
+
+        # 1st pass: split, write and sketch the untransformed batches
+        split_names = [split.name for split in splits] if splits else [None]
+        writers = {
+            split_name: training_data_shards.TrainingDataShardWriter(
+                self._get_split_path(
+                    os.path.join(path, "raw") if transformation_functions else path,
+                    split_name,
+                )
+            )
+            for split_name in split_names
+        }
+        profilers = {
+            split_name: self._create_statistics_profiler(training_dataset_obj)
+            for split_name in split_names
+        }
+        transformation_profiler = column_profiler.ColumnProfiler(
+            builtin_features, False, True, False
+        )
+        unique_values = {
+            feature_name: pd.Series(dtype="object")
+            for feature_name in label_encoder_features
+        }
+        for batch in self._read_query_batches(query_obj, read_options, batch_size):
+            for split_name, split_df in split_batch(batch).items():
+                if split_name == statistics_split:
+                    if builtin_features:
+                        transformation_profiler.update(split_df)
+                    for feature_name in label_encoder_features:
+                        unique_values[feature_name] = pd.Series(
+                            pd.concat(
+                                [unique_values[feature_name], split_df[feature_name]],
+                                ignore_index=True,
+                            ).unique()
+                        )
+                if not transformation_functions and profilers[split_name]:
+                    profilers[split_name].update(split_df)
+                writers[split_name].write(split_df)
+
+        if not transformation_functions:
+            result = {
+                split_name: writer.close(
+                    profilers[split_name].to_json() if profilers[split_name] else None
+                )
+                for split_name, writer in writers.items()
+            }
+            return result if splits else result[None]
+
+        raw_shards = {
+            split_name: writer.close() for split_name, writer in writers.items()
+        }
+        if builtin_features or label_encoder_features:
+            if len(raw_shards[statistics_split]) == 0:
+                raise FeatureStoreException(
+                    "There is no data in the training data to compute the statistics "
+                    "of the built-in transformation functions for."
+                )
+            transformation_function_engine.TransformationFunctionEngine.populate_builtin_transformation_functions(
+                training_dataset_obj,
+                feature_view_obj,
+                None,
+                stat_content=statistics_engine.StatisticsEngine.add_unique_values(
+                    transformation_profiler.to_json(), unique_values
+                ),
+            )
+
+        # 2nd pass: transform and profile the shards, removing the untransformed ones
+        result = {}
+        for split_name, shards in raw_shards.items():
+            writer = training_data_shards.TrainingDataShardWriter(
+                self._get_split_path(path, split_name)
+            )
+            for shard_path in shards.paths:
+                split_df = self._apply_transformation_function(
+                    transformation_functions, pd.read_parquet(shard_path)
+                )
+                if profilers[split_name]:
+                    profilers[split_name].update(split_df)
+                writer.write(split_df)
+                os.remove(shard_path)
+            if len(shards) == 0:
+                writer.write(pd.DataFrame(columns=shards.columns))
+            result[split_name] = writer.close(
+                profilers[split_name].to_json() if profilers[split_name] else None
+            )
+        shutil.rmtree(os.path.join(path, "raw"), ignore_errors=True)
+        return result if splits else result[None]
+
+    def _get_streaming_split_fn(self, training_dataset_obj, query_obj):
+        """Function assigning a batch of the query result to the splits, returning a
+        dict of split name to dataframe, or `None` to the batch without splits."""
+        splits = training_dataset_obj.splits
+        if not splits:
+            return lambda batch: {None: batch}
+
+        if splits[0].split_type == TrainingDatasetSplit.TIME_SERIES_SPLIT:
+            event_time, drop_event_time = self._add_event_time_to_query(query_obj)
+            return lambda batch: self._time_series_split(
+                batch, training_dataset_obj, event_time, drop_event_time
+            )
+
+        self._check_split_percentages(splits)
+        rng = np.random.default_rng(training_dataset_obj.seed)
+        percentages = [split.percentage for split in splits]
+        # the number of rows is unknown while streaming, instead of shuffling exact
+        # split sizes every row is assigned to a split with its percentage as probability
+        return lambda batch: self._partition_splits(
+            batch, rng.choice(len(splits), size=len(batch), p=percentages), splits
+        )
+
+    @staticmethod
+    def _get_split_path(path, split_name):
+        return os.path.join(path, split_name) if split_name else path
+
+    @staticmethod
+    def _create_statistics_profiler(training_dataset_obj):
+        statistics_config = training_dataset_obj.statistics_config
+        if not statistics_config.enabled:
+            return None
+        return column_profiler.ColumnProfiler(
+            statistics_config.columns,
+            statistics_config.correlations,
+            statistics_config.histograms,
+            statistics_config.exact_uniqueness,
+        )
+
+    @staticmethod
+    def _add_event_time_to_query(query_obj):
+        """Make sure the event time is part of the query for time series splits.
+
+        Returns the event time and whether it has to be dropped after splitting."""
+        event_time = query_obj._left_feature_group.event_time
+        if event_time in [_feature.name for _feature in query_obj.features]:
+            return event_time, False
+        query_obj.append_feature(query_obj._left_feature_group.__getattr__(event_time))
+        return event_time, True
+
     def _random_split(self, df, training_dataset_obj):
-        split_column = f"_SPLIT_INDEX_{uuid.uuid1()}"
-        result_dfs = {}
         splits = training_dataset_obj.splits
+        self._check_split_percentages(splits)
+
+        df_size = len(df)
+        split_sizes = [int(df_size * split.percentage) for split in splits]
+        split_sizes[-1] += df_size - sum(split_sizes)
+        # assign the split index of each row by shuffling the indices instead of the rows
+        split_indices = np.random.default_rng(training_dataset_obj.seed).permutation(
+            np.repeat(
+                np.arange(len(splits), dtype=self._split_index_dtype(splits)),
+                split_sizes,
+            )
+        )
+        return self._partition_splits(df, split_indices, splits)
+
+    @staticmethod
+    def _check_split_percentages(splits):
         if (
             not math.isclose(
                 sum([split.percentage for split in splits]), 1
@@ -625,40 +854,73 @@ class Engine:
                 "Sum of split ratios should be 1 and each values should be in range (0, 1)"
             )
 
-        df_size = len(df)
-        groups = []
-        for i, split in enumerate(splits):
-            groups += [i] * int(df_size * split.percentage)
-        groups += [len(splits) - 1] * (df_size - len(groups))
-        random.shuffle(groups)
-        df[split_column] = groups
-        for i, split in enumerate(splits):
-            split_df = df[df[split_column] == i].drop(split_column, axis=1)
-            result_dfs[split.name] = split_df
-        return result_dfs
-
     def _time_series_split(
         self, df, training_dataset_obj, event_time, drop_event_time=False
     ):
+        splits = training_dataset_obj.splits
+        timestamps = util.convert_event_time_column_to_timestamp(df[event_time])
+        columns = [column for column in df.columns if column != event_time]
+
+        ordered_splits = sorted(
+            range(len(splits)), key=lambda index: splits[index].start_time
+        )
+        bounds = np.array(
+            [
+                bound
+                for index in ordered_splits
+                for bound in (splits[index].start_time, splits[index].end_time)
+            ],
+            dtype="float64",
+        )
+        if np.all(bounds[1:] >= bounds[:-1]):
+            # an event time at an odd position is within [start_time, end_time) of a
+            # split, missing event times are sorted to the end
+            positions = np.searchsorted(bounds, timestamps, side="right")
+            split_indices = np.where(
+                positions % 2 == 1,
+                np.array(ordered_splits)[np.minimum(positions // 2, len(splits) - 1)],
+                -1,
+            ).astype(self._split_index_dtype(splits))
+            return self._partition_splits(
+                df, split_indices, splits, columns if drop_event_time else None
+            )
+
+        # overlapping splits can share rows, so they are filtered one by one
         result_dfs = {}
-        for split in training_dataset_obj.splits:
-            if len(df[event_time]) > 0:
-                result_df = df[
-                    [
-                        split.start_time
-                        <= util.convert_event_time_to_timestamp(t)
-                        < split.end_time
-                        for t in df[event_time]
-                    ]
-                ]
-            else:
-                # if df[event_time] is empty, it returns an empty dataframe
-                result_df = df
-            if drop_event_time:
-                result_df = result_df.drop([event_time], axis=1)
-            result_dfs[split.name] = result_df
+        for split in splits:
+            rows = np.flatnonzero(
+                (split.start_time <= timestamps) & (timestamps < split.end_time)
+            )
+            result_dfs[split.name] = self._take_split(
+                df, rows, columns if drop_event_time else None
+            )
         return result_dfs
 
+    @staticmethod
+    def _split_index_dtype(splits):
+        # -1 marks rows which are not part of any split
+        return np.min_scalar_type(-len(splits))
+
+    def _partition_splits(self, df, split_indices, splits, columns=None):
+        # one stable sort groups the rows of each split while keeping their order,
+        # each split is then a single take of the source dataframe
+        order = np.argsort(split_indices, kind="stable")
+        offsets = np.cumsum(
+            np.bincount(split_indices.astype("int64") + 1, minlength=len(splits) + 1)
+        )
+        return {
+            split.name: self._take_split(
+                df, order[offsets[i] : offsets[i + 1]], columns
+            )
+            for i, split in enumerate(splits)
+        }
+
+    @staticmethod
+    def _take_split(df, rows, columns=None):
+        if columns is None:
+            return df.iloc[rows]
+        return df.iloc[rows, [df.columns.get_loc(column) for column in columns]]
+
     def write_training_dataset(
         self,
         training_dataset,
@@ -673,14 +935,18 @@ class Engine:
                 "Currently only query based training datasets are supported by the Python engine"
             )
 
-        if (
-            arrow_flight_client.get_instance().is_query_supported(
-                dataset, user_write_options
-            )
-            and len(training_dataset.splits) == 0
-            and len(training_dataset.transformation_functions) == 0
-            and training_dataset.data_format == "parquet"
+        if arrow_flight_client.get_instance().is_query_supported(
+            dataset, user_write_options
+        ) and arrow_flight_client.get_instance().is_training_dataset_supported(
+            training_dataset, user_write_options
         ):
+            event_time, drop_event_time = None, False
+            if (
+                training_dataset.splits
+                and training_dataset.splits[0].split_type
+                == TrainingDatasetSplit.TIME_SERIES_SPLIT
+            ):
+                event_time, drop_event_time = self._add_event_time_to_query(dataset)
             query_obj, _ = dataset._prep_read(False, user_write_options)
             response = util.run_with_loading_animation(
                 "Materializing data to Hopsworks, using ArrowFlight",
@@ -688,8 +954,28 @@ class Engine:
                 feature_view_obj,
                 training_dataset,
                 query_obj,
+                event_time,
+                drop_event_time,
             )
 
+            if response and training_dataset.transformation_functions:
+                transformation_statistics = json.loads(response).get(
+                    "transformation_statistics"
+                )
+                if transformation_statistics is None:
+                    raise FeatureStoreException(
+                        "The response of the ArrowFlight server to creating the training"
+                        " dataset misses the field `transformation_statistics`."
+                    )
+                # register the statistics the server computed on the train split,
+                # such that the same transformations are applied when serving
+                transformation_function_engine.TransformationFunctionEngine.populate_builtin_transformation_functions(
+                    training_dataset,
+                    feature_view_obj,
+                    None,
+                    stat_content=json.dumps(transformation_statistics),
+                )
+
             return response
 
         # As for creating a feature group, users have the possibility of passing
@@ -729,6 +1015,10 @@ class Engine:
         return td_job
 
     def _create_hive_connection(self, feature_store, hive_config=None):
+        from pyhive import hive
+        from pyhive.exc import OperationalError
+        from thrift.transport.TTransport import TTransportException
+
         host = variable_api.VariableApi().get_loadbalancer_external_domain()
         if host == "":
             # If the load balancer is not configured, then fall back to use
@@ -826,26 +1116,14 @@ class Engine:
             spark_job_configuration=spark_job_configuration,
         )
 
-    def wait_for_job(self, job, await_termination=True):
+    def wait_for_job(self, job, await_termination=True, timeout=None):
         # If the user passed the wait_for_job option consider it,
         # otherwise use the default True
-        while await_termination:
-            executions = self._job_api.last_execution(job)
-            if len(executions) > 0:
-                execution = executions[0]
-            else:
-                return
-
-            if execution.final_status.lower() == "succeeded":
-                return
-            elif execution.final_status.lower() == "failed":
-                raise exceptions.FeatureStoreException(
-                    "The Hopsworks Job failed, use the Hopsworks UI to access the job logs"
-                )
-            elif execution.final_status.lower() == "killed":
-                raise exceptions.FeatureStoreException("The Hopsworks Job was stopped")
+        if await_termination:
+            self.wait_for_jobs([job], timeout=timeout)
 
-            time.sleep(3)
+    def wait_for_jobs(self, jobs, timeout=None):
+        Job.wait_for_jobs(jobs, timeout=timeout)
 
     def add_file(self, file):
         # if streaming connectors are implemented in the future, this method
@@ -853,13 +1131,13 @@ class Engine:
         return file
 
     def _apply_transformation_function(self, transformation_functions, dataset):
+        dataset = transformation_plan.TransformationPlan(
+            transformation_functions
+        ).transform_dataframe(dataset)
         for (
             feature_name,
             transformation_fn,
         ) in transformation_functions.items():
-            dataset[feature_name] = dataset[feature_name].map(
-                transformation_fn.transformation_fn
-            )
             offline_type = Engine.convert_spark_type_to_offline_type(
                 transformation_fn.output_type
             )
@@ -874,6 +1152,8 @@ class Engine:
         return feature_dataframe[feature_name].unique()
 
     def _init_kafka_resources(self, feature_group, offline_write_options):
+        from confluent_kafka import Producer
+
         # setup kafka producer
         producer = Producer(self._get_kafka_config(offline_write_options))
 
@@ -895,6 +1175,9 @@ class Engine:
         dataframe: pd.DataFrame,
         offline_write_options: dict,
     ):
+        from confluent_kafka import KafkaError
+        from tqdm.auto import tqdm
+
         reset_offsets = False
         if feature_group._multi_part_insert:
             if feature_group._kafka_producer is None:
@@ -1176,6 +1459,8 @@ class Engine:
 
     @staticmethod
     def _convert_pandas_object_type_to_offline_type(arrow_type):
+        import pyarrow as pa
+
         if pa.types.is_list(arrow_type):
             # figure out sub type
             sub_arrow_type = arrow_type.value_type
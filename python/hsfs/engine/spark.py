@@ -19,7 +19,10 @@ import json
 import copy
 import importlib.util
 import re
+import uuid
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Optional, TypeVar
 
 import numpy as np
@@ -33,7 +36,7 @@ import tzlocal
 
 try:
     import pyspark
-    from pyspark import SparkFiles
+    from pyspark import SparkFiles, StorageLevel
     from pyspark.sql import SparkSession, DataFrame, SQLContext
     from pyspark.rdd import RDD
     from pyspark.sql.functions import (
@@ -44,6 +47,16 @@ try:
         array,
         from_json,
         udf,
+        pandas_udf,
+        when,
+        datediff,
+        length,
+        regexp_replace,
+        to_date,
+        to_timestamp,
+        raise_error,
+        broadcast,
+        coalesce,
     )
     from pyspark.sql.avro.functions import from_avro, to_avro
     from pyspark.sql.types import (
@@ -78,17 +91,16 @@ from hsfs.feature_group import ExternalFeatureGroup, SpineGroup
 from hsfs.storage_connector import StorageConnector
 from hsfs.client.exceptions import FeatureStoreException
 from hsfs.client import hopsworks
-from hsfs.core import hudi_engine, transformation_function_engine, kafka_api
+from hsfs.core import (
+    hudi_engine,
+    transformation_function_engine,
+    transformation_plan,
+    kafka_api,
+)
+from hsfs.core.builtin_transformation_function import BuiltInTransformationFunction
 from hsfs.constructor import query
 from hsfs.training_dataset_split import TrainingDatasetSplit
 
-from great_expectations.core.batch import RuntimeBatchRequest
-from great_expectations.data_context import BaseDataContext
-from great_expectations.data_context.types.base import (
-    DataContextConfig,
-    InMemoryStoreBackendDefaults,
-)
-
 
 class Engine:
     HIVE_FORMAT = "hive"
@@ -97,6 +109,20 @@ class Engine:
     APPEND = "append"
     OVERWRITE = "overwrite"
 
+    # spark datetime patterns of the normalized event time strings by their length,
+    # matching the formats of `util.check_timestamp_format_from_date_string`
+    EVENT_TIME_STRING_PATTERNS = {
+        8: "yyyyMMdd",
+        10: "yyyyMMddHH",
+        12: "yyyyMMddHHmm",
+        14: "yyyyMMddHHmmss",
+        17: "yyyyMMddHHmmssSSS",
+        22: "yyyyMMdd'T'HHmmssSSSSSS'Z'",
+    }
+    SPLIT_COLUMN = "__hsfs_split"
+    DUAL_WRITE_STORAGE_LEVEL = "MEMORY_AND_DISK"
+    DUAL_WRITE_OPTIONS = ["persist", "persist_storage_level", "concurrent_write"]
+
     def __init__(self):
         self._spark_session = SparkSession.builder.enableHiveSupport().getOrCreate()
         self._spark_context = self._spark_session.sparkContext
@@ -280,6 +306,14 @@ class Engine:
         online_write_options,
         validation_id=None,
     ):
+        # the options of the dual write are not passed on to the writers
+        dual_write_options = {
+            key: value
+            for key, value in (offline_write_options or {}).items()
+            if key in self.DUAL_WRITE_OPTIONS
+        }
+        offline_write_options = self._remove_dual_write_options(offline_write_options)
+        online_write_options = self._remove_dual_write_options(online_write_options)
         try:
             if (
                 isinstance(feature_group, ExternalFeatureGroup)
@@ -302,18 +336,26 @@ class Engine:
                         feature_group, dataframe, online_write_options
                     )
                 elif online_enabled and storage is None:
-                    self._save_offline_dataframe(
+                    self._save_offline_and_online_dataframe(
                         feature_group,
                         dataframe,
                         operation,
                         offline_write_options,
-                    )
-                    self._save_online_dataframe(
-                        feature_group, dataframe, online_write_options
+                        online_write_options,
+                        dual_write_options,
                     )
         except Exception as e:
             raise FeatureStoreException(e).with_traceback(e.__traceback__)
 
+    def _remove_dual_write_options(self, write_options):
+        if write_options is None:
+            return None
+        return {
+            key: value
+            for key, value in write_options.items()
+            if key not in self.DUAL_WRITE_OPTIONS
+        }
+
     def save_stream_dataframe(
         self,
         feature_group,
@@ -376,8 +418,8 @@ class Engine:
                 feature_group.feature_store_id,
                 feature_group.feature_store_name,
                 feature_group,
-                self._spark_session,
                 self._spark_context,
+                self._spark_session,
             )
 
             hudi_engine_instance.save_hudi_fg(
@@ -392,6 +434,54 @@ class Engine:
                 feature_group._get_table_name()
             )
 
+    def _save_offline_and_online_dataframe(
+        self,
+        feature_group,
+        dataframe,
+        operation,
+        offline_write_options,
+        online_write_options,
+        dual_write_options,
+    ):
+        """Write the dataframe to the offline and the online feature store.
+
+        The dataframe is persisted, such that its lineage is computed once for both
+        writes instead of once per write. The online write starts once the offline
+        write succeeded, unless the writes are configured to run concurrently.
+        """
+        persist = dual_write_options.get("persist", True)
+        storage_level = dual_write_options.get(
+            "persist_storage_level", self.DUAL_WRITE_STORAGE_LEVEL
+        )
+        concurrent = dual_write_options.get("concurrent_write", False)
+
+        if persist:
+            dataframe = dataframe.persist(getattr(StorageLevel, storage_level))
+
+        def save_offline():
+            self._save_offline_dataframe(
+                feature_group, dataframe, operation, offline_write_options
+            )
+
+        def save_online():
+            self._save_online_dataframe(feature_group, dataframe, online_write_options)
+
+        try:
+            if concurrent:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    futures = [
+                        executor.submit(save_offline),
+                        executor.submit(save_online),
+                    ]
+                    for future in futures:
+                        future.result()
+            else:
+                save_offline()
+                save_online()
+        finally:
+            if persist:
+                dataframe.unpersist()
+
     def _save_online_dataframe(self, feature_group, dataframe, write_options):
         write_options = self._get_kafka_config(write_options)
 
@@ -508,48 +598,66 @@ class Engine:
                 to_df=to_df,
             )
         else:
-            split_dataset = self._split_df(
+            dataset, split_dataset = self._split_df(
                 query_obj, training_dataset, read_options=read_options
             )
-            for key in split_dataset:
-                if training_dataset.coalesce:
+            if training_dataset.coalesce:
+                for key in split_dataset:
                     split_dataset[key] = split_dataset[key].coalesce(1)
 
-                split_dataset[key] = split_dataset[key].cache()
-
             transformation_function_engine.TransformationFunctionEngine.populate_builtin_transformation_functions(
                 training_dataset, feature_view_obj, split_dataset
             )
-            return self._write_training_dataset_splits(
-                training_dataset, split_dataset, write_options, save_mode, to_df=to_df
-            )
+            try:
+                split_dataset = self._write_training_dataset_splits(
+                    training_dataset,
+                    split_dataset,
+                    write_options,
+                    save_mode,
+                    to_df=to_df,
+                )
+                if to_df:
+                    # returned splits are cached and computed while the dataset is
+                    # still persisted, such that the query is executed only once.
+                    # Their cache is released by the caller with `unpersist()`.
+                    for key in split_dataset:
+                        split_dataset[key] = split_dataset[key].cache()
+                        split_dataset[key].count()
+                return split_dataset
+            finally:
+                dataset.unpersist()
 
     def _split_df(self, query_obj, training_dataset, read_options={}):
-        if (
+        """Split the dataset of the query into the splits of the training dataset.
+
+        The dataset is read once and persisted, such that the joins of the query are
+        executed once instead of for every split, and for computing the statistics
+        of the splits. Returns the persisted dataset, to be unpersisted by the caller
+        once the splits are written or cached, and the dictionary of splits.
+        """
+        is_time_series_split = (
             training_dataset.splits[0].split_type
             == TrainingDatasetSplit.TIME_SERIES_SPLIT
-        ):
+        )
+        drop_event_time = False
+        if is_time_series_split:
             event_time = query_obj._left_feature_group.event_time
             if event_time not in [_feature.name for _feature in query_obj.features]:
                 query_obj.append_feature(
                     query_obj._left_feature_group.__getattr__(event_time)
                 )
-                return self._time_series_split(
-                    training_dataset,
-                    query_obj.read(read_options=read_options),
-                    event_time,
-                    drop_event_time=True,
-                )
-            else:
-                return self._time_series_split(
-                    training_dataset,
-                    query_obj.read(read_options=read_options),
-                    event_time,
-                )
-        else:
-            return self._random_split(
-                query_obj.read(read_options=read_options), training_dataset
+                drop_event_time = True
+
+        dataset = query_obj.read(read_options=read_options).persist()
+        if is_time_series_split:
+            return dataset, self._time_series_split(
+                training_dataset,
+                dataset,
+                event_time,
+                drop_event_time=drop_event_time,
             )
+        else:
+            return dataset, self._random_split(dataset, training_dataset)
 
     def _random_split(self, dataset, training_dataset):
         splits = [(split.name, split.percentage) for split in training_dataset.splits]
@@ -560,22 +668,91 @@ class Engine:
     def _time_series_split(
         self, training_dataset, dataset, event_time, drop_event_time=False
     ):
-        # registering the UDF
-        _convert_event_time_to_timestamp = udf(
-            util.convert_event_time_to_timestamp, LongType()
-        )
+        ts_col = self._convert_event_time_to_timestamp(dataset, event_time)
+        if self._time_series_splits_overlap(training_dataset.splits):
+            # overlapping splits can share rows, so they are filtered one by one
+            result_dfs = {}
+            for split in training_dataset.splits:
+                result_df = dataset.filter(ts_col >= split.start_time).filter(
+                    ts_col < split.end_time
+                )
+                if drop_event_time:
+                    result_df = result_df.drop(event_time)
+                result_dfs[split.name] = result_df
+            return result_dfs
+
+        # assign the split of each row in a single projection, such that the event
+        # time is converted once per row instead of twice per split
+        split_col = None
+        for split in training_dataset.splits:
+            condition = (ts_col >= split.start_time) & (ts_col < split.end_time)
+            split_col = (
+                when(condition, split.name)
+                if split_col is None
+                else split_col.when(condition, split.name)
+            )
+        dataset = dataset.withColumn(self.SPLIT_COLUMN, split_col)
 
         result_dfs = {}
-        ts_col = _convert_event_time_to_timestamp(col(event_time))
         for split in training_dataset.splits:
-            result_df = dataset.filter(ts_col >= split.start_time).filter(
-                ts_col < split.end_time
+            result_df = dataset.filter(col(self.SPLIT_COLUMN) == split.name).drop(
+                self.SPLIT_COLUMN
             )
             if drop_event_time:
                 result_df = result_df.drop(event_time)
             result_dfs[split.name] = result_df
         return result_dfs
 
+    @staticmethod
+    def _time_series_splits_overlap(splits):
+        ordered_splits = sorted(splits, key=lambda split: split.start_time)
+        return any(
+            split.start_time < previous_split.end_time
+            for previous_split, split in zip(ordered_splits, ordered_splits[1:])
+        )
+
+    def _convert_event_time_to_timestamp(self, dataset, event_time):
+        """Convert the event time column to unix epoch time in milliseconds.
+
+        Spark expressions equivalent to `util.convert_event_time_to_timestamp` are
+        used for the supported column types, which are evaluated by the JVM instead
+        of Python workers. Event times are interpreted in UTC, the session time zone.
+        """
+        event_time_col = col(event_time)
+        event_time_type = dataset.schema[event_time].dataType
+        if isinstance(event_time_type, TimestampType):
+            return (event_time_col.cast(DoubleType()) * 1000).cast(LongType())
+        elif isinstance(event_time_type, DateType):
+            return datediff(event_time_col, to_date(lit("1970-01-01"))).cast(
+                LongType()
+            ) * (24 * 60 * 60 * 1000)
+        elif isinstance(event_time_type, (ByteType, ShortType, IntegerType, LongType)):
+            # epoch times of up to 10 digits are in seconds
+            event_time_col = event_time_col.cast(LongType())
+            return when(
+                event_time_col == 0,
+                raise_error("Event time should be greater than 0."),
+            ).otherwise(
+                when(event_time_col < 10**10, event_time_col * 1000).otherwise(
+                    event_time_col
+                )
+            )
+        elif isinstance(event_time_type, StringType):
+            normalized_col = regexp_replace(event_time_col, "[/\\- :.]", "")
+            timestamp_col = None
+            for pattern_length, pattern in self.EVENT_TIME_STRING_PATTERNS.items():
+                condition = length(normalized_col) == pattern_length
+                value = to_timestamp(normalized_col, pattern)
+                timestamp_col = (
+                    when(condition, value)
+                    if timestamp_col is None
+                    else timestamp_col.when(condition, value)
+                )
+            return (timestamp_col.cast(DoubleType()) * 1000).cast(LongType())
+
+        # fall back to the python implementation for other types
+        return udf(util.convert_event_time_to_timestamp, LongType())(event_time_col)
+
     def _write_training_dataset_splits(
         self,
         training_dataset,
@@ -745,6 +922,13 @@ class Engine:
         expectation_suite: TypeVar("ge.core.ExpectationSuite"),  # noqa: F821
         ge_validate_kwargs: Optional[dict],
     ):
+        from great_expectations.core.batch import RuntimeBatchRequest
+        from great_expectations.data_context import BaseDataContext
+        from great_expectations.data_context.types.base import (
+            DataContextConfig,
+            InMemoryStoreBackendDefaults,
+        )
+
         # NOTE: InMemoryStoreBackendDefaults SHOULD NOT BE USED in normal settings. You
         # may experience data loss as it persists nothing. It is used here for testing.
         # Please refer to docs to learn how to instantiate your DataContext.
@@ -806,6 +990,12 @@ class Engine:
             options.update(provided_options)
         return options
 
+    def get_file_openers(self, storage_connector, location, read_options={}):
+        raise NotImplementedError(
+            "Iterating over the files of training datasets is only supported by the "
+            "Python engine, with Spark read the training dataset as dataframe instead."
+        )
+
     def read_options(self, data_format, provided_options):
         if provided_options is None:
             provided_options = {}
@@ -924,66 +1114,228 @@ class Engine:
         )
 
     def _apply_transformation_function(self, transformation_functions, dataset):
-        # generate transformation function expressions
-        transformed_feature_names = []
-        transformation_fn_expressions = []
-        for (
-            feature_name,
-            transformation_fn,
-        ) in transformation_functions.items():
-            fn_registration_name = (
-                transformation_fn.name
-                + "_"
-                + str(transformation_fn.version)
-                + "_"
-                + feature_name
+        plan = transformation_plan.TransformationPlan(transformation_functions)
+        columns = dataset.columns
+
+        # built-in functions are evaluated natively, without python workers
+        transformation_fn_columns = {}
+        vectorized_features = []
+        for feature_name in plan.vectorized_features:
+            transformation_fn = plan.transformation_functions[feature_name]
+            if self._is_label_encoder(transformation_fn):
+                dataset, transformation_fn_columns[feature_name] = self._label_encode(
+                    dataset, feature_name, transformation_fn
+                )
+                continue
+            builtin_column = self._get_builtin_transformation_column(
+                feature_name, transformation_fn
             )
-
-            def timezone_decorator(func):
-                if transformation_fn.output_type != "TIMESTAMP":
-                    return func
-
-                current_timezone = tzlocal.get_localzone()
-
-                def decorated_func(x):
-                    result = func(x)
-                    if isinstance(result, datetime):
-                        if result.tzinfo is None:
-                            # if timestamp is timezone unaware, make sure it's localized to the system's timezone.
-                            # otherwise, spark will implicitly convert it to the system's timezone.
-                            return result.replace(tzinfo=current_timezone)
-                        else:
-                            # convert to utc, then localize to system's timezone
-                            return result.astimezone(timezone.utc).replace(
-                                tzinfo=current_timezone
-                            )
-                    return result
-
-                return decorated_func
-
-            self._spark_session.udf.register(
-                fn_registration_name,
-                timezone_decorator(transformation_fn.transformation_fn),
-                transformation_fn.output_type,
+            if builtin_column is not None:
+                transformation_fn_columns[feature_name] = builtin_column
+            else:
+                vectorized_features.append(feature_name)
+
+        # the remaining functions are fused into one pandas udf for the vectorized
+        # functions and one udf for the per value functions, each returning a struct
+        # with one field per transformed feature
+        fused_udfs = []
+        if vectorized_features:
+            fused_udfs.append(
+                (
+                    vectorized_features,
+                    pandas_udf(
+                        self._fuse_vectorized_transformation_fns(
+                            [
+                                plan.transformation_functions[
+                                    feature_name
+                                ].transformation_fn
+                                for feature_name in vectorized_features
+                            ]
+                        ),
+                        self._get_transformation_struct_type(plan, vectorized_features),
+                    ),
+                )
             )
-            transformation_fn_expressions.append(
-                "{fn_name:}({name:}) AS {name:}".format(
-                    fn_name=fn_registration_name, name=feature_name
+        if plan.per_value_features:
+            fused_udfs.append(
+                (
+                    plan.per_value_features,
+                    udf(
+                        self._fuse_transformation_fns(
+                            [
+                                self._timezone_decorator(
+                                    plan.transformation_functions[feature_name]
+                                )
+                                for feature_name in plan.per_value_features
+                            ]
+                        ),
+                        self._get_transformation_struct_type(
+                            plan, plan.per_value_features
+                        ),
+                    ),
                 )
             )
-            transformed_feature_names.append(feature_name)
 
-        # generate non transformation expressions
-        no_transformation_expr = [
-            "{name:} AS {name:}".format(name=col_name)
-            for col_name in dataset.columns
-            if col_name not in transformed_feature_names
-        ]
+        for features, fused_udf in fused_udfs:
+            struct_name = "_TRANSFORMED_{}".format(uuid.uuid4().hex)
+            # non deterministic, such that the udf isn't evaluated once per field
+            dataset = dataset.withColumn(
+                struct_name,
+                fused_udf.asNondeterministic()(
+                    *[dataset[feature_name] for feature_name in features]
+                ),
+            )
+            for i, feature_name in enumerate(features):
+                transformation_fn_columns[feature_name] = col(
+                    "{}._{}".format(struct_name, i)
+                )
 
         # generate entire expression and execute it
-        transformation_fn_expressions.extend(no_transformation_expr)
-        transformed_dataset = dataset.selectExpr(*transformation_fn_expressions)
-        return transformed_dataset.select(*dataset.columns)
+        return dataset.select(
+            *[
+                transformation_fn_columns[col_name].alias(col_name)
+                if col_name in transformation_fn_columns
+                else dataset[col_name]
+                for col_name in columns
+            ]
+        )
+
+    @staticmethod
+    def _get_transformation_struct_type(plan, features):
+        return "struct<{}>".format(
+            ",".join(
+                "_{}:{}".format(
+                    i, plan.transformation_functions[feature_name].output_type
+                )
+                for i, feature_name in enumerate(features)
+            )
+        )
+
+    @staticmethod
+    def _fuse_transformation_fns(transformation_fns):
+        def transform(*values):
+            return tuple(fn(value) for fn, value in zip(transformation_fns, values))
+
+        return transform
+
+    @staticmethod
+    def _fuse_vectorized_transformation_fns(transformation_fns):
+        def transform(*series):
+            return pd.DataFrame(
+                {
+                    "_{}".format(i): fn(values)
+                    for i, (fn, values) in enumerate(zip(transformation_fns, series))
+                }
+            )
+
+        return transform
+
+    @staticmethod
+    def _timezone_decorator(transformation_fn):
+        func = transformation_fn.transformation_fn
+        if transformation_fn.output_type != "TIMESTAMP":
+            return func
+
+        current_timezone = tzlocal.get_localzone()
+
+        def decorated_func(x):
+            result = func(x)
+            if isinstance(result, datetime):
+                if result.tzinfo is None:
+                    # if timestamp is timezone unaware, make sure it's localized to the system's timezone.
+                    # otherwise, spark will implicitly convert it to the system's timezone.
+                    return result.replace(tzinfo=current_timezone)
+                else:
+                    # convert to utc, then localize to system's timezone
+                    return result.astimezone(timezone.utc).replace(
+                        tzinfo=current_timezone
+                    )
+            return result
+
+        return decorated_func
+
+    @staticmethod
+    def _get_builtin_transformation_column(feature_name, transformation_fn):
+        """Spark SQL expression of a built-in transformation function with its bound
+        statistics, or `None` if the function is not a built-in."""
+        builtin_fn = transformation_fn.vectorized_transformation_fn
+        if not isinstance(builtin_fn, partial):
+            return None
+        args = builtin_fn.keywords
+        feature = col("`{}`".format(feature_name))
+        if builtin_fn.func is BuiltInTransformationFunction.min_max_scaler:
+            center = args["min_value"]
+            scale = args["max_value"] - args["min_value"]
+        elif builtin_fn.func is BuiltInTransformationFunction.standard_scaler:
+            center, scale = args["mean"], args["std_dev"]
+        elif builtin_fn.func is BuiltInTransformationFunction.robust_scaler:
+            center, scale = args["p50"], args["p75"] - args["p25"]
+        else:
+            return None
+
+        shifted = feature.cast("double") - lit(float(center))
+        # a zero range or standard deviation results in 0, as in the python functions
+        scaled = shifted * lit(0.0) if scale == 0 else shifted / lit(float(scale))
+        return scaled.cast(transformation_fn.output_type)
+
+    @staticmethod
+    def _is_label_encoder(transformation_fn):
+        builtin_fn = transformation_fn.vectorized_transformation_fn
+        return (
+            isinstance(builtin_fn, partial)
+            and builtin_fn.func is BuiltInTransformationFunction.label_encoder
+        )
+
+    def _label_encode(self, dataset, feature_name, transformation_fn):
+        """Join the categories of a label encoded feature with their index.
+
+        The categories are joined as a broadcast dataframe instead of a literal map,
+        which keeps the plan small for features with many categories. Values which are
+        not a category fail the job, as the `KeyError` of the python engine.
+        """
+        value_to_index = transformation_fn.vectorized_transformation_fn.keywords[
+            "value_to_index"
+        ]
+        suffix = uuid.uuid4().hex
+        value_col = "_ENCODED_VALUE_{}".format(suffix)
+        index_col = "_ENCODED_INDEX_{}".format(suffix)
+        categories = self._spark_session.createDataFrame(
+            [
+                (
+                    None
+                    if pd.isna(value)
+                    else (value.item() if isinstance(value, np.generic) else value),
+                    int(index),
+                )
+                for value, index in value_to_index.items()
+            ],
+            StructType(
+                [
+                    StructField(value_col, dataset.schema[feature_name].dataType),
+                    StructField(index_col, LongType()),
+                ]
+            ),
+        )
+        # null safe, such that a null category is encoded as well
+        dataset = dataset.join(
+            broadcast(categories),
+            dataset[feature_name].eqNullSafe(categories[value_col]),
+            "left",
+        )
+        encoded = when(
+            col(index_col).isNull(),
+            raise_error(
+                concat(
+                    lit("Value '"),
+                    coalesce(dataset[feature_name].cast(StringType()), lit("null")),
+                    lit(
+                        "' of feature '{}' is not part of the label encoder "
+                        "dictionary.".format(feature_name)
+                    ),
+                )
+            ),
+        ).otherwise(col(index_col))
+        return dataset, encoded.cast(transformation_fn.output_type)
 
     def _setup_gcp_hadoop_conf(self, storage_connector, path):
         PROPERTY_ENCRYPTION_KEY = "fs.gs.encryption.key"
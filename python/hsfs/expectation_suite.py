@@ -15,10 +15,9 @@
 #
 
 import json
-from typing import Optional, Union, List, Dict, Any
+from typing import Optional, Union, List, Dict, Any, TypeVar
 
 import humps
-import great_expectations as ge
 import re
 
 from hsfs import util
@@ -36,7 +35,7 @@ class ExpectationSuite:
         self,
         expectation_suite_name: str,
         expectations: List[
-            Union[ge.core.ExpectationConfiguration, dict, GeExpectation]
+            Union[TypeVar("ge.core.ExpectationConfiguration"), dict, GeExpectation]
         ],
         meta: Dict[str, Any],
         id: Optional[int] = None,
@@ -117,7 +116,7 @@ class ExpectationSuite:
     @classmethod
     def from_ge_type(
         cls,
-        ge_expectation_suite: ge.core.ExpectationSuite,
+        ge_expectation_suite: TypeVar("ge.core.ExpectationSuite"),
         run_validation: bool = True,
         validation_ingestion_policy: str = "ALWAYS",
         id: Optional[int] = None,
@@ -194,7 +193,9 @@ class ExpectationSuite:
     def json(self) -> str:
         return json.dumps(self, cls=util.FeatureStoreEncoder)
 
-    def to_ge_type(self) -> ge.core.ExpectationSuite:
+    def to_ge_type(self) -> TypeVar("ge.core.ExpectationSuite"):
+        import great_expectations as ge
+
         return ge.core.ExpectationSuite(
             expectation_suite_name=self._expectation_suite_name,
             ge_cloud_id=self._ge_cloud_id,
@@ -251,7 +252,10 @@ class ExpectationSuite:
 
     # Emulate GE single expectation api to edit list of expectations
     def _convert_expectation(
-        self, expectation: Union[GeExpectation, ge.core.ExpectationConfiguration, dict]
+        self,
+        expectation: Union[
+            GeExpectation, TypeVar("ge.core.ExpectationConfiguration"), dict
+        ],
     ) -> GeExpectation:
         """
         Convert different representation of expectation to Hopsworks GeExpectation type.
@@ -265,6 +269,8 @@ class ExpectationSuite:
         # Raises
             `TypeError`
         """
+        import great_expectations as ge
+
         if isinstance(expectation, ge.core.ExpectationConfiguration):
             return GeExpectation(**expectation.to_json_dict())
         elif isinstance(expectation, GeExpectation):
@@ -278,7 +284,7 @@ class ExpectationSuite:
 
     def get_expectation(
         self, expectation_id: int, ge_type: bool = True
-    ) -> Union[GeExpectation, ge.core.ExpectationConfiguration]:
+    ) -> Union[GeExpectation, TypeVar("ge.core.ExpectationConfiguration")]:
         """
         Fetch expectation with expectation_id from the backend.
 
@@ -324,9 +330,9 @@ class ExpectationSuite:
 
     def add_expectation(
         self,
-        expectation: Union[GeExpectation, ge.core.ExpectationConfiguration],
+        expectation: Union[GeExpectation, TypeVar("ge.core.ExpectationConfiguration")],
         ge_type: bool = True,
-    ) -> Union[GeExpectation, ge.core.ExpectationConfiguration]:
+    ) -> Union[GeExpectation, TypeVar("ge.core.ExpectationConfiguration")]:
         """
         Append an expectation to the local suite or in the backend if attached to a Feature Group.
 
@@ -392,9 +398,9 @@ class ExpectationSuite:
 
     def replace_expectation(
         self,
-        expectation: Union[GeExpectation, ge.core.ExpectationConfiguration],
+        expectation: Union[GeExpectation, TypeVar("ge.core.ExpectationConfiguration")],
         ge_type: bool = True,
-    ) -> Union[GeExpectation, ge.core.ExpectationConfiguration]:
+    ) -> Union[GeExpectation, TypeVar("ge.core.ExpectationConfiguration")]:
         """
         Update an expectation from the suite locally or from the backend if attached to a Feature Group.
 
@@ -578,7 +584,7 @@ class ExpectationSuite:
     def expectations(
         self,
         expectations: Union[
-            List[ge.core.ExpectationConfiguration],
+            List[TypeVar("ge.core.ExpectationConfiguration")],
             List[GeExpectation],
             List[dict],
             None,
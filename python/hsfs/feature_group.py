@@ -21,7 +21,6 @@ import json
 import warnings
 import pandas as pd
 import numpy as np
-import great_expectations as ge
 import avro.schema
 from typing import Optional, Union, Any, Dict, List, TypeVar, Tuple
 
@@ -704,7 +703,7 @@ class FeatureGroupBase:
 
     def get_expectation_suite(
         self, ge_type: bool = True
-    ) -> Union[ExpectationSuite, ge.core.ExpectationSuite, None]:
+    ) -> Union[ExpectationSuite, TypeVar("ge.core.ExpectationSuite"), None]:
         """Return the expectation suite attached to the feature group if it exists.
 
         !!! example
@@ -740,11 +739,11 @@ class FeatureGroupBase:
 
     def save_expectation_suite(
         self,
-        expectation_suite: Union[ExpectationSuite, ge.core.ExpectationSuite],
+        expectation_suite: Union[ExpectationSuite, TypeVar("ge.core.ExpectationSuite")],
         run_validation: bool = True,
         validation_ingestion_policy: str = "ALWAYS",
         overwrite: bool = False,
-    ) -> Union[ExpectationSuite, ge.core.ExpectationSuite]:
+    ) -> Union[ExpectationSuite, TypeVar("ge.core.ExpectationSuite")]:
         """Attach an expectation suite to a feature group and saves it for future use. If an expectation
         suite is already attached, it is replaced. Note that the provided expectation suite is modified
         inplace to include expectationId fields.
@@ -772,6 +771,8 @@ class FeatureGroupBase:
         # Raises
             `hsfs.client.exceptions.RestAPIError`.
         """
+        import great_expectations as ge
+
         if isinstance(expectation_suite, ge.core.ExpectationSuite):
             tmp_expectation_suite = ExpectationSuite.from_ge_type(
                 ge_expectation_suite=expectation_suite,
@@ -827,7 +828,9 @@ class FeatureGroupBase:
 
     def get_latest_validation_report(
         self, ge_type: bool = True
-    ) -> Union[ValidationReport, ge.core.ExpectationSuiteValidationResult, None]:
+    ) -> Union[
+        ValidationReport, TypeVar("ge.core.ExpectationSuiteValidationResult"), None
+    ]:
         """Return the latest validation report attached to the Feature Group if it exists.
 
         !!! example
@@ -856,7 +859,9 @@ class FeatureGroupBase:
 
     def get_all_validation_reports(
         self, ge_type: bool = True
-    ) -> List[Union[ValidationReport, ge.core.ExpectationSuiteValidationResult]]:
+    ) -> List[
+        Union[ValidationReport, TypeVar("ge.core.ExpectationSuiteValidationResult")]
+    ]:
         """Return the latest validation report attached to the feature group if it exists.
 
         !!! example
@@ -894,11 +899,13 @@ class FeatureGroupBase:
         validation_report: Union[
             dict,
             ValidationReport,
-            ge.core.expectation_validation_result.ExpectationSuiteValidationResult,
+            TypeVar(
+                "ge.core.expectation_validation_result.ExpectationSuiteValidationResult"
+            ),
         ],
         ingestion_result: str = "UNKNOWN",
         ge_type: bool = True,
-    ) -> Union[ValidationReport, ge.core.ExpectationSuiteValidationResult]:
+    ) -> Union[ValidationReport, TypeVar("ge.core.ExpectationSuiteValidationResult")]:
         """Save validation report to hopsworks platform along previous reports of the same Feature Group.
 
         !!! example
@@ -931,6 +938,8 @@ class FeatureGroupBase:
         # Raises
             `hsfs.client.exceptions.RestAPIError`.
         """
+        import great_expectations as ge
+
         if self._id:
             if isinstance(
                 validation_report,
@@ -964,7 +973,9 @@ class FeatureGroupBase:
         end_validation_time: Union[str, int, datetime, date, None] = None,
         filter_by: List[str] = [],
         ge_type: bool = True,
-    ) -> Union[List[ValidationResult], List[ge.core.ExpectationValidationResult]]:
+    ) -> Union[
+        List[ValidationResult], List[TypeVar("ge.core.ExpectationValidationResult")]
+    ]:
         """Fetch validation history of an Expectation specified by its id.
 
         !!! example
@@ -1023,7 +1034,9 @@ class FeatureGroupBase:
         validation_options: Optional[Dict[Any, Any]] = {},
         ingestion_result: str = "UNKNOWN",
         ge_type: bool = True,
-    ) -> Union[ge.core.ExpectationSuiteValidationResult, ValidationReport, None]:
+    ) -> Union[
+        TypeVar("ge.core.ExpectationSuiteValidationResult"), ValidationReport, None
+    ]:
         """Run validation based on the attached expectations.
 
         Runs any expectation attached with Deequ. But also runs attached Great Expectation
@@ -1252,9 +1265,11 @@ class FeatureGroupBase:
     def expectation_suite(
         self,
         expectation_suite: Union[
-            ExpectationSuite, ge.core.ExpectationSuite, dict, None
+            ExpectationSuite, TypeVar("ge.core.ExpectationSuite"), dict, None
         ],
     ):
+        import great_expectations as ge
+
         if isinstance(expectation_suite, ExpectationSuite):
             tmp_expectation_suite = expectation_suite.to_json_dict(decamelize=True)
             tmp_expectation_suite["feature_group_id"] = self._id
@@ -1407,6 +1422,7 @@ class FeatureGroup(FeatureGroupBase):
         self._deltastreamer_jobconf = delta_streamer_job_conf
 
         self._materialization_job = None
+        self._last_commit = None
 
         if self._id:
             # initialized by backend
@@ -1523,6 +1539,8 @@ class FeatureGroup(FeatureGroupBase):
                 * key `"pandas_types"` and value `True` to retrieve columns as
                   [Pandas nullable types](https://pandas.pydata.org/docs/user_guide/integer_na.html)
                   rather than numpy/object(string) types (experimental).
+                * key `"use_result_cache"` and value `True` to cache the result on the
+                  local file system until the feature group has a new commit.
                 Defaults to `{}`.
 
         # Returns
@@ -1677,6 +1695,29 @@ class FeatureGroup(FeatureGroupBase):
                   connectivity from you Python environment to the internal advertised
                   listeners of the Hopsworks Kafka Cluster. Defaults to `False` and
                   will use external listeners when connecting from outside of Hopsworks.
+                * key `incremental_statistics` and value `True` or `False` to compute the
+                  statistics of the written dataframe in the client, together with mergeable
+                  sketches which are stored with the statistics. Defaults to `False`.
+                When using the `spark` engine, write_options can contain the following
+                entries:
+                * key `hudi_auto_tuning` and value `True` or `False` to configure whether
+                  the shuffle parallelism, the file sizes and the bulk insert sort mode of
+                  HUDI writes are tuned to the size of the dataframe. Defaults to `True`.
+                  HUDI options provided as write options take precedence. The options a
+                  commit was written with are available from `last_commit.write_options`.
+                When using the `spark` engine and writing to an online enabled feature
+                group, write_options can contain the following entries:
+                * key `persist` and value `True` or `False` to configure whether the
+                  dataframe is persisted, such that it is computed once for the offline
+                  and the online write. Defaults to `True`.
+                * key `persist_storage_level` and value the name of the Spark
+                  `StorageLevel` used to persist the dataframe, defaults to
+                  `"MEMORY_AND_DISK"`.
+                * key `concurrent_write` and value `True` or `False` to configure
+                  whether the offline and the online write run concurrently. If the
+                  offline write fails, the online write may already be committed.
+                  Defaults to `False`, the online write starts after the offline
+                  write succeeded.
             validation_options: Additional validation options as key-value pairs, defaults to `{}`.
                 * key `run_validation` boolean value, set to `False` to skip validation temporarily on ingestion.
                 * key `save_report` boolean value, set to `False` to skip upload of the validation report to Hopsworks.
@@ -1736,6 +1777,10 @@ class FeatureGroup(FeatureGroupBase):
             # Only compute statistics if the engine is Spark.
             # For Python engine, the computation happens in the Hopsworks application
             self._statistics_engine.compute_statistics(self, feature_dataframe)
+        elif self._use_incremental_statistics(write_options, ge_report):
+            self._compute_incremental_statistics(
+                feature_dataframe, fg_job, write_options, overwrite=True
+            )
         if user_version is None:
             warnings.warn(
                 "No version provided for creating feature group `{}`, incremented version to `{}`.".format(
@@ -1859,6 +1904,34 @@ class FeatureGroup(FeatureGroupBase):
                   connectivity from you Python environment to the internal advertised
                   listeners of the Hopsworks Kafka Cluster. Defaults to `False` and
                   will use external listeners when connecting from outside of Hopsworks.
+                * key `incremental_statistics` and value `True` or `False` to compute the
+                  statistics of the inserted dataframe in the client and merge them with the
+                  sketches stored with the previous statistics, instead of recomputing the
+                  statistics over the entire feature group. Updated or deleted records are not
+                  subtracted from the sketches, call `compute_statistics()` to recompute the
+                  statistics in full. If no sketches are stored yet, the feature group is read
+                  once, which requires waiting for the materialization job, otherwise the
+                  statistics are skipped. Defaults to `False`.
+                When using the `spark` engine, write_options can contain the following
+                entries:
+                * key `hudi_auto_tuning` and value `True` or `False` to configure whether
+                  the shuffle parallelism, the file sizes and the bulk insert sort mode of
+                  HUDI writes are tuned to the size of the dataframe. Defaults to `True`.
+                  HUDI options provided as write options take precedence. The options a
+                  commit was written with are available from `last_commit.write_options`.
+                When using the `spark` engine and writing to an online enabled feature
+                group, write_options can contain the following entries:
+                * key `persist` and value `True` or `False` to configure whether the
+                  dataframe is persisted, such that it is computed once for the offline
+                  and the online write. Defaults to `True`.
+                * key `persist_storage_level` and value the name of the Spark
+                  `StorageLevel` used to persist the dataframe, defaults to
+                  `"MEMORY_AND_DISK"`.
+                * key `concurrent_write` and value `True` or `False` to configure
+                  whether the offline and the online write run concurrently. If the
+                  offline write fails, the online write may already be committed.
+                  Defaults to `False`, the online write starts after the offline
+                  write succeeded.
             validation_options: Additional validation options as key-value pairs, defaults to `{}`.
                 * key `run_validation` boolean value, set to `False` to skip validation temporarily on ingestion.
                 * key `save_report` boolean value, set to `False` to skip upload of the validation report to Hopsworks.
@@ -1905,6 +1978,12 @@ class FeatureGroup(FeatureGroupBase):
             # Only compute statistics if the engine is Spark,
             # if Python, the statistics are computed by the application doing the insert
             self.compute_statistics()
+        elif storage != "online" and self._use_incremental_statistics(
+            write_options, ge_report
+        ):
+            self._compute_incremental_statistics(
+                feature_dataframe, job, write_options, overwrite=overwrite
+            )
 
         return (
             job,
@@ -2364,6 +2443,47 @@ class FeatureGroup(FeatureGroupBase):
                 util.StorageWarning,
             )
 
+    def _use_incremental_statistics(self, write_options, ge_report=None):
+        return (
+            self.statistics_config.enabled
+            and write_options is not None
+            and write_options.get("incremental_statistics", False)
+            # rejected data was not written
+            and (ge_report is None or ge_report.ingestion_result != "REJECTED")
+        )
+
+    def _compute_incremental_statistics(
+        self, feature_dataframe, job, write_options, overwrite
+    ):
+        materialized = self._is_materialized(job, write_options)
+        fg_commit_id = None
+        if materialized and self.time_travel_format == "HUDI":
+            fg_commit_id = max(self.commit_details(limit=1).keys(), default=None)
+        return self._statistics_engine.compute_incremental_statistics(
+            self,
+            feature_dataframe,
+            overwrite=overwrite,
+            feature_group_commit_id=fg_commit_id,
+            materialized=materialized,
+        )
+
+    @staticmethod
+    def _is_materialized(job, write_options):
+        # the inserted data is only part of the offline storage, and its commit only
+        # known, if the insert started the materialization job and waited for it.
+        # Otherwise the last execution may belong to an earlier insert.
+        if (
+            job is None
+            or not write_options.get("wait_for_job", False)
+            or not engine.get_instance()._start_offline_materialization(write_options)
+        ):
+            return False
+        try:
+            return job.get_final_state().lower() == "succeeded"
+        except FeatureStoreException:
+            # the job has no executions
+            return False
+
     @classmethod
     def from_response_json(cls, json_dict):
         json_decamelized = humps.decamelize(json_dict)
@@ -2527,6 +2647,21 @@ class FeatureGroup(FeatureGroupBase):
 
         return self._materialization_job
 
+    @property
+    def last_commit(self):
+        """Commit of the last write to the offline storage of this feature group
+        object with the `spark` engine, including the HUDI options it was written
+        with, `None` if no data was written yet.
+
+        !!! example
+            ```python
+            fg.insert(df)
+
+            fg.last_commit.write_options
+            ```
+        """
+        return self._last_commit
+
     @version.setter
     def version(self, version):
         self._version = version
@@ -32,6 +32,7 @@ class FeatureGroupCommit:
         commit_time=None,
         archived=None,
         last_active_commit_time=None,
+        write_options=None,
         items=None,
         count=None,
         href=None,
@@ -45,6 +46,7 @@ class FeatureGroupCommit:
         self._validation_id = validation_id
         self._archived = archived
         self._last_active_commit_time = last_active_commit_time
+        self._write_options = write_options
 
     @classmethod
     def from_response_json(cls, json_dict):
@@ -54,7 +56,8 @@ class FeatureGroupCommit:
     def update_from_response_json(self, json_dict):
         json_decamelized = humps.decamelize(json_dict)
         _ = json_decamelized.pop("href")
-        self.__init__(**json_decamelized)
+        # the write options are reported by the client only
+        self.__init__(**json_decamelized, write_options=self._write_options)
         return self
 
     def json(self):
@@ -109,6 +112,11 @@ class FeatureGroupCommit:
     def last_active_commit_time(self):
         return self._last_active_commit_time
 
+    @property
+    def write_options(self):
+        """Parallelism and file sizing options the commit was written with."""
+        return self._write_options
+
     @commitid.setter
     def commitid(self, commitid):
         self._commitid = commitid
@@ -136,3 +144,7 @@ class FeatureGroupCommit:
     @last_active_commit_time.setter
     def last_active_commit_time(self, last_active_commit_time):
         self._last_active_commit_time = last_active_commit_time
+
+    @write_options.setter
+    def write_options(self, write_options):
+        self._write_options = write_options
@@ -21,7 +21,6 @@ from typing import Optional, Union, List, Dict, TypeVar
 
 import humps
 import numpy
-import great_expectations as ge
 import pandas as pd
 import numpy as np
 
@@ -450,7 +449,9 @@ class FeatureStore:
         event_time: Optional[str] = None,
         stream: Optional[bool] = False,
         expectation_suite: Optional[
-            Union[expectation_suite.ExpectationSuite, ge.core.ExpectationSuite]
+            Union[
+                expectation_suite.ExpectationSuite, TypeVar("ge.core.ExpectationSuite")
+            ]
         ] = None,
         parents: Optional[List[feature_group.FeatureGroup]] = [],
     ):
@@ -562,7 +563,9 @@ class FeatureStore:
         features: Optional[List[feature.Feature]] = [],
         statistics_config: Optional[Union[StatisticsConfig, bool, dict]] = None,
         expectation_suite: Optional[
-            Union[expectation_suite.ExpectationSuite, ge.core.ExpectationSuite]
+            Union[
+                expectation_suite.ExpectationSuite, TypeVar("ge.core.ExpectationSuite")
+            ]
         ] = None,
         event_time: Optional[str] = None,
         stream: Optional[bool] = False,
@@ -687,7 +690,9 @@ class FeatureStore:
         statistics_config: Optional[Union[StatisticsConfig, bool, dict]] = None,
         event_time: Optional[str] = None,
         expectation_suite: Optional[
-            Union[expectation_suite.ExpectationSuite, ge.core.ExpectationSuite]
+            Union[
+                expectation_suite.ExpectationSuite, TypeVar("ge.core.ExpectationSuite")
+            ]
         ] = None,
     ):
         """Create a external feature group metadata object.
@@ -783,7 +788,9 @@ class FeatureStore:
         statistics_config: Optional[Union[StatisticsConfig, bool, dict]] = None,
         event_time: Optional[str] = None,
         expectation_suite: Optional[
-            Union[expectation_suite.ExpectationSuite, ge.core.ExpectationSuite]
+            Union[
+                expectation_suite.ExpectationSuite, TypeVar("ge.core.ExpectationSuite")
+            ]
         ] = None,
         online_enabled: Optional[bool] = False,
     ):
@@ -1169,6 +1176,7 @@ class FeatureStore:
             bool,
         ],
         version: Optional[int] = None,
+        vectorized: Optional[bool] = False,
     ):
         """Create a transformation function metadata object.
 
@@ -1189,6 +1197,20 @@ class FeatureStore:
             plus_one_meta.save()
             ```
 
+        !!! example "Vectorized transformation function"
+            ```python
+            # define function operating on a pandas Series
+            def plus_one(values):
+                return values + 1
+
+            plus_one_meta = fs.create_transformation_function(
+                    transformation_function=plus_one,
+                    output_type=int,
+                    version=1,
+                    vectorized=True
+                )
+            ```
+
         !!! note "Lazy"
             This method is lazy and does not persist the transformation function in the
             feature store on its own. To materialize the transformation function and save
@@ -1197,6 +1219,11 @@ class FeatureStore:
         # Arguments
             transformation_function: callable object.
             output_type: python or numpy output type that will be inferred as pyspark.sql.types type.
+            version: version of the transformation function, defaults to `None`.
+            vectorized: whether the transformation function takes a pandas Series and returns
+                a pandas Series of the same length, instead of being called once per value.
+                Vectorized functions are executed as pandas UDFs with the Spark engine.
+                Defaults to `False`.
 
         # Returns:
             `TransformationFunction`: The TransformationFunction metadata object.
@@ -1206,6 +1233,7 @@ class FeatureStore:
             transformation_fn=transformation_function,
             output_type=output_type,
             version=version,
+            vectorized=vectorized,
         )
 
     def get_transformation_function(
@@ -16,6 +16,7 @@
 
 import json
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 from typing import Optional, Union, List, Dict, Any, TypeVar
 
@@ -30,9 +31,11 @@ from hsfs import (
     storage_connector,
     training_dataset,
 )
+from hsfs.client.exceptions import FeatureStoreException
 from hsfs.constructor import query, filter
 from hsfs.core import (
     feature_view_engine,
+    metadata_cache,
     transformation_function_engine,
     vector_server,
 )
@@ -82,8 +85,7 @@ class FeatureView:
         self._transformation_function_engine = (
             transformation_function_engine.TransformationFunctionEngine(featurestore_id)
         )
-        self._single_vector_server = None
-        self._batch_vectors_server = None
+        self._vector_server = None
         self._batch_scoring_server = None
         self._serving_keys = serving_keys
 
@@ -182,6 +184,7 @@ class FeatureView:
         training_dataset_version: Optional[int] = None,
         external: Optional[bool] = None,
         options: Optional[dict] = None,
+        concurrent_init: Optional[bool] = True,
     ):
         """Initialise feature view to retrieve feature vector from online and offline feature store.
 
@@ -209,20 +212,13 @@ class FeatureView:
             options: Additional options as key/value pairs for configuring online serving engine.
                 * key: kwargs of SqlAlchemy engine creation (See: https://docs.sqlalchemy.org/en/20/core/engines.html#sqlalchemy.create_engine).
                   For example: `{"pool_size": 10}`
+            concurrent_init: boolean, optional. If set to True, independent metadata is
+                requested from Hopsworks concurrently. Set to False to request it
+                sequentially, as in previous versions. Defaults to True.
         """
 
-        # initiate batch scoring server
         # `training_dataset_version` should not be set if `None` otherwise backend will look up the td.
-        try:
-            self.init_batch_scoring(training_dataset_version)
-        except ValueError as e:
-            # In 3.3 or before, td version is set to 1 by default.
-            # For backward compatibility, if a td version is required, set it to 1.
-            if "Training data version is required for transformation" in str(e):
-                self.init_batch_scoring(1)
-            else:
-                raise e
-
+        batch_scoring_training_dataset_version = training_dataset_version
         if training_dataset_version is None:
             training_dataset_version = 1
             warnings.warn(
@@ -230,23 +226,148 @@ class FeatureView:
                 util.VersionWarning,
             )
 
-        # initiate single vector server
-        self._single_vector_server = vector_server.VectorServer(
+        # initiate vector server for single and batch vectors, sharing the
+        # connection pool to the online feature store and the transformations
+        self._vector_server = vector_server.VectorServer(
             self._featurestore_id,
             self._features,
             training_dataset_version,
             serving_keys=self._serving_keys,
         )
-        self._single_vector_server.init_serving(self, False, external, options=options)
+        if batch_scoring_training_dataset_version is not None:
+            # the batch scoring server would be identical to the vector server
+            self._vector_server.init_serving(
+                self, None, external, options=options, concurrent_init=concurrent_init
+            )
+            self._batch_scoring_server = self._vector_server
+            return
+
+        if not concurrent_init:
+            self._init_batch_scoring_for_serving(batch_scoring_training_dataset_version)
+            self._vector_server.init_serving(
+                self, None, external, options=options, concurrent_init=False
+            )
+            return
+
+        # the servers are independent, their metadata is requested concurrently
+        cache = metadata_cache.get_instance()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(
+                    cache.propagate(self._init_batch_scoring_for_serving),
+                    batch_scoring_training_dataset_version,
+                ),
+                executor.submit(
+                    cache.propagate(self._vector_server.init_serving),
+                    self,
+                    None,
+                    external,
+                    options=options,
+                ),
+            ]
+            for future in futures:
+                future.result()
 
-        # initiate batch vector server
-        self._batch_vectors_server = vector_server.VectorServer(
+    def _init_batch_scoring_for_serving(self, training_dataset_version):
+        try:
+            self.init_batch_scoring(training_dataset_version)
+        except ValueError as e:
+            # In 3.3 or before, td version is set to 1 by default.
+            # For backward compatibility, if a td version is required, set it to 1.
+            if "Training data version is required for transformation" in str(e):
+                self.init_batch_scoring(1)
+            else:
+                raise e
+
+    def save_serving_state(self, path: str):
+        """Save the serving state of the feature view to a local file.
+
+        The file contains the metadata requested from Hopsworks by `init_serving`:
+        the prepared statements, serving keys, transformation functions with their
+        training dataset statistics, schemas of complex features and the connection
+        parameters of the online feature store. The password of the online feature
+        store is not saved. The file can be shipped with a model deployment and
+        restored with `init_serving_from_state`.
+
+        !!! example
+            ```python
+            # get feature store instance
+            fs = ...
+
+            # get feature view instance
+            feature_view = fs.get_feature_view(...)
+
+            # initialise feature view and save its serving state
+            feature_view.init_serving(training_dataset_version=1)
+            feature_view.save_serving_state("serving_state.json")
+            ```
+
+        # Arguments
+            path: Local path of the file to write the serving state to.
+
+        # Raises
+            `hsfs.client.exceptions.FeatureStoreException`. If serving is not initialised.
+        """
+        if self._vector_server is None:
+            raise FeatureStoreException(
+                "Serving is not initialised. Call `init_serving` before saving the"
+                " serving state."
+            )
+        self._vector_server.save_serving_state(self, path)
+
+    def init_serving_from_state(
+        self,
+        path: str,
+        options: Optional[dict] = None,
+        password: Optional[str] = None,
+        external: Optional[bool] = None,
+    ):
+        """Initialise feature view to retrieve feature vectors from a saved serving state.
+
+        The serving state is written by `save_serving_state` and has to be saved
+        for the same version and schema of the feature view.
+
+        !!! example
+            ```python
+            # get feature store instance
+            fs = ...
+
+            # get feature view instance
+            feature_view = fs.get_feature_view(...)
+
+            # initialise feature view without requests to Hopsworks
+            feature_view.init_serving_from_state(
+                "serving_state.json", password=online_password
+            )
+            ```
+
+        # Arguments
+            path: Local path of the file the serving state was saved to.
+            options: Additional options as key/value pairs for configuring online serving engine.
+                * key: kwargs of SqlAlchemy engine creation (See: https://docs.sqlalchemy.org/en/20/core/engines.html#sqlalchemy.create_engine).
+                  For example: `{"pool_size": 10}`
+            password: str, optional. Password of the online feature store. If not
+                provided, the online feature store storage connector is fetched from Hopsworks.
+            external: boolean, optional. If set to True, the connection to the
+                online feature store is established using the same host as
+                for the `host` parameter in the [`hsfs.connection()`](connection_api.md#connection) method.
+                If set to False, the online feature store storage connector is used
+                which relies on the private IP. Defaults to `None`, using the setting the
+                serving state was saved with.
+
+        # Raises
+            `hsfs.client.exceptions.FeatureStoreException`. If the serving state was saved for
+                another version or schema of the feature view.
+        """
+        self._vector_server = vector_server.VectorServer(
             self._featurestore_id,
             self._features,
-            training_dataset_version,
             serving_keys=self._serving_keys,
         )
-        self._batch_vectors_server.init_serving(self, True, external, options=options)
+        self._vector_server.init_serving_from_state(
+            self, path, options=options, password=password, external=external
+        )
+        self._batch_scoring_server = self._vector_server
 
     def init_batch_scoring(
         self,
@@ -405,6 +526,7 @@ class FeatureView:
                 external environment (e.g AWS Sagemaker or Google Colab), otherwise to False.
             return_type: `"list"`, `"pandas"` or `"numpy"`. Defaults to `"list"`.
             allow_missing: Setting to `True` returns feature vectors with missing values.
+                Categories unknown to a `label_encoder` are returned as missing values as well.
 
         # Returns
             `list`, `pd.DataFrame` or `np.ndarray` if `return type` is set to `"list"`, `"pandas"` or `"numpy"`
@@ -416,9 +538,9 @@ class FeatureView:
             `Exception`. When primary key entry cannot be found in one or more of the feature groups used by this
                 feature view.
         """
-        if self._single_vector_server is None:
+        if self._vector_server is None:
             self.init_serving(external=external)
-        return self._single_vector_server.get_feature_vector(
+        return self._vector_server.get_feature_vector(
             entry, return_type, passed_features, allow_missing
         )
 
@@ -494,6 +616,7 @@ class FeatureView:
                 external environment (e.g AWS Sagemaker or Google Colab), otherwise to False.
             return_type: `"list"`, `"pandas"` or `"numpy"`. Defaults to `"list"`.
             allow_missing: Setting to `True` returns feature vectors with missing values.
+                Categories unknown to a `label_encoder` are returned as missing values as well.
 
         # Returns
             `List[list]`, `pd.DataFrame` or `np.ndarray` if `return type` is set to `"list", `"pandas"` or `"numpy"`
@@ -506,9 +629,9 @@ class FeatureView:
             `Exception`. When primary key entry cannot be found in one or more of the feature groups used by this
                 feature view.
         """
-        if self._batch_vectors_server is None:
+        if self._vector_server is None:
             self.init_serving(external=external)
-        return self._batch_vectors_server.get_feature_vectors(
+        return self._vector_server.get_feature_vectors(
             entry, return_type, passed_features, allow_missing
         )
 
@@ -527,6 +650,7 @@ class FeatureView:
                 TypeVar("SpineGroup"),
             ]
         ] = None,
+        since_commit: Optional[Union[str, int, datetime, date]] = None,
     ):
         """Get a batch of data from an event time interval from the offline feature store.
 
@@ -550,6 +674,21 @@ class FeatureView:
                 )
             ```
 
+        !!! example "Batch data committed since the last scoring run"
+            ```python
+                # only rows of the left feature group committed after the commit
+                # stored in the checkpoint are read and joined with the latest state
+                # of the other feature groups
+                df = feature_view.get_batch_data(
+                    read_options={"checkpoint_path": "/hopsfs/Resources/scoring.json"}
+                )
+                predictions = model.predict(df)
+                ...
+
+                # advance the checkpoint once the batch was processed
+                feature_view.commit_batch_checkpoint()
+            ```
+
         !!! warning "Spine Groups/Dataframes"
             Spine groups and dataframes are currently only supported with the Spark engine and
             Spark dataframes.
@@ -565,6 +704,15 @@ class FeatureView:
                 Dictionary of read options for python engine:
                 * key `"use_hive"` and value `True` to read batch data with Hive instead of
                   [ArrowFlight Server](https://docs.hopsworks.ai/latest/setup_installation/common/arrow_flight_duckdb/).
+                * key `"use_result_cache"` and value `True` to cache the batch data on the
+                  local file system until any of the feature groups has a new commit.
+                Dictionary of read options for both engines:
+                * key `"checkpoint_path"` and value the local path of a file storing the
+                  time of the last commit of the left feature group that was read. If the
+                  file exists and `since_commit` is not provided, only the commits after
+                  the stored commit are read. The file is only updated by
+                  `commit_batch_checkpoint`. The file is written with the local file
+                  system, in Hopsworks jobs use the HopsFS mount, e.g. `/hopsfs/...`.
                 Defaults to `{}`.
             spine: Spine dataframe with primary key, event time and
                 label column to use for point in time join when fetching features. Defaults to `None` and is only required
@@ -572,6 +720,11 @@ class FeatureView:
                 It is possible to directly pass a spine group instead of a dataframe to overwrite the left side of the
                 feature join, however, the same features as in the original feature group that is being replaced need to
                 be available in the spine group.
+            since_commit: Read only the rows of the left feature group committed after this
+                point in time, exclusive, instead of all rows. The joined feature groups are
+                read in their latest state. Requires the left feature group to be time travel
+                enabled. Strings should be formatted in one of the following formats `%Y-%m-%d`,
+                `%Y-%m-%d %H`, `%Y-%m-%d %H:%M`, or `%Y-%m-%d %H:%M:%S`. Defaults to `None`.
 
         # Returns
             `DataFrame`: A dataframe
@@ -588,8 +741,32 @@ class FeatureView:
             self._batch_scoring_server._transformation_functions,
             read_options,
             spine,
+            since_commit=since_commit,
         )
 
+    def commit_batch_checkpoint(self):
+        """Advance the checkpoint of the last `get_batch_data` call to the last commit it read.
+
+        Call it once the batch data was processed, such that the next call to
+        `get_batch_data` with the same `checkpoint_path` read option continues after the
+        processed commits. If the batch is not committed, for example because the
+        processing failed, the next call reads the same commits again.
+
+        !!! example
+            ```python
+            df = feature_view.get_batch_data(
+                read_options={"checkpoint_path": "/hopsfs/Resources/scoring.json"}
+            )
+            ...
+            feature_view.commit_batch_checkpoint()
+            ```
+
+        # Raises
+            `hsfs.client.exceptions.FeatureStoreException`. If no batch data was read
+                with the `checkpoint_path` read option.
+        """
+        self._feature_view_engine.commit_batch_checkpoint()
+
     def add_tag(self, name: str, value):
         """Attach a tag to a feature view.
 
@@ -1626,6 +1803,17 @@ class FeatureView:
                   [ArrowFlight Server](https://docs.hopsworks.ai/latest/setup_installation/common/arrow_flight_duckdb/).
                 * key `"hive_config"` to pass a dictionary of hive or tez configurations.
                   For example: `{"hive_config": {"hive.tez.cpu.vcores": 2, "tez.grouping.split-count": "3"}}`
+                * key `"streaming"` and value `True` to create the in-memory training
+                  dataset batch by batch on the local file system instead of in memory.
+                  Features and labels are then returned as lazy
+                  `TrainingDataShards` handles of local parquet shards, to be read with
+                  `read()` or batch by batch with `iter_batches()`. Rows of random
+                  splits are assigned with the split sizes as probabilities, such that
+                  the sizes of the splits are approximate.
+                * key `"streaming_dir"` to set the local directory of the parquet
+                  shards. Defaults to a new temporary directory.
+                * key `"streaming_batch_size"` to set the number of rows read and
+                  written at once when streaming. Defaults to `100000`.
                 * key `spark` and value an object of type
                   [hsfs.core.job_configuration.JobConfiguration](../job_configuration)
                   to configure the Hopsworks Job used to compute the training dataset.
@@ -1770,6 +1958,17 @@ class FeatureView:
                   [ArrowFlight Server](https://docs.hopsworks.ai/latest/setup_installation/common/arrow_flight_duckdb/).
                 * key `"hive_config"` to pass a dictionary of hive or tez configurations.
                   For example: `{"hive_config": {"hive.tez.cpu.vcores": 2, "tez.grouping.split-count": "3"}}`
+                * key `"streaming"` and value `True` to create the in-memory training
+                  dataset batch by batch on the local file system instead of in memory.
+                  Features and labels are then returned as lazy
+                  `TrainingDataShards` handles of local parquet shards, to be read with
+                  `read()` or batch by batch with `iter_batches()`. Rows of random
+                  splits are assigned with the split sizes as probabilities, such that
+                  the sizes of the splits are approximate.
+                * key `"streaming_dir"` to set the local directory of the parquet
+                  shards. Defaults to a new temporary directory.
+                * key `"streaming_batch_size"` to set the number of rows read and
+                  written at once when streaming. Defaults to `100000`.
                 * key `spark` and value an object of type
                   [hsfs.core.job_configuration.JobConfiguration](../job_configuration)
                   to configure the Hopsworks Job used to compute the training dataset.
@@ -1951,6 +2150,17 @@ class FeatureView:
                   [ArrowFlight Server](https://docs.hopsworks.ai/latest/setup_installation/common/arrow_flight_duckdb/).
                 * key `"hive_config"` to pass a dictionary of hive or tez configurations.
                   For example: `{"hive_config": {"hive.tez.cpu.vcores": 2, "tez.grouping.split-count": "3"}}`
+                * key `"streaming"` and value `True` to create the in-memory training
+                  dataset batch by batch on the local file system instead of in memory.
+                  Features and labels are then returned as lazy
+                  `TrainingDataShards` handles of local parquet shards, to be read with
+                  `read()` or batch by batch with `iter_batches()`. Rows of random
+                  splits are assigned with the split sizes as probabilities, such that
+                  the sizes of the splits are approximate.
+                * key `"streaming_dir"` to set the local directory of the parquet
+                  shards. Defaults to a new temporary directory.
+                * key `"streaming_batch_size"` to set the number of rows read and
+                  written at once when streaming. Defaults to `100000`.
                 * key `spark` and value an object of type
                   [hsfs.core.job_configuration.JobConfiguration](../job_configuration)
                   to configure the Hopsworks Job used to compute the training dataset.
@@ -2175,6 +2385,122 @@ class FeatureView:
         )
         return df
 
+    def get_training_data_iterator(
+        self,
+        training_dataset_version: int,
+        batch_size: int = 1024,
+        shuffle_buffer: int = 0,
+        columns: Optional[List[str]] = None,
+        split: Optional[str] = None,
+        dataframe_type: Optional[str] = "numpy",
+        rank: int = 0,
+        world_size: int = 1,
+        seed: Optional[int] = None,
+        prefetch: int = 2,
+        read_options: Optional[Dict[Any, Any]] = None,
+    ):
+        """
+        Get an iterator over batches of training data created by
+        `feature_view.create_training_data`, `feature_view.create_train_test_split` or
+        `feature_view.create_train_validation_test_split`.
+
+        Instead of reading the complete training data into memory, the parquet files of
+        the training dataset are streamed row group by row group, while the next files
+        are opened and the next batches are decoded in background threads. Every
+        iteration over the iterator is an epoch.
+
+        !!! example
+            ```python
+            # get feature store instance
+            fs = ...
+
+            # get feature view instance
+            feature_view = fs.get_feature_view(...)
+
+            # iterate over batches of the train split
+            iterator = feature_view.get_training_data_iterator(
+                training_dataset_version=1,
+                split="train",
+                batch_size=256,
+                shuffle_buffer=10000,
+            )
+            for features, labels in iterator:
+                ...
+            ```
+
+        !!! example "Use with tf.data or a PyTorch DataLoader"
+            ```python
+            # tf.data
+            dataset = tf.data.Dataset.from_generator(
+                lambda: iter(iterator), output_signature=...
+            )
+
+            # PyTorch, every DataLoader worker reads a distinct subset of the files
+            class TrainingData(torch.utils.data.IterableDataset):
+                def __iter__(self):
+                    worker = torch.utils.data.get_worker_info()
+                    return iter(feature_view.get_training_data_iterator(
+                        1,
+                        split="train",
+                        rank=worker.id if worker else 0,
+                        world_size=worker.num_workers if worker else 1,
+                    ))
+
+            loader = torch.utils.data.DataLoader(TrainingData(), batch_size=None, num_workers=4)
+            ```
+
+        !!! warning "Engine Support"
+            **Python only**
+
+            Only training datasets in parquet format, written to HopsFS or S3, are
+            supported.
+
+        # Arguments
+            training_dataset_version: training dataset version
+            batch_size: Number of rows per batch, the last batch of an epoch can be
+                smaller. Defaults to `1024`.
+            shuffle_buffer: Number of rows to shuffle the batches from. The order of the
+                files is shuffled as well. Defaults to `0`, which reads the rows in
+                order.
+            columns: Names of the features to read. Labels of the feature view are
+                always read. Defaults to `None`, which reads all features.
+            split: Name of the split to read, such as `"train"`, if the training
+                dataset has splits. Defaults to `None`.
+            dataframe_type: Type of the batches, `"numpy"` for a dict of feature
+                name to NumPy array, `"arrow"` for a pyarrow `RecordBatch` or
+                `"pandas"` for a pandas DataFrame. Defaults to `"numpy"`.
+            rank: Rank of the worker in distributed training, every worker reads the
+                files with an index of `rank` modulo `world_size`. Defaults to `0`.
+            world_size: Number of workers in distributed training. Defaults to `1`.
+            seed: Seed of the shuffling. Defaults to `None`.
+            prefetch: Number of files opened and batches decoded ahead of the
+                consumer. Defaults to `2`.
+            read_options: Additional options as key/value pairs to pass to the
+                execution engine. Defaults to `{}`.
+
+        # Returns
+            `TrainingDataIterator`: Iterator yielding tuples of features and labels
+            batches, or only features batches if the feature view has no labels.
+
+        # Raises
+            `hsfs.client.exceptions.FeatureStoreException`. If the training dataset
+            is not materialized in parquet format.
+        """
+        return self._feature_view_engine.get_training_data_iterator(
+            self,
+            training_dataset_version,
+            split=split,
+            batch_size=batch_size,
+            shuffle_buffer=shuffle_buffer,
+            columns=columns,
+            dataframe_type=dataframe_type,
+            rank=rank,
+            world_size=world_size,
+            seed=seed,
+            prefetch=prefetch,
+            read_options=read_options,
+        )
+
     def add_training_dataset_tag(self, training_dataset_version: int, name: str, value):
         """Attach a tag to a training dataset.
 
@@ -2545,9 +2871,8 @@ class FeatureView:
     @property
     def primary_keys(self):
         """Set of primary key names that is required as keys in input dict object for `get_feature_vector(s)` method."""
-        _vector_server = self._single_vector_server or self._batch_vectors_server
-        if _vector_server:
-            return _vector_server.serving_keys
+        if self._vector_server:
+            return self._vector_server.serving_keys
         else:
             _vector_server = vector_server.VectorServer(
                 self._featurestore_id, self._features, serving_keys=self._serving_keys
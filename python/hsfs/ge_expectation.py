@@ -17,8 +17,7 @@
 import json
 
 import humps
-from typing import Any, Dict, Optional
-import great_expectations as ge
+from typing import Any, Dict, Optional, TypeVar
 
 from hsfs import util
 
@@ -63,7 +62,7 @@ class GeExpectation:
             return cls(**json_decamelized)
 
     @classmethod
-    def from_ge_type(cls, ge_expectation: ge.core.ExpectationConfiguration):
+    def from_ge_type(cls, ge_expectation: TypeVar("ge.core.ExpectationConfiguration")):
         return cls(**ge_expectation.to_json_dict())
 
     def to_dict(self) -> Dict[str, Any]:
@@ -100,7 +99,9 @@ class GeExpectation:
             + f"kwargs={self._kwargs}, meta={self._meta})"
         )
 
-    def to_ge_type(self) -> ge.core.ExpectationConfiguration:
+    def to_ge_type(self) -> TypeVar("ge.core.ExpectationConfiguration"):
+        import great_expectations as ge
+
         return ge.core.ExpectationConfiguration(
             expectation_type=self.expectation_type, kwargs=self.kwargs, meta=self.meta
         )
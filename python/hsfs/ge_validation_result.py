@@ -15,12 +15,11 @@
 #
 
 import json
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Union, TypeVar
 import datetime
 import dateutil
 
 import humps
-import great_expectations as ge
 
 from hsfs import util
 
@@ -100,7 +99,9 @@ class ValidationResult:
             "meta": self._meta,
         }
 
-    def to_ge_type(self) -> ge.core.ExpectationValidationResult:
+    def to_ge_type(self) -> TypeVar("ge.core.ExpectationValidationResult"):
+        import great_expectations as ge
+
         return ge.core.ExpectationValidationResult(
             success=self.success,
             exception_info=self.exception_info,
@@ -50,6 +50,7 @@ class ServingKey:
             required=json_decamelized.get("required", True),
             prefix=json_decamelized.get("prefix", ""),
             join_on=json_decamelized.get("join_on", None),
+            ignore_prefix=json_decamelized.get("ignore_prefix", False),
         )
         return serving_key
 
@@ -63,6 +64,7 @@ class ServingKey:
             "required": self._required,
             "prefix": self._prefix,
             "join_on": self._join_on,
+            "ignore_prefix": self._ignore_prefix,
         }
 
     def __str__(self):
@@ -86,7 +86,8 @@ class StatisticsConfig:
     @property
     def exact_uniqueness(self):
         """Enable exact uniqueness as an additional statistic to be computed for each
-        feature."""
+        feature. With the python engine, the count of every distinct value is kept in
+        memory while profiling."""
         return self._exact_uniqueness
 
     @exact_uniqueness.setter
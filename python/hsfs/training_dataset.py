@@ -769,7 +769,9 @@ class TrainingDataset:
 
         # Arguments
             batch: boolean, optional. If set to True, prepared statements will be
-                initialised for retrieving serving vectors as a batch.
+                initialised for retrieving serving vectors as a batch, if set to False
+                for retrieving single serving vectors. Defaults to `None`, initialising
+                both.
             external: boolean, optional. If set to True, the connection to the
                 online feature store is established using the same host as
                 for the `host` parameter in the [`hsfs.connection()`](connection_api.md#connection) method.
@@ -793,12 +795,13 @@ class TrainingDataset:
                 If set to False, the online feature store storage connector is used
                 which relies on the private IP. Defaults to True if connection to Hopsworks is established from
                 external environment (e.g AWS Sagemaker or Google Colab), otherwise to False.
+                Ignored if the prepared statements are initialised already.
         # Returns
             `list` List of feature values related to provided primary keys, ordered according to positions of this
             features in training dataset query.
         """
         if self._vector_server.prepared_statements is None:
-            self.init_prepared_statement(None, external)
+            self._init_missing_prepared_statement(False, external)
         return self._vector_server.get_feature_vector(entry)
 
     def get_serving_vectors(
@@ -815,14 +818,25 @@ class TrainingDataset:
                 If set to False, the online feature store storage connector is used
                 which relies on the private IP. Defaults to True if connection to Hopsworks is established from
                 external environment (e.g AWS Sagemaker or Google Colab), otherwise to False.
+                Ignored if the prepared statements are initialised already.
         # Returns
             `List[list]` List of lists of feature values related to provided primary keys, ordered according to
             positions of this features in training dataset query.
         """
-        if self._vector_server.prepared_statements is None:
-            self.init_prepared_statement(None, external)
+        if self._vector_server.batch_prepared_statements is None:
+            self._init_missing_prepared_statement(True, external)
         return self._vector_server.get_feature_vectors(entry)
 
+    def _init_missing_prepared_statement(self, batch, external):
+        if (
+            self._vector_server.prepared_statements is None
+            and self._vector_server.batch_prepared_statements is None
+        ):
+            self.init_prepared_statement(None, external)
+        else:
+            # keep the connection of the first initialisation
+            self._vector_server.init_missing_prepared_statement(self, batch)
+
     @property
     def label(self):
         """The label/prediction feature of the training dataset.
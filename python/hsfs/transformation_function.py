@@ -32,6 +32,7 @@ class TransformationFunction:
         source_code_content=None,
         builtin_source_code=None,
         output_type=None,
+        vectorized=False,
         id=None,
         type=None,
         items=None,
@@ -44,6 +45,9 @@ class TransformationFunction:
         self._name = name
         self._transformation_fn = transformation_fn
         self._source_code_content = source_code_content
+        self._vectorized = vectorized
+        # set for built-in functions once their statistics are bound
+        self._vectorized_transformation_fn = None
 
         self._transformation_function_engine = (
             transformation_function_engine.TransformationFunctionEngine(
@@ -147,12 +151,13 @@ class TransformationFunction:
         # initialise source code dict
         # add all imports from module
         # add original source code that will be used during offline transformations
-        self._source_code_content = json.dumps(
-            {
-                "module_imports": "\n".join(module_imports),
-                "transformer_code": transformer_code,
-            }
-        )
+        source_code_content = {
+            "module_imports": "\n".join(module_imports),
+            "transformer_code": transformer_code,
+        }
+        if self._vectorized:
+            source_code_content["vectorized"] = True
+        self._source_code_content = json.dumps(source_code_content)
 
     @staticmethod
     def _get_module_path(module_name):
@@ -194,6 +199,7 @@ class TransformationFunction:
         source_code_content = json.loads(source_code_content)
         module_imports = source_code_content["module_imports"]
         transformer_code = source_code_content["transformer_code"]
+        self._vectorized = source_code_content.get("vectorized", False)
         self._transformer_code = module_imports + "\n" * 2 + transformer_code
 
         scope = __import__("__main__").__dict__
@@ -254,6 +260,20 @@ class TransformationFunction:
     def transformation_fn(self):
         return self._transformation_fn
 
+    @property
+    def vectorized(self):
+        """Whether the transformation function takes and returns a whole pandas Series
+        instead of a single value."""
+        return self._vectorized
+
+    @property
+    def vectorized_transformation_fn(self):
+        """Transformation function operating on a whole pandas Series, `None` if the
+        function can only be applied per value."""
+        if self._vectorized:
+            return self._transformation_fn
+        return self._vectorized_transformation_fn
+
     @property
     def source_code_content(self):
         return self._source_code_content
@@ -278,6 +298,10 @@ class TransformationFunction:
     def transformation_fn(self, transformation_fn):
         self._transformation_fn = transformation_fn
 
+    @vectorized_transformation_fn.setter
+    def vectorized_transformation_fn(self, vectorized_transformation_fn):
+        self._vectorized_transformation_fn = vectorized_transformation_fn
+
     @source_code_content.setter
     def source_code_content(self, source_code_content):
         self._source_code_content = source_code_content
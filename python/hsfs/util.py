@@ -16,6 +16,7 @@
 
 import re
 import json
+import numpy as np
 import pandas as pd
 import time
 import threading
@@ -80,28 +81,42 @@ def strip_feature_store_suffix(name):
 
 
 def create_mysql_engine(online_conn, external, options=None):
+    return create_mysql_engine_from_options(
+        get_online_connection_options(online_conn, external), options=options
+    )
+
+
+def get_online_connection_options(online_conn, external):
     online_options = online_conn.spark_options()
+    online_options["url"] = get_online_connection_url(online_options["url"], external)
+    return online_options
+
+
+def get_online_connection_url(url, external):
+    if not external:
+        return url
+    # This only works with external clients.
+    # Hopsworks clients should use the storage connector
+    host = variable_api.VariableApi().get_loadbalancer_external_domain()
+    if host == "":
+        # If the load balancer is not configured, then fall back to
+        # use the MySQL node on the head node
+        host = client.get_instance().host
+
+    return re.sub(
+        "/[0-9.]+:",
+        "/{}:".format(host),
+        url,
+    )
+
+
+def create_mysql_engine_from_options(online_options, options=None):
     # Here we are replacing the first part of the string returned by Hopsworks,
     # jdbc:mysql:// with the sqlalchemy one + username and password
     # useSSL and allowPublicKeyRetrieval are not valid properties for the pymysql driver
     # to use SSL we'll have to something like this:
     # ssl_args = {'ssl_ca': ca_path}
     # engine = create_engine("mysql+pymysql://<user>:<pass>@<addr>/<schema>", connect_args=ssl_args)
-    if external:
-        # This only works with external clients.
-        # Hopsworks clients should use the storage connector
-        host = variable_api.VariableApi().get_loadbalancer_external_domain()
-        if host == "":
-            # If the load balancer is not configured, then fall back to
-            # use the MySQL node on the head node
-            host = client.get_instance().host
-
-        online_options["url"] = re.sub(
-            "/[0-9.]+:",
-            "/{}:".format(host),
-            online_options["url"],
-        )
-
     sql_alchemy_conn_str = (
         online_options["url"]
         .replace(
@@ -217,6 +232,35 @@ def convert_event_time_to_timestamp(event_time):
         )
 
 
+def convert_event_time_column_to_timestamp(event_time_column):
+    """Convert a pandas Series of event times to unix epoch time in milliseconds.
+
+    Vectorized variant of `convert_event_time_to_timestamp`, missing event times are
+    returned as `NaN`.
+    """
+    if pd.api.types.is_datetime64_any_dtype(event_time_column):
+        if event_time_column.dt.tz is not None:
+            event_time_column = event_time_column.dt.tz_convert(None)
+        timestamps = (
+            event_time_column.to_numpy(dtype="datetime64[ms]")
+            .astype("int64")
+            .astype("float64")
+        )
+        timestamps[event_time_column.isna().to_numpy()] = np.nan
+        return timestamps
+    elif pd.api.types.is_integer_dtype(event_time_column):
+        timestamps = event_time_column.to_numpy(dtype="int64")
+        if (timestamps == 0).any():
+            raise ValueError("Event time should be greater than 0.")
+        # jdbc supports timestamp precision up to second only.
+        return np.where(timestamps < 10**10, timestamps * 1000, timestamps).astype(
+            "float64"
+        )
+    return event_time_column.map(convert_event_time_to_timestamp).to_numpy(
+        dtype="float64", na_value=np.nan
+    )
+
+
 def setup_pydoop():
     # Import Pydoop only here, so it doesn't trigger if the execution environment
     # does not support Pydoop. E.g. Sagemaker
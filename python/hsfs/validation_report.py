@@ -18,7 +18,6 @@ import json
 
 import humps
 from typing import Optional
-import great_expectations as ge
 
 from hsfs import util
 from hsfs.ge_validation_result import ValidationResult
@@ -99,6 +98,8 @@ class ValidationReport:
         }
 
     def to_ge_type(self):
+        import great_expectations as ge
+
         return ge.core.ExpectationSuiteValidationResult(
             success=self.success,
             statistics=self.statistics,
@@ -132,6 +133,8 @@ class ValidationReport:
 
     @results.setter
     def results(self, results):
+        import great_expectations as ge
+
         if len(results) == 0:
             self._results = []
         elif isinstance(results[0], ValidationResult):
@@ -19,6 +19,7 @@ setup(
     install_requires=[
         "pyhumps==1.6.1",
         "requests",
+        "urllib3>=1.26",  # Retry(allowed_methods=...)
         "furl",
         "boto3",
         "pandas",
@@ -0,0 +1,104 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import gzip
+
+import pytest
+
+from hsfs.client import base
+
+
+class Client(base.Client):
+    def __init__(self, http_options=None):
+        self._base_url = "https://test:443"
+        self._auth = None
+        self._verify = False
+        self._connected = True
+        self._session = self._get_session(http_options)
+
+
+class TestBase:
+    def test_get_session(self):
+        # Act
+        client = Client({"pool_maxsize": 64, "max_retries": 5})
+
+        # Assert
+        adapter = client._session.get_adapter("https://test:443")
+        assert adapter._pool_connections == 10
+        assert adapter._pool_maxsize == 64
+        assert adapter.max_retries.total == 5
+        assert adapter.max_retries.backoff_factor == 0.5
+        assert "POST" not in adapter.max_retries.allowed_methods
+        assert 503 in adapter.max_retries.status_forcelist
+        assert client._session.headers["Connection"] == "keep-alive"
+
+    def test_get_session_no_keep_alive(self):
+        # Act
+        client = Client({"keep_alive": False})
+
+        # Assert
+        assert client._session.headers["Connection"] == "close"
+
+    def test_get_session_unknown_option(self):
+        # Act
+        with pytest.raises(ValueError) as e_info:
+            Client({"pool_size": 64})
+
+        # Assert
+        assert str(e_info.value).startswith("Unknown http options ['pool_size']")
+
+    def test_compress(self):
+        # Arrange
+        client = Client({"compression_threshold": 10})
+
+        # Act
+        small_headers, small_data = client._compress(None, "{}")
+        headers, data = client._compress(
+            {"content-type": "application/json"}, '{"columns": []}'
+        )
+
+        # Assert
+        assert small_headers is None
+        assert small_data == b"{}"
+        assert headers == {
+            "content-type": "application/json",
+            "Content-Encoding": "gzip",
+        }
+        assert gzip.decompress(data) == b'{"columns": []}'
+
+    def test_compress_disabled(self):
+        # Arrange
+        client = Client()
+
+        # Act
+        headers, data = client._compress(None, '{"columns": []}')
+
+        # Assert
+        assert headers is None
+        assert data == '{"columns": []}'
+
+    def test_send_request_timeout(self, mocker):
+        # Arrange
+        client = Client({"read_timeout": 60})
+        mock_send = mocker.patch.object(client._session, "send")
+        mock_send.return_value.status_code = 200
+        mock_send.return_value.content = b""
+
+        # Act
+        client._send_request("GET", ["project", 1])
+
+        # Assert
+        assert mock_send.call_args[1]["timeout"] == (10, 60)
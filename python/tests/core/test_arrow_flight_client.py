@@ -14,15 +14,25 @@
 #   limitations under the License.
 #
 import pandas as pd
+import pyarrow
+import pyarrow.flight
+import pytest
 import datetime
-
-from hsfs import feature_group, feature_view, training_dataset
+import json
+
+from hsfs import (
+    feature_group,
+    feature_view,
+    training_dataset,
+    transformation_function,
+)
 from hsfs.constructor import fs_query
 from hsfs.core import arrow_flight_client
 from hsfs.engine import python
 from hsfs.feature import Feature
 from hsfs.storage_connector import HopsFSConnector
 from hsfs import storage_connector
+from hsfs.client.exceptions import FeatureStoreException
 
 
 class TestArrowFlightClient:
@@ -525,3 +535,231 @@ class TestArrowFlightClient:
         }
 
         assert str(query_object_reference) == str(query_object)
+
+    def _arrange_flight_client(self, mocker, tables):
+        flight_client = arrow_flight_client.ArrowFlightClient(retry_backoff=0)
+        flight_client._connection = mocker.MagicMock()
+        info = mocker.MagicMock()
+        info.endpoints = [mocker.MagicMock(ticket=i) for i in range(len(tables))]
+        flight_client._connection.get_flight_info.return_value = info
+        pooled_connection = mocker.MagicMock()
+        pooled_connection.do_get.side_effect = lambda ticket: mocker.MagicMock(
+            read_all=mocker.MagicMock(return_value=tables[ticket])
+        )
+        mocker.patch(
+            "hsfs.core.arrow_flight_client.ArrowFlightClient._create_connection",
+            return_value=pooled_connection,
+        )
+        return flight_client, pooled_connection
+
+    def test_read_path_multiple_endpoints(self, mocker):
+        # Arrange
+        tables = [
+            pyarrow.table({"a": [1, 2]}),
+            pyarrow.table({"a": [3]}),
+            pyarrow.table({"a": [4, 5]}),
+        ]
+        flight_client, pooled_connection = self._arrange_flight_client(mocker, tables)
+
+        # Act
+        df = flight_client.read_path("/path/test.parquet")
+
+        # Assert
+        assert pooled_connection.do_get.call_count == 3
+        assert sorted(df["a"].tolist()) == [1, 2, 3, 4, 5]
+        assert flight_client._connection_pool_count <= flight_client._pool_size
+
+    def test_read_path_retry_transient_error(self, mocker):
+        # Arrange
+        flight_client, pooled_connection = self._arrange_flight_client(
+            mocker, [pyarrow.table({"a": [1, 2]})]
+        )
+        flight_client._connection.get_flight_info.side_effect = [
+            pyarrow.flight.FlightUnavailableError("unavailable"),
+            flight_client._connection.get_flight_info.return_value,
+        ]
+
+        # Act
+        df = flight_client.read_path("/path/test.parquet")
+
+        # Assert
+        assert flight_client._connection.get_flight_info.call_count == 2
+        assert df["a"].tolist() == [1, 2]
+
+    def test_read_path_retry_exhausted(self, mocker):
+        # Arrange
+        flight_client, pooled_connection = self._arrange_flight_client(
+            mocker, [pyarrow.table({"a": [1, 2]})]
+        )
+        flight_client._connection.get_flight_info.side_effect = (
+            pyarrow.flight.FlightTimedOutError("timed out")
+        )
+
+        # Act
+        with pytest.raises(FeatureStoreException):
+            flight_client.read_path("/path/test.parquet")
+
+        # Assert
+        assert (
+            flight_client._connection.get_flight_info.call_count
+            == flight_client._max_retries + 1
+        )
+
+    def test_initialize_connection_on_first_use(self, mocker):
+        # Arrange
+        mocker.patch(
+            "hsfs.core.variable_api.VariableApi.get_flyingduck_enabled",
+            return_value=True,
+        )
+        mock_initialize_connection = mocker.patch(
+            "hsfs.core.arrow_flight_client.ArrowFlightClient._initialize_connection"
+        )
+        flight_client = arrow_flight_client.ArrowFlightClient()
+        mock_query_supported = mocker.patch.object(
+            flight_client, "_is_query_supported_rec", return_value=False
+        )
+
+        # Act
+        unsupported = flight_client.is_query_supported(None, {})
+        initialized_unsupported = mock_initialize_connection.call_count
+        mock_query_supported.return_value = True
+        supported = flight_client.is_query_supported(None, {})
+        flight_client.is_query_supported(None, {})
+
+        # Assert
+        assert not unsupported
+        assert initialized_unsupported == 0
+        assert supported
+        assert mock_initialize_connection.call_count == 1
+
+    def test_initialize_connection_on_first_use_error(self, mocker):
+        # Arrange
+        mocker.patch(
+            "hsfs.core.variable_api.VariableApi.get_flyingduck_enabled",
+            return_value=True,
+        )
+        mocker.patch(
+            "hsfs.core.arrow_flight_client.ArrowFlightClient._initialize_connection",
+            side_effect=Exception("unavailable"),
+        )
+        flight_client = arrow_flight_client.ArrowFlightClient()
+        mocker.patch.object(flight_client, "_is_query_supported_rec", return_value=True)
+
+        # Act
+        with pytest.warns(UserWarning):
+            supported = flight_client.is_query_supported(None, {})
+
+        # Assert
+        assert not supported
+        assert not flight_client._is_enabled
+
+    def _arrange_split_training_dataset(self, mocker):
+        mocker.patch("hsfs.client.get_instance")
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="parquet",
+            featurestore_id=99,
+            splits={"train": 0.8, "test": 0.2},
+            seed=5,
+            train_split="train",
+        )
+        td.transformation_functions = {
+            "a": transformation_function.TransformationFunction(
+                99, transformation_fn=min_max_scaler, output_type="double", version=1
+            )
+        }
+        return td
+
+    def test_is_training_dataset_supported_splits(self, mocker):
+        # Arrange
+        flight_client, _ = self._arrange_flight_client(mocker, [])
+        flight_client._is_enabled = True
+        flight_client._connection.list_actions.return_value = [
+            pyarrow.flight.ActionType(
+                arrow_flight_client.ArrowFlightClient.CREATE_SPLIT_TRAINING_DATASET_ACTION,
+                "",
+            )
+        ]
+        td = self._arrange_split_training_dataset(mocker)
+
+        # Act
+        supported = flight_client.is_training_dataset_supported(td, {})
+        use_spark = flight_client.is_training_dataset_supported(td, {"use_spark": True})
+
+        # Assert
+        assert supported
+        assert not use_spark
+        assert flight_client._connection.list_actions.call_count == 1
+
+    def test_is_training_dataset_supported_old_server(self, mocker):
+        # Arrange
+        flight_client, _ = self._arrange_flight_client(mocker, [])
+        flight_client._is_enabled = True
+        flight_client._connection.list_actions.return_value = [
+            pyarrow.flight.ActionType(
+                arrow_flight_client.ArrowFlightClient.CREATE_TRAINING_DATASET_ACTION,
+                "",
+            )
+        ]
+        td = self._arrange_split_training_dataset(mocker)
+
+        # Act
+        supported = flight_client.is_training_dataset_supported(td, {})
+
+        # Assert
+        assert not supported
+
+    def test_is_training_dataset_supported_user_transformation_function(self, mocker):
+        # Arrange
+        flight_client, _ = self._arrange_flight_client(mocker, [])
+        flight_client._is_enabled = True
+        td = self._arrange_split_training_dataset(mocker)
+        td.transformation_functions[
+            "b"
+        ] = transformation_function.TransformationFunction(
+            99, transformation_fn=plus_one, output_type="int", version=1
+        )
+
+        # Act
+        supported = flight_client.is_training_dataset_supported(td, {})
+
+        # Assert
+        assert not supported
+        assert flight_client._connection.list_actions.call_count == 0
+
+    def test_create_training_dataset_splits(self, mocker):
+        # Arrange
+        flight_client, _ = self._arrange_flight_client(mocker, [])
+        td = self._arrange_split_training_dataset(mocker)
+        td._feature_store_name = "test_featurestore"
+        fv = mocker.Mock()
+        fv.name = "fv"
+        fv.version = 1
+
+        # Act
+        flight_client.create_training_dataset(fv, td, {"query_string": "SELECT 1"})
+
+        # Assert
+        action = flight_client._connection.do_action.call_args[0][0]
+        payload = json.loads(action.body.to_pybytes())
+        assert (
+            action.type
+            == arrow_flight_client.ArrowFlightClient.CREATE_SPLIT_TRAINING_DATASET_ACTION
+        )
+        assert payload["fs_name"] == "test"
+        assert payload["seed"] == 5
+        assert payload["train_split"] == "train"
+        assert [split["name"] for split in payload["splits"]] == ["train", "test"]
+        assert payload["splits"][0]["percentage"] == 0.8
+        assert payload["transformation_functions"] == [
+            {"feature": "a", "name": "min_max_scaler", "output_type": "DOUBLE"}
+        ]
+
+
+def min_max_scaler(value, min_value, max_value):
+    return (value - min_value) / (max_value - min_value)
+
+
+def plus_one(value):
+    return value + 1
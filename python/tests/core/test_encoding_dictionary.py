@@ -0,0 +1,83 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import pandas as pd
+import pytest
+
+from hsfs.core import encoding_dictionary
+
+
+class TestEncodingDictionary:
+    def test_getitem(self):
+        # Arrange
+        dictionary = encoding_dictionary.EncodingDictionary(["a", "b", None], "f")
+
+        # Act
+        result = [dictionary["b"], dictionary[None], dictionary["a"]]
+
+        # Assert
+        assert result == [1, 2, 0]
+        assert dictionary == {"a": 0, "b": 1, None: 2}
+
+    def test_getitem_unseen(self):
+        # Arrange
+        dictionary = encoding_dictionary.EncodingDictionary(["a", "b"], "f")
+
+        # Act
+        with pytest.raises(KeyError) as e_info:
+            dictionary["c"]
+
+        # Assert
+        assert "['c'] of feature 'f'" in str(e_info.value)
+
+    def test_encode(self):
+        # Arrange
+        dictionary = encoding_dictionary.EncodingDictionary(["a", "b", None], "f")
+        values = pd.Series(["b", None, "a"], index=[3, 4, 5], name="f")
+
+        # Act
+        result = dictionary.encode(values)
+
+        # Assert
+        assert result.tolist() == [1, 2, 0]
+        assert result.index.tolist() == [3, 4, 5]
+        assert result.name == "f"
+
+    def test_encode_unseen(self):
+        # Arrange
+        dictionary = encoding_dictionary.EncodingDictionary([1, 2], "f")
+
+        # Act
+        with pytest.raises(KeyError) as e_info:
+            dictionary.encode(pd.Series([1, 3, 3]))
+
+        # Assert
+        assert "[3] of feature 'f'" in str(e_info.value)
+
+    def test_from_unique_values_shared(self):
+        # Arrange
+        unique_values = ["a", "b"]
+
+        # Act
+        first = encoding_dictionary.EncodingDictionary.from_unique_values(
+            unique_values, "f"
+        )
+        second = encoding_dictionary.EncodingDictionary.from_unique_values(
+            unique_values, "f"
+        )
+
+        # Assert
+        assert first is second
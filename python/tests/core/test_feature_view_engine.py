@@ -13,6 +13,8 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
+import json
+
 import pytest
 
 from hsfs import (
@@ -726,6 +728,83 @@ class TestFeatureViewEngine:
         assert mock_fv_engine_read_from_storage_connector.call_count == 1
         assert mock_fv_engine_compute_training_dataset_statistics.call_count == 0
 
+    def test_get_training_data_iterator(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.core.feature_view_api.FeatureViewApi")
+        mock_fv_engine_get_training_data_metadata = mocker.patch(
+            "hsfs.core.feature_view_engine.FeatureViewEngine._get_training_data_metadata"
+        )
+        mock_engine_get_instance = mocker.patch("hsfs.engine.get_instance")
+
+        fv_engine = feature_view_engine.FeatureViewEngine(
+            feature_store_id=feature_store_id
+        )
+
+        fv = feature_view.FeatureView(
+            name="fv_name",
+            version=1,
+            query=query,
+            featurestore_id=feature_store_id,
+            labels=["label"],
+        )
+
+        td = training_dataset.TrainingDataset(
+            name="fv_name_1",
+            version=1,
+            data_format="parquet",
+            featurestore_id=feature_store_id,
+            splits={"train": 0.8, "test": 0.2},
+            location="hopsfs://test/fv_name_1",
+        )
+        mock_fv_engine_get_training_data_metadata.return_value = td
+
+        # Act
+        iterator = fv_engine.get_training_data_iterator(
+            fv, 1, split="train", batch_size=16
+        )
+
+        # Assert
+        assert (
+            mock_engine_get_instance.return_value.get_file_openers.call_args[0][1]
+            == "hopsfs://test/fv_name_1/train"
+        )
+        assert iterator._labels == ["label"]
+        assert iterator._batch_size == 16
+
+    def test_get_training_data_iterator_in_memory(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.core.feature_view_api.FeatureViewApi")
+        mock_fv_engine_get_training_data_metadata = mocker.patch(
+            "hsfs.core.feature_view_engine.FeatureViewEngine._get_training_data_metadata"
+        )
+        mock_engine_get_instance = mocker.patch("hsfs.engine.get_instance")
+
+        fv_engine = feature_view_engine.FeatureViewEngine(
+            feature_store_id=feature_store_id
+        )
+
+        mock_fv_engine_get_training_data_metadata.return_value = (
+            training_dataset.TrainingDataset(
+                name="fv_name_1",
+                version=1,
+                data_format="parquet",
+                featurestore_id=feature_store_id,
+                splits={},
+                training_dataset_type=training_dataset.TrainingDataset.IN_MEMORY,
+            )
+        )
+
+        # Act
+        with pytest.raises(FeatureStoreException):
+            fv_engine.get_training_data_iterator(None, 1)
+
+        # Assert
+        assert mock_engine_get_instance.return_value.get_file_openers.call_count == 0
+
     def test_get_training_data_td_version(self, mocker):
         # Arrange
         feature_store_id = 99
@@ -1820,6 +1899,183 @@ class TestFeatureViewEngine:
             == 1
         )
 
+    def test_get_batch_data_since_commit(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.core.feature_view_api.FeatureViewApi")
+        mocker.patch(
+            "hsfs.core.feature_view_engine.FeatureViewEngine._check_feature_group_accessibility"
+        )
+        mock_get_batch_query = mocker.patch(
+            "hsfs.core.feature_view_engine.FeatureViewEngine.get_batch_query"
+        )
+        mocker.patch("hsfs.engine.get_type")
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            time_travel_format="HUDI",
+        )
+        mocker.patch.object(
+            fg, "commit_details", return_value={1600000000000: {}, 1500000000000: {}}
+        )
+        query = mock_get_batch_query.return_value
+        query._left_feature_group = fg
+
+        fv_engine = feature_view_engine.FeatureViewEngine(feature_store_id=99)
+
+        # Act
+        fv_engine.get_batch_data(
+            feature_view_obj=None,
+            start_time=None,
+            end_time=None,
+            training_dataset_version=None,
+            transformation_functions=None,
+            read_options=None,
+            since_commit=1400000000000,
+        )
+
+        # Assert
+        assert query.left_feature_group_start_time == 1400000000000
+        assert query.left_feature_group_end_time == 1600000000000
+        assert query.read.call_args[1]["read_options"] == {}
+
+    def test_get_batch_data_checkpoint(self, mocker, tmp_path):
+        # Arrange
+        mocker.patch("hsfs.core.feature_view_api.FeatureViewApi")
+        mocker.patch(
+            "hsfs.core.feature_view_engine.FeatureViewEngine._check_feature_group_accessibility"
+        )
+        mock_get_batch_query = mocker.patch(
+            "hsfs.core.feature_view_engine.FeatureViewEngine.get_batch_query"
+        )
+        mocker.patch("hsfs.engine.get_type")
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            time_travel_format="HUDI",
+        )
+        mock_commit_details = mocker.patch.object(fg, "commit_details")
+        mock_commit_details.side_effect = [
+            {1500000000000: {}},
+            {1600000000000: {}},
+        ]
+        query = mock_get_batch_query.return_value
+        query._left_feature_group = fg
+        checkpoint_path = str(tmp_path / "checkpoint.json")
+
+        fv_engine = feature_view_engine.FeatureViewEngine(feature_store_id=99)
+
+        # Act
+        for _ in range(2):
+            fv_engine.get_batch_data(
+                feature_view_obj=None,
+                start_time=None,
+                end_time=None,
+                training_dataset_version=None,
+                transformation_functions=None,
+                read_options={"checkpoint_path": checkpoint_path},
+            )
+            fv_engine.commit_batch_checkpoint()
+
+        # Assert
+        assert query.left_feature_group_start_time == 1500000000000
+        assert query.left_feature_group_end_time == 1600000000000
+        with open(checkpoint_path) as checkpoint_file:
+            assert json.load(checkpoint_file) == {"commit_time": 1600000000000}
+
+    def test_get_batch_data_checkpoint_not_committed(self, mocker, tmp_path):
+        # Arrange
+        mocker.patch("hsfs.core.feature_view_api.FeatureViewApi")
+        mocker.patch(
+            "hsfs.core.feature_view_engine.FeatureViewEngine._check_feature_group_accessibility"
+        )
+        mock_get_batch_query = mocker.patch(
+            "hsfs.core.feature_view_engine.FeatureViewEngine.get_batch_query"
+        )
+        mocker.patch("hsfs.engine.get_type")
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            time_travel_format="HUDI",
+        )
+        mock_commit_details = mocker.patch.object(fg, "commit_details")
+        mock_commit_details.return_value = {1600000000000: {}}
+        query = mock_get_batch_query.return_value
+        query._left_feature_group = fg
+        checkpoint_path = str(tmp_path / "checkpoint.json")
+        with open(checkpoint_path, "w") as checkpoint_file:
+            json.dump({"commit_time": 1500000000000}, checkpoint_file)
+
+        fv_engine = feature_view_engine.FeatureViewEngine(feature_store_id=99)
+
+        # Act
+        # the batch is read but not processed successfully, so it is not committed
+        fv_engine.get_batch_data(
+            feature_view_obj=None,
+            start_time=None,
+            end_time=None,
+            training_dataset_version=None,
+            transformation_functions=None,
+            read_options={"checkpoint_path": checkpoint_path},
+        )
+
+        # Assert
+        with open(checkpoint_path) as checkpoint_file:
+            assert json.load(checkpoint_file) == {"commit_time": 1500000000000}
+        with pytest.raises(FeatureStoreException):
+            feature_view_engine.FeatureViewEngine(
+                feature_store_id=99
+            ).commit_batch_checkpoint()
+
+    def test_get_batch_data_since_commit_no_time_travel(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.core.feature_view_api.FeatureViewApi")
+        mocker.patch(
+            "hsfs.core.feature_view_engine.FeatureViewEngine._check_feature_group_accessibility"
+        )
+        mock_get_batch_query = mocker.patch(
+            "hsfs.core.feature_view_engine.FeatureViewEngine.get_batch_query"
+        )
+        mocker.patch("hsfs.engine.get_type")
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+        )
+        query = mock_get_batch_query.return_value
+        query._left_feature_group = fg
+
+        fv_engine = feature_view_engine.FeatureViewEngine(feature_store_id=99)
+
+        # Act
+        with pytest.raises(FeatureStoreException) as e_info:
+            fv_engine.get_batch_data(
+                feature_view_obj=None,
+                start_time=None,
+                end_time=None,
+                training_dataset_version=None,
+                transformation_functions=None,
+                since_commit=1400000000000,
+            )
+
+        # Assert
+        assert "time travel enabled" in str(e_info.value)
+        assert query.read.call_count == 0
+
     def test_add_tag(self, mocker):
         # Arrange
         feature_store_id = 99
@@ -26,17 +26,18 @@ class TestHudiEngine:
 
         mocker.patch("hsfs.core.hudi_engine.HudiEngine._write_hudi_dataset")
         mock_fg_api = mocker.patch("hsfs.core.feature_group_api.FeatureGroupApi")
+        fg = mocker.Mock()
 
         h_engine = hudi_engine.HudiEngine(
             feature_store_id=feature_store_id,
             feature_store_name=None,
-            feature_group=None,
+            feature_group=fg,
             spark_context=None,
             spark_session=None,
         )
 
         # Act
-        h_engine.save_hudi_fg(
+        result = h_engine.save_hudi_fg(
             dataset=None,
             save_mode=None,
             operation=None,
@@ -47,6 +48,9 @@ class TestHudiEngine:
         # Assert
         assert mock_fg_api.return_value.commit.call_count == 1
         assert mock_fg_api.return_value.commit.call_args[0][1].validation_id == 10
+        # the commit with the tuned write options is exposed on the feature group
+        assert fg._last_commit is result
+        assert result is mock_fg_api.return_value.commit.return_value
 
     def test_delete_record(self, mocker):
         # Arrange
@@ -273,6 +277,204 @@ class TestHudiEngine:
             "test_name": "test_value",
         }
 
+    def test_setup_hudi_write_opts_auto_tuning(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type")
+        mocker.patch(
+            "hsfs.core.hudi_engine.HudiEngine._estimate_size_in_bytes",
+            return_value=300 * 1024 * 1024,
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=["key1", "key2"],
+            partition_key=["key3", "key4"],
+            hudi_precombine_key=[],
+        )
+
+        spark_context = mocker.Mock()
+        spark_context.defaultParallelism = 4
+        dataset = mocker.Mock()
+        dataset.rdd.getNumPartitions.return_value = 8
+
+        h_engine = hudi_engine.HudiEngine(
+            feature_store_id=99,
+            feature_store_name=None,
+            feature_group=fg,
+            spark_context=spark_context,
+            spark_session=None,
+        )
+
+        # Act
+        result = h_engine._setup_hudi_write_opts(
+            operation="test",
+            write_options={"hoodie.upsert.shuffle.parallelism": "10"},
+            dataset=dataset,
+        )
+
+        # Assert
+        assert result["hoodie.bulkinsert.shuffle.parallelism"] == "3"
+        assert result["hoodie.insert.shuffle.parallelism"] == "3"
+        assert result["hoodie.upsert.shuffle.parallelism"] == "10"
+        assert result["hoodie.parquet.max.file.size"] == str(128 * 1024 * 1024)
+        assert result["hoodie.parquet.small.file.limit"] == str(100 * 1024 * 1024)
+        assert result["hoodie.bulkinsert.sort.mode"] == "GLOBAL_SORT"
+
+    def test_setup_hudi_write_opts_auto_tuning_unknown_size(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type")
+        mocker.patch(
+            "hsfs.core.hudi_engine.HudiEngine._estimate_size_in_bytes",
+            return_value=None,
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=["key1"],
+            partition_key=[],
+            hudi_precombine_key=[],
+        )
+
+        spark_context = mocker.Mock()
+        spark_context.defaultParallelism = 4
+        dataset = mocker.Mock()
+        dataset.rdd.getNumPartitions.return_value = 8
+
+        h_engine = hudi_engine.HudiEngine(
+            feature_store_id=99,
+            feature_store_name=None,
+            feature_group=fg,
+            spark_context=spark_context,
+            spark_session=None,
+        )
+
+        # Act
+        result = h_engine._setup_hudi_write_opts(
+            operation="test", write_options={}, dataset=dataset
+        )
+
+        # Assert
+        assert result["hoodie.bulkinsert.shuffle.parallelism"] == "8"
+        assert result["hoodie.bulkinsert.sort.mode"] == "NONE"
+
+    def test_setup_hudi_write_opts_auto_tuning_inflated_size(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type")
+        mocker.patch(
+            "hsfs.core.hudi_engine.HudiEngine._estimate_size_in_bytes",
+            return_value=10 * 1024**4,
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=["key1"],
+            partition_key=[],
+            hudi_precombine_key=[],
+        )
+
+        spark_context = mocker.Mock()
+        spark_context.defaultParallelism = 4
+        dataset = mocker.Mock()
+        dataset.rdd.getNumPartitions.return_value = 8
+
+        h_engine = hudi_engine.HudiEngine(
+            feature_store_id=99,
+            feature_store_name=None,
+            feature_group=fg,
+            spark_context=spark_context,
+            spark_session=None,
+        )
+
+        # Act
+        result = h_engine._setup_hudi_write_opts(
+            operation="test", write_options={}, dataset=dataset
+        )
+
+        # Assert
+        # the estimate of the optimizer doesn't result in more tasks than partitions
+        assert result["hoodie.bulkinsert.shuffle.parallelism"] == "8"
+
+    def test_setup_hudi_write_opts_auto_tuning_disabled(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type")
+        mock_hudi_engine_estimate_size_in_bytes = mocker.patch(
+            "hsfs.core.hudi_engine.HudiEngine._estimate_size_in_bytes"
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=["key1"],
+            partition_key=[],
+            hudi_precombine_key=[],
+        )
+
+        h_engine = hudi_engine.HudiEngine(
+            feature_store_id=99,
+            feature_store_name=None,
+            feature_group=fg,
+            spark_context=None,
+            spark_session=None,
+        )
+
+        # Act
+        result = h_engine._setup_hudi_write_opts(
+            operation="test",
+            write_options={"hudi_auto_tuning": False},
+            dataset=mocker.Mock(),
+        )
+
+        # Assert
+        assert mock_hudi_engine_estimate_size_in_bytes.call_count == 0
+        assert result["hoodie.bulkinsert.shuffle.parallelism"] == "5"
+        assert "hoodie.bulkinsert.sort.mode" not in result
+        assert "hudi_auto_tuning" not in result
+
+    def test_write_hudi_dataset_report_write_options(self, mocker):
+        # Arrange
+        mocker.patch(
+            "hsfs.core.hudi_engine.HudiEngine._setup_hudi_write_opts",
+            return_value={
+                "hoodie.bulkinsert.shuffle.parallelism": "3",
+                "hoodie.table.name": "test_1",
+            },
+        )
+        mock_hudi_engine_get_last_commit_metadata = mocker.patch(
+            "hsfs.core.hudi_engine.HudiEngine._get_last_commit_metadata"
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            id=10,
+            location="test",
+        )
+
+        h_engine = hudi_engine.HudiEngine(
+            feature_store_id=99,
+            feature_store_name=None,
+            feature_group=fg,
+            spark_context=None,
+            spark_session=None,
+        )
+
+        # Act
+        fg_commit = h_engine._write_hudi_dataset(
+            dataset=mocker.Mock(), save_mode="test", operation=None, write_options=None
+        )
+
+        # Assert
+        assert fg_commit == mock_hudi_engine_get_last_commit_metadata.return_value
+        assert fg_commit.write_options == {"hoodie.bulkinsert.shuffle.parallelism": "3"}
+
     def test_setup_hudi_read_opts(self, mocker):
         # Arrange
         feature_store_id = 99
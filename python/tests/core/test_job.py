@@ -15,7 +15,7 @@
 #
 
 
-from hsfs.core import job
+from hsfs.core import execution, job
 
 
 class TestJob:
@@ -44,3 +44,48 @@ class TestJob:
         assert j.name == "test_name"
         assert j.executions is None
         assert j.href is None
+
+    def test_wait_for_jobs(self, mocker):
+        # Arrange
+        mock_job_api = mocker.patch("hsfs.core.job_api.JobApi")
+        mock_sleep = mocker.patch("time.sleep")
+
+        job_1, job_2 = mocker.Mock(), mocker.Mock()
+        final_status = {
+            job_1: iter(["SUCCEEDED"]),
+            job_2: iter(["UNDEFINED", "SUCCEEDED"]),
+        }
+        mock_job_api.return_value.last_execution.side_effect = lambda j: [
+            execution.Execution(id=1, state=None, final_status=next(final_status[j]))
+        ]
+
+        # Act
+        job.Job.wait_for_jobs([job_1, job_2])
+
+        # Assert
+        assert mock_job_api.return_value.last_execution.call_count == 3
+        assert mock_sleep.call_count == 1
+
+    def test_wait_for_completion_engine_independent(self, mocker):
+        # Arrange
+        mock_job_api = mocker.patch("hsfs.core.job_api.JobApi")
+        mock_get_instance = mocker.patch("hsfs.engine.get_instance")
+        mock_job_api.return_value.last_execution.return_value = [
+            execution.Execution(id=1, state=None, final_status="SUCCEEDED")
+        ]
+        j = job.Job(
+            id=1,
+            name="test_job",
+            creation_time=None,
+            config={},
+            job_type=None,
+            creator=None,
+        )
+
+        # Act
+        j.wait_for_completion()
+
+        # Assert
+        # the spark engine does not implement waiting for jobs
+        assert mock_get_instance.call_count == 0
+        assert mock_job_api.return_value.last_execution.call_count == 1
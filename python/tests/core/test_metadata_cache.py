@@ -0,0 +1,184 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import threading
+
+from hsfs.core import feature_group_api, metadata_cache, storage_connector_api
+
+
+class TestMetadataCache:
+    def _arrange_client(self, mocker, status_code=200, etag='"1"'):
+        mock_client = mocker.patch("hsfs.client.get_instance")
+        mock_client.return_value._project_id = 1
+        mock_client.return_value._base_url = "https://hopsworks"
+        response = mock_client.return_value._send_request.return_value
+        response.status_code = status_code
+        response.content = b'{"name": "fg"}'
+        response.json.return_value = {"name": "fg"}
+        response.headers = {"ETag": etag}
+        return mock_client.return_value
+
+    def _send_request(self, cache, name="fg", version=1):
+        return cache.send_request(
+            metadata_cache.FEATURE_GROUP,
+            99,
+            name,
+            version,
+            ["featuregroups", name],
+            {"version": version},
+        )
+
+    def test_send_request_cached(self, mocker):
+        # Arrange
+        mock_client = self._arrange_client(mocker)
+        cache = metadata_cache.MetadataCache()
+
+        # Act
+        first = self._send_request(cache)
+        first["name"] = "modified"
+        second = self._send_request(cache)
+
+        # Assert
+        assert mock_client._send_request.call_count == 1
+        assert second == {"name": "fg"}
+
+    def test_send_request_revalidate(self, mocker):
+        # Arrange
+        mock_client = self._arrange_client(mocker)
+        cache = metadata_cache.MetadataCache(ttl=0)
+
+        # Act
+        self._send_request(cache)
+        mock_client._send_request.return_value.status_code = 304
+        mock_client._send_request.return_value.json.return_value = None
+        result = self._send_request(cache)
+
+        # Assert
+        assert mock_client._send_request.call_count == 2
+        assert mock_client._send_request.call_args[1]["headers"] == {
+            "If-None-Match": '"1"'
+        }
+        assert result == {"name": "fg"}
+
+    def test_send_request_bypass(self, mocker):
+        # Arrange
+        mock_client = self._arrange_client(mocker)
+        cache = metadata_cache.MetadataCache()
+
+        # Act
+        self._send_request(cache)
+        with cache.bypass():
+            self._send_request(cache)
+        self._send_request(cache)
+
+        # Assert
+        assert mock_client._send_request.call_count == 2
+        assert "stream" not in mock_client._send_request.call_args_list[1][1]
+
+    def test_send_request_temporary_credentials(self, mocker):
+        # Arrange
+        mock_client = self._arrange_client(mocker)
+        cache = metadata_cache.MetadataCache()
+
+        # Act
+        for _ in range(2):
+            cache.send_request(
+                metadata_cache.STORAGE_CONNECTOR,
+                99,
+                "s3",
+                None,
+                ["storageconnectors", "s3"],
+                {"temporaryCredentials": True},
+            )
+
+        # Assert
+        assert mock_client._send_request.call_count == 2
+
+    def test_storage_connector_get_not_cached(self, mocker):
+        # Arrange
+        mock_client = self._arrange_client(mocker)
+        mock_client._send_request.return_value = {
+            "type": "featurestoreS3ConnectorDTO",
+            "storageConnectorType": "S3",
+            "id": 1,
+            "name": "s3",
+            "featurestoreId": 99,
+        }
+        cache = metadata_cache.MetadataCache()
+        mocker.patch("hsfs.core.metadata_cache.get_instance", return_value=cache)
+        sc_api = storage_connector_api.StorageConnectorApi(99)
+
+        # Act
+        sc_api.get("s3")
+        sc_api.get("s3")
+
+        # Assert
+        assert mock_client._send_request.call_count == 2
+        assert mock_client._send_request.call_args[1]["query_params"] == {
+            "temporaryCredentials": True
+        }
+
+    def test_propagate_bypass(self, mocker):
+        # Arrange
+        mock_client = self._arrange_client(mocker)
+        cache = metadata_cache.MetadataCache()
+        self._send_request(cache)
+
+        # Act
+        with cache.bypass():
+            send_request = cache.propagate(self._send_request)
+        thread = threading.Thread(target=send_request, args=(cache,))
+        thread.start()
+        thread.join()
+
+        # Assert
+        assert mock_client._send_request.call_count == 2
+
+    def test_invalidate(self, mocker):
+        # Arrange
+        mock_client = self._arrange_client(mocker)
+        cache = metadata_cache.MetadataCache()
+        self._send_request(cache, version=1)
+        self._send_request(cache, version=2)
+        self._send_request(cache, name="other")
+
+        # Act
+        cache.invalidate(metadata_cache.FEATURE_GROUP, 99, "fg")
+        self._send_request(cache, version=1)
+        self._send_request(cache, version=2)
+        self._send_request(cache, name="other")
+
+        # Assert
+        assert mock_client._send_request.call_count == 5
+
+    def test_feature_group_update_metadata_invalidates(self, mocker):
+        # Arrange
+        mock_client = self._arrange_client(mocker)
+        cache = metadata_cache.MetadataCache()
+        mocker.patch("hsfs.core.metadata_cache.get_instance", return_value=cache)
+        fg = mocker.MagicMock()
+        fg.name = "fg"
+        fg.version = 1
+        fg_api = feature_group_api.FeatureGroupApi(99)
+        self._send_request(cache)
+
+        # Act
+        fg_api.update_metadata(fg, fg, "updateMetadata")
+        self._send_request(cache)
+
+        # Assert
+        # initial get, update and get after invalidation
+        assert mock_client._send_request.call_count == 3
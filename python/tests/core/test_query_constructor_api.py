@@ -0,0 +1,114 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+from hsfs.core import query_constructor_api
+
+
+class TestQueryConstructorApi:
+    def _arrange_client(self, mocker, backend_fixtures):
+        query_constructor_api.QueryConstructorApi.invalidate_cache()
+        mock_client = mocker.patch("hsfs.client.get_instance")
+        mock_client.return_value._project_id = 1
+        mock_client.return_value._base_url = "https://hopsworks"
+        mock_client.return_value._send_request.return_value = backend_fixtures[
+            "fs_query"
+        ]["get_basic_info"]["response"]
+        return mock_client.return_value
+
+    def test_construct_query_cached(self, mocker, backend_fixtures):
+        # Arrange
+        mock_client = self._arrange_client(mocker, backend_fixtures)
+        query = mocker.MagicMock()
+        query.json.return_value = '{"leftFeatureGroup": 1}'
+        qc_api = query_constructor_api.QueryConstructorApi()
+
+        # Act
+        first = qc_api.construct_query(query)
+        second = query_constructor_api.QueryConstructorApi().construct_query(query)
+
+        # Assert
+        assert mock_client._send_request.call_count == 1
+        # spines registered on one query don't leak into the other
+        assert first is not second
+        assert first.query == second.query
+
+    def test_construct_query_different_cluster(self, mocker, backend_fixtures):
+        # Arrange
+        mock_client = self._arrange_client(mocker, backend_fixtures)
+        query = mocker.MagicMock()
+        query.json.return_value = '{"leftFeatureGroup": 1}'
+        qc_api = query_constructor_api.QueryConstructorApi()
+
+        # Act
+        qc_api.construct_query(query)
+        mock_client._base_url = "https://other-hopsworks"
+        qc_api.construct_query(query)
+
+        # Assert
+        assert mock_client._send_request.call_count == 2
+
+    def test_construct_query_different_query(self, mocker, backend_fixtures):
+        # Arrange
+        mock_client = self._arrange_client(mocker, backend_fixtures)
+        query1 = mocker.MagicMock()
+        query1.json.return_value = '{"leftFeatureGroup": 1}'
+        query2 = mocker.MagicMock()
+        query2.json.return_value = '{"leftFeatureGroup": 2}'
+        qc_api = query_constructor_api.QueryConstructorApi()
+
+        # Act
+        qc_api.construct_query(query1)
+        qc_api.construct_query(query2)
+        qc_api.construct_query(query1, use_cache=False)
+
+        # Assert
+        assert mock_client._send_request.call_count == 3
+
+    def test_construct_query_cache_bounded(self, mocker, backend_fixtures):
+        # Arrange
+        mock_client = self._arrange_client(mocker, backend_fixtures)
+        mocker.patch.object(
+            query_constructor_api.QueryConstructorApi, "CACHE_MAX_SIZE", 1
+        )
+        query1 = mocker.MagicMock()
+        query1.json.return_value = '{"leftFeatureGroup": 1}'
+        query2 = mocker.MagicMock()
+        query2.json.return_value = '{"leftFeatureGroup": 2}'
+        qc_api = query_constructor_api.QueryConstructorApi()
+
+        # Act
+        qc_api.construct_query(query1)
+        qc_api.construct_query(query2)
+        qc_api.construct_query(query1)
+
+        # Assert
+        assert mock_client._send_request.call_count == 3
+        assert len(query_constructor_api.QueryConstructorApi._cache) == 1
+
+    def test_invalidate_cache(self, mocker, backend_fixtures):
+        # Arrange
+        mock_client = self._arrange_client(mocker, backend_fixtures)
+        query = mocker.MagicMock()
+        query.json.return_value = '{"leftFeatureGroup": 1}'
+        qc_api = query_constructor_api.QueryConstructorApi()
+
+        # Act
+        qc_api.construct_query(query)
+        query_constructor_api.QueryConstructorApi.invalidate_cache()
+        qc_api.construct_query(query)
+
+        # Assert
+        assert mock_client._send_request.call_count == 2
@@ -0,0 +1,202 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import copy
+import os
+
+import pandas as pd
+
+from hsfs import feature_group, feature
+from hsfs.core import query_result_cache
+from hsfs.engine import python
+
+
+class TestQueryResultCache:
+    def _arrange_query(self, mocker, commit_id):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        mocker.patch("hsfs.engine.get_instance", return_value=python.Engine())
+        mocker.patch("hsfs.client.get_instance")
+        mocker.patch(
+            "hsfs.feature_group.FeatureGroup.commit_details",
+            return_value={commit_id: {}},
+        )
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            features=[
+                feature.Feature("id", hudi_precombine_key=True, feature_group_id=10)
+            ],
+            id=10,
+            time_travel_format="HUDI",
+        )
+        return fg.select_all()
+
+    def _arrange_cache(self, mocker, tmp_path, max_size=1024 * 1024):
+        cache = query_result_cache.QueryResultCache(
+            cache_dir=str(tmp_path), max_size=max_size
+        )
+        mocker.patch("hsfs.core.query_result_cache.get_instance", return_value=cache)
+        return cache
+
+    def test_read_cache_hit(self, mocker, tmp_path):
+        # Arrange
+        query = self._arrange_query(mocker, 1)
+        self._arrange_cache(mocker, tmp_path)
+        mock_prep_read = mocker.patch(
+            "hsfs.constructor.query.Query._prep_read", return_value=("", None)
+        )
+        mock_sql = mocker.patch(
+            "hsfs.engine.python.Engine.sql",
+            return_value=pd.DataFrame({"id": [1, 2, 3]}),
+        )
+
+        # Act
+        first_df = query.read(read_options={"use_result_cache": True})
+        second_df = query.read(read_options={"use_result_cache": True})
+
+        # Assert
+        assert mock_prep_read.call_count == 1
+        assert mock_sql.call_count == 1
+        assert first_df.equals(second_df)
+
+    def test_read_cache_invalidated_by_commit(self, mocker, tmp_path):
+        # Arrange
+        query = self._arrange_query(mocker, 1)
+        self._arrange_cache(mocker, tmp_path)
+        mocker.patch("hsfs.constructor.query.Query._prep_read", return_value=("", None))
+        mock_sql = mocker.patch(
+            "hsfs.engine.python.Engine.sql",
+            side_effect=[pd.DataFrame({"id": [1]}), pd.DataFrame({"id": [1, 2]})],
+        )
+
+        # Act
+        query.read(read_options={"use_result_cache": True})
+        mocker.patch(
+            "hsfs.feature_group.FeatureGroup.commit_details",
+            return_value={2: {}},
+        )
+        df = query.read(read_options={"use_result_cache": True})
+
+        # Assert
+        assert mock_sql.call_count == 2
+        assert df["id"].tolist() == [1, 2]
+        # stale entry of the previous commit is removed
+        assert len(os.listdir(tmp_path)) == 1
+
+    def test_read_cache_disabled(self, mocker, tmp_path):
+        # Arrange
+        query = self._arrange_query(mocker, 1)
+        self._arrange_cache(mocker, tmp_path)
+        mocker.patch("hsfs.constructor.query.Query._prep_read", return_value=("", None))
+        mock_sql = mocker.patch(
+            "hsfs.engine.python.Engine.sql", return_value=pd.DataFrame({"id": [1]})
+        )
+
+        # Act
+        query.read()
+        query.read()
+
+        # Assert
+        assert mock_sql.call_count == 2
+        assert len(os.listdir(tmp_path)) == 0
+
+    def test_evict(self, mocker, tmp_path):
+        # Arrange
+        cache = self._arrange_cache(mocker, tmp_path, max_size=0)
+
+        # Act
+        cache.put(("a", "b"), pd.DataFrame({"id": [1]}))
+
+        # Assert
+        assert cache.get(("a", "b")) is None
+
+    def test_put_cache_dir_not_writable(self, mocker, tmp_path):
+        # Arrange
+        cache = self._arrange_cache(mocker, tmp_path)
+        mocker.patch("os.makedirs", side_effect=PermissionError("denied"))
+
+        # Act
+        cache.put(("a", "b"), pd.DataFrame({"id": [1]}))
+
+        # Assert
+        assert cache.get(("a", "b")) is None
+
+    def test_get_key_cluster(self, mocker):
+        # Arrange
+        query = self._arrange_query(mocker, 1)
+        mock_client = mocker.patch("hsfs.client.get_instance")
+        cache = query_result_cache.QueryResultCache()
+
+        # Act
+        mock_client.return_value._base_url = "https://cluster1"
+        first_key = cache.get_key(query, {})
+        mock_client.return_value._base_url = "https://cluster2"
+        second_key = cache.get_key(query, {})
+
+        # Assert
+        assert first_key[0] != second_key[0]
+
+    def test_get_key_self_join(self, mocker):
+        # Arrange
+        query = self._arrange_query(mocker, 1)
+        # same feature group, fetched as a separate object
+        other_fg = copy.copy(query._left_feature_group)
+        query = query.join(other_fg.select_all(), on=["id"])
+        mock_commit_details = mocker.patch(
+            "hsfs.feature_group.FeatureGroup.commit_details",
+            return_value={1: {}},
+        )
+        cache = query_result_cache.QueryResultCache()
+
+        # Act
+        cache.get_key(query, {})
+
+        # Assert
+        assert mock_commit_details.call_count == 1
+
+    def test_get_without_lock(self, mocker, tmp_path):
+        # Arrange
+        cache = self._arrange_cache(mocker, tmp_path)
+        cache.put(("a", "b"), pd.DataFrame({"id": [1]}))
+
+        # Act
+        with cache._lock:
+            df = cache.get(("a", "b"))
+
+        # Assert
+        assert df["id"].tolist() == [1]
+
+    def test_default_cache_dir(self):
+        # Assert
+        assert query_result_cache.QueryResultCache.DEFAULT_CACHE_DIR.startswith(
+            os.path.expanduser("~")
+        )
+
+    def test_invalidate(self, mocker, tmp_path):
+        # Arrange
+        cache = self._arrange_cache(mocker, tmp_path)
+        cache.put(("a", "b"), pd.DataFrame({"id": [1]}))
+        cache.put(("c", "d"), pd.DataFrame({"id": [1]}))
+
+        # Act
+        cache.invalidate()
+
+        # Assert
+        assert cache.get(("a", "b")) is None
+        assert cache.get(("c", "d")) is None
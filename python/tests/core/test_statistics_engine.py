@@ -14,11 +14,22 @@
 #   limitations under the License.
 #
 
+import json
+
+import numpy as np
+import pandas as pd
 import pytest
 
 from hsfs.client import exceptions
-from hsfs import training_dataset, feature_group, feature_view, statistics_config
-from hsfs.core import statistics_engine
+from hsfs import (
+    training_dataset,
+    feature_group,
+    feature_view,
+    statistics,
+    statistics_config,
+    util,
+)
+from hsfs.core import column_profiler, statistics_engine, training_data_shards
 from hsfs import engine
 
 engine._engine_type = "python"
@@ -446,6 +457,42 @@ class TestStatisticsEngine:
             == sc.exact_uniqueness
         )
 
+    def test_profile_statistics_training_data_shards(self, mocker, tmp_path):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.engine.get_type")
+        mock_engine_get_instance = mocker.patch("hsfs.engine.get_instance")
+
+        s_engine = statistics_engine.StatisticsEngine(feature_store_id, "featuregroup")
+
+        writer = training_data_shards.TrainingDataShardWriter(str(tmp_path))
+        writer.write(pd.DataFrame({"col1": [1, 2]}))
+        shards = writer.close(statistics='{"columns": []}')
+
+        # Act
+        result = s_engine.profile_statistics(
+            metadata_instance=fg, feature_dataframe=shards
+        )
+
+        # Assert
+        assert mock_engine_get_instance.return_value.profile.call_count == 0
+        assert result == '{"columns": []}'
+
+    def test_add_unique_values(self):
+        # Act
+        result = statistics_engine.StatisticsEngine.add_unique_values(
+            '{"columns": [{"column": "col1"}]}', {"col2": pd.Series(["a", "b"])}
+        )
+
+        # Assert
+        assert json.loads(result) == {
+            "columns": [
+                {"column": "col1"},
+                {"column": "col2", "unique_values": ["a", "b"]},
+            ]
+        }
+
     def test_profile_transformation_fn_statistics(self, mocker):
         # Arrange
         feature_store_id = 99
@@ -666,6 +713,139 @@ class TestStatisticsEngine:
         # Assert
         assert mock_statistics_engine_save_statistics.call_count == 1
 
+    def test_compute_incremental_statistics(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.client.get_instance")
+        mock_fg_read = mocker.patch("hsfs.feature_group.FeatureGroup.read")
+        mock_statistics_engine_save_statistics = mocker.patch(
+            "hsfs.core.statistics_engine.StatisticsEngine._save_statistics"
+        )
+        previous_stats = column_profiler.ColumnProfiler().update(
+            pd.DataFrame({"col1": [1.0, 2.0]})
+        )
+        mocker.patch(
+            "hsfs.core.statistics_engine.StatisticsEngine.get_last",
+            return_value=statistics.Statistics(
+                commit_time=1, content=previous_stats.to_json(include_sketches=True)
+            ),
+        )
+
+        s_engine = statistics_engine.StatisticsEngine(feature_store_id, "featuregroup")
+
+        # Act
+        stats = s_engine.compute_incremental_statistics(
+            metadata_instance=fg,
+            feature_dataframe=pd.DataFrame({"col1": [3.0, 4.0]}),
+            feature_group_commit_id=2,
+        )
+
+        # Assert
+        assert mock_fg_read.call_count == 0
+        assert mock_statistics_engine_save_statistics.call_count == 1
+        col1 = stats.content["columns"][0]
+        assert col1["numRecordsNonNull"] == 4
+        assert col1["minimum"] == 1.0
+        assert col1["maximum"] == 4.0
+        assert col1["mean"] == 2.5
+        assert stats.feature_group_commit_id == 2
+        assert "sketches" in stats.content
+
+    def test_compute_incremental_statistics_no_sketches(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.client.get_instance")
+        mock_fg_read = mocker.patch(
+            "hsfs.feature_group.FeatureGroup.read",
+            return_value=pd.DataFrame({"col1": [1.0, 2.0, 3.0]}),
+        )
+        mocker.patch("hsfs.core.statistics_engine.StatisticsEngine._save_statistics")
+        mocker.patch(
+            "hsfs.core.statistics_engine.StatisticsEngine.get_last",
+            return_value=statistics.Statistics(
+                commit_time=1, content='{"columns": []}'
+            ),
+        )
+
+        s_engine = statistics_engine.StatisticsEngine(feature_store_id, "featuregroup")
+
+        # Act
+        stats = s_engine.compute_incremental_statistics(
+            metadata_instance=fg,
+            feature_dataframe=pd.DataFrame({"col1": [3.0]}),
+            materialized=True,
+        )
+
+        # Assert
+        assert mock_fg_read.call_count == 1
+        assert stats.content["columns"][0]["numRecordsNonNull"] == 3
+
+    def test_compute_incremental_statistics_no_sketches_not_materialized(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.client.get_instance")
+        mock_fg_read = mocker.patch("hsfs.feature_group.FeatureGroup.read")
+        mock_statistics_engine_save_statistics = mocker.patch(
+            "hsfs.core.statistics_engine.StatisticsEngine._save_statistics"
+        )
+        mocker.patch(
+            "hsfs.core.statistics_engine.StatisticsEngine.get_last", return_value=None
+        )
+
+        s_engine = statistics_engine.StatisticsEngine(feature_store_id, "featuregroup")
+
+        # Act
+        with pytest.warns(util.StatisticsWarning):
+            stats = s_engine.compute_incremental_statistics(
+                metadata_instance=fg,
+                feature_dataframe=pd.DataFrame({"col1": [3.0]}),
+            )
+
+        # Assert
+        assert stats is None
+        assert mock_fg_read.call_count == 0
+        assert mock_statistics_engine_save_statistics.call_count == 0
+
+    def test_compute_incremental_statistics_sketches_compressed(self):
+        # Arrange
+        profiler = column_profiler.ColumnProfiler().update(
+            pd.DataFrame({"col1": np.arange(100000) % 5000})
+        )
+
+        # Act
+        content = json.loads(profiler.to_json(include_sketches=True))
+        restored = column_profiler.ColumnProfiler.from_sketches(content["sketches"])
+
+        # Assert
+        assert len(content["sketches"]) < len(json.dumps(profiler.to_sketches()))
+        assert restored.to_json() == profiler.to_json()
+
+    def test_compute_incremental_statistics_overwrite(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.client.get_instance")
+        mock_get_last = mocker.patch(
+            "hsfs.core.statistics_engine.StatisticsEngine.get_last"
+        )
+        mocker.patch("hsfs.core.statistics_engine.StatisticsEngine._save_statistics")
+
+        s_engine = statistics_engine.StatisticsEngine(feature_store_id, "featuregroup")
+
+        # Act
+        stats = s_engine.compute_incremental_statistics(
+            metadata_instance=fg,
+            feature_dataframe=pd.DataFrame({"col1": [3.0]}),
+            overwrite=True,
+        )
+
+        # Assert
+        assert mock_get_last.call_count == 0
+        assert stats.content["columns"][0]["numRecordsNonNull"] == 1
+
     def test_get_last(self, mocker):
         # Arrange
         feature_store_id = 99
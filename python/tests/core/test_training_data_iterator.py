@@ -0,0 +1,143 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import functools
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from hsfs.core import training_data_iterator
+
+
+class TestTrainingDataIterator:
+    def _arrange_file_openers(self, tmp_path, num_files=3, rows_per_file=10):
+        file_openers = []
+        for i in range(num_files):
+            path = str(tmp_path / f"part-{i}.parquet")
+            start = i * rows_per_file
+            pd.DataFrame(
+                {
+                    "col1": range(start, start + rows_per_file),
+                    "col2": [
+                        str(value) for value in range(start, start + rows_per_file)
+                    ],
+                    "label": range(start, start + rows_per_file),
+                }
+            ).to_parquet(path, index=False, row_group_size=4)
+            file_openers.append(functools.partial(open, path, "rb"))
+        return file_openers
+
+    def test_iter(self, tmp_path):
+        # Arrange
+        iterator = training_data_iterator.TrainingDataIterator(
+            self._arrange_file_openers(tmp_path), batch_size=8, labels=["label"]
+        )
+
+        # Act
+        batches = list(iterator)
+
+        # Assert
+        assert [len(labels["label"]) for _, labels in batches] == [8, 8, 8, 6]
+        assert list(batches[0][0].keys()) == ["col1", "col2"]
+        assert [value for features, _ in batches for value in features["col1"]] == list(
+            range(30)
+        )
+
+    def test_iter_columns_arrow(self, tmp_path):
+        # Arrange
+        iterator = training_data_iterator.TrainingDataIterator(
+            self._arrange_file_openers(tmp_path),
+            batch_size=16,
+            columns=["col2"],
+            dataframe_type="arrow",
+        )
+
+        # Act
+        batches = list(iterator)
+
+        # Assert
+        assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+        assert batches[0].schema.names == ["col2"]
+        assert sum(batch.num_rows for batch in batches) == 30
+
+    def test_iter_shuffle(self, tmp_path):
+        # Arrange
+        iterator = training_data_iterator.TrainingDataIterator(
+            self._arrange_file_openers(tmp_path),
+            batch_size=8,
+            shuffle_buffer=12,
+            seed=1,
+            dataframe_type="pandas",
+        )
+
+        # Act
+        first_epoch = pd.concat(list(iterator))["col1"].tolist()
+        second_epoch = pd.concat(list(iterator))["col1"].tolist()
+
+        # Assert
+        assert sorted(first_epoch) == sorted(second_epoch) == list(range(30))
+        assert first_epoch != list(range(30))
+        assert first_epoch != second_epoch
+
+    def test_iter_rank(self, tmp_path):
+        # Arrange
+        file_openers = self._arrange_file_openers(tmp_path)
+        iterators = [
+            training_data_iterator.TrainingDataIterator(
+                file_openers, batch_size=100, rank=rank, world_size=2
+            )
+            for rank in range(2)
+        ]
+
+        # Act
+        rows = [
+            [value for batch in iterator for value in batch["col1"]]
+            for iterator in iterators
+        ]
+
+        # Assert
+        assert rows[0] == list(range(0, 10)) + list(range(20, 30))
+        assert rows[1] == list(range(10, 20))
+
+    def test_iter_error(self, tmp_path):
+        # Arrange
+        def fail():
+            raise FileNotFoundError("missing")
+
+        iterator = training_data_iterator.TrainingDataIterator([fail], batch_size=8)
+
+        # Act
+        with pytest.raises(FileNotFoundError):
+            list(iterator)
+
+    def test_iter_stop_early(self, tmp_path):
+        # Arrange
+        iterator = training_data_iterator.TrainingDataIterator(
+            self._arrange_file_openers(tmp_path), batch_size=2, prefetch=1
+        )
+
+        # Act
+        for batch in iterator:
+            break
+
+        # Assert
+        assert len(batch["col1"]) == 2
+
+    def test_init_invalid_dataframe_type(self):
+        # Act
+        with pytest.raises(TypeError):
+            training_data_iterator.TrainingDataIterator([], 8, dataframe_type="spark")
@@ -0,0 +1,83 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import os
+
+import pandas as pd
+
+from hsfs.core import training_data_shards
+
+
+class TestTrainingDataShards:
+    def test_write(self, tmp_path):
+        # Arrange
+        writer = training_data_shards.TrainingDataShardWriter(str(tmp_path))
+
+        # Act
+        writer.write(pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]}))
+        writer.write(pd.DataFrame({"col1": [], "col2": []}))
+        writer.write(pd.DataFrame({"col1": [3], "col2": ["c"]}))
+        shards = writer.close()
+
+        # Assert
+        assert len(shards) == 3
+        assert len(shards.paths) == 2
+        assert shards.columns == ["col1", "col2"]
+        assert list(shards.read()["col1"]) == [1, 2, 3]
+        assert [len(batch) for batch in shards.iter_batches()] == [2, 1]
+
+    def test_select_drop(self, tmp_path):
+        # Arrange
+        writer = training_data_shards.TrainingDataShardWriter(str(tmp_path))
+        writer.write(pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]}))
+        shards = writer.close()
+
+        # Act
+        selected = shards.select(["col2"])
+        dropped = shards.drop(["col2"])
+
+        # Assert
+        assert selected.read().columns.tolist() == ["col2"]
+        assert dropped.read().columns.tolist() == ["col1"]
+        assert len(selected) == len(dropped) == 2
+
+    def test_read_empty(self, tmp_path):
+        # Arrange
+        writer = training_data_shards.TrainingDataShardWriter(str(tmp_path))
+        writer.write(pd.DataFrame({"col1": []}))
+        shards = writer.close()
+
+        # Act
+        result = shards.read()
+
+        # Assert
+        assert len(result) == 0
+        assert result.columns.tolist() == ["col1"]
+        assert len(shards.head(1)) == 0
+
+    def test_delete(self, tmp_path):
+        # Arrange
+        writer = training_data_shards.TrainingDataShardWriter(str(tmp_path))
+        writer.write(pd.DataFrame({"col1": [1]}))
+        shards = writer.close()
+        paths = shards.paths
+
+        # Act
+        shards.delete()
+
+        # Assert
+        assert not any(os.path.exists(path) for path in paths)
+        assert len(shards) == 0
@@ -0,0 +1,114 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import functools
+
+import pandas as pd
+import pytest
+
+from hsfs import transformation_function
+from hsfs.core import encoding_dictionary, transformation_plan
+
+
+def plus_one(value):
+    return value + 1
+
+
+def times_two(values):
+    return values * 2
+
+
+def label_encoder(value, value_to_index):
+    return value_to_index[value]
+
+
+class TestTransformationPlan:
+    def _arrange_transformation_functions(self, mocker):
+        mocker.patch("hsfs.client.get_instance")
+        return {
+            "col_0": transformation_function.TransformationFunction(
+                99, transformation_fn=plus_one, output_type="int"
+            ),
+            "col_1": transformation_function.TransformationFunction(
+                99, transformation_fn=times_two, output_type="int", vectorized=True
+            ),
+        }
+
+    def test_init(self, mocker):
+        # Arrange
+        transformation_fns = self._arrange_transformation_functions(mocker)
+
+        # Act
+        plan = transformation_plan.TransformationPlan(transformation_fns)
+
+        # Assert
+        assert plan.per_value_features == ["col_0"]
+        assert plan.vectorized_features == ["col_1"]
+
+    def test_transform_dataframe(self, mocker):
+        # Arrange
+        transformation_fns = self._arrange_transformation_functions(mocker)
+        plan = transformation_plan.TransformationPlan(transformation_fns)
+        df = pd.DataFrame({"col_0": [1, 2], "col_1": [3, 4], "col_2": [5, 6]})
+
+        # Act
+        result = plan.transform_dataframe(df)
+
+        # Assert
+        assert result["col_0"].tolist() == [2, 3]
+        assert result["col_1"].tolist() == [6, 8]
+        assert result["col_2"].tolist() == [5, 6]
+
+    def test_transform_row(self, mocker):
+        # Arrange
+        transformation_fns = self._arrange_transformation_functions(mocker)
+        plan = transformation_plan.TransformationPlan(transformation_fns)
+
+        # Act
+        result = plan.transform_row({"col_1": 3, "col_2": 5})
+
+        # Assert
+        assert result == {"col_1": 6, "col_2": 5}
+
+    def test_transform_row_empty(self):
+        # Arrange
+        plan = transformation_plan.TransformationPlan(None)
+
+        # Act
+        result = plan.transform_row({"col_0": 1})
+
+        # Assert
+        assert result == {"col_0": 1}
+
+    def test_transform_row_unseen_label(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+        tf = transformation_function.TransformationFunction(
+            99, transformation_fn=label_encoder, output_type="int"
+        )
+        tf.transformation_fn = functools.partial(
+            label_encoder,
+            value_to_index=encoding_dictionary.EncodingDictionary(["a"], "col_0"),
+        )
+        plan = transformation_plan.TransformationPlan({"col_0": tf})
+
+        # Act
+        with pytest.raises(KeyError):
+            plan.transform_row({"col_0": "b"})
+        result = plan.transform_row({"col_0": "b"}, allow_missing=True)
+
+        # Assert
+        assert result == {"col_0": None}
@@ -0,0 +1,56 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+from hsfs.client.exceptions import RestAPIError
+from hsfs.core import variable_api
+
+
+class TestVariableApi:
+    def _arrange_client(self, mocker):
+        variable_api.VariableApi.invalidate_cache()
+        mock_client = mocker.patch("hsfs.client.get_instance")
+        mock_client.return_value._base_url = "https://hopsworks"
+        return mock_client.return_value
+
+    def test_get_flyingduck_enabled_cached(self, mocker):
+        # Arrange
+        mock_client = self._arrange_client(mocker)
+        mock_client._send_request.return_value = {"successMessage": "true"}
+
+        # Act
+        first = variable_api.VariableApi().get_flyingduck_enabled()
+        second = variable_api.VariableApi().get_flyingduck_enabled()
+
+        # Assert
+        assert first and second
+        assert mock_client._send_request.call_count == 1
+
+    def test_get_service_discovery_domain_error_not_cached(self, mocker):
+        # Arrange
+        mock_client = self._arrange_client(mocker)
+        mock_client._send_request.side_effect = [
+            RestAPIError("url", mocker.MagicMock()),
+            {"successMessage": "consul"},
+        ]
+
+        # Act
+        first = variable_api.VariableApi().get_service_discovery_domain()
+        second = variable_api.VariableApi().get_service_discovery_domain()
+
+        # Assert
+        assert first == ""
+        assert second == "consul"
+        assert mock_client._send_request.call_count == 2
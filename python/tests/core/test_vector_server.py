@@ -0,0 +1,335 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import json
+
+import pytest
+
+from hsfs import feature_view, statistics, transformation_function
+from hsfs.client.exceptions import FeatureStoreException
+from hsfs.core import vector_server
+from hsfs.constructor import serving_prepared_statement
+
+
+class TestVectorServer:
+    def _arrange_prepared_statements(self):
+        return [
+            serving_prepared_statement.ServingPreparedStatement(
+                prepared_statement_index=0,
+                prepared_statement_parameters=[{"name": "id", "index": 1}],
+                query_online="SELECT `fg0`.`id`, `fg0`.`a` FROM `test`.`fg_1` AS `fg0` "
+                "WHERE `fg0`.`id` = ?",
+            )
+        ]
+
+    def test_init_serving_single_and_batch(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+        mocker.patch("hsfs.util.get_online_connection_options")
+        mock_create_mysql_engine = mocker.patch(
+            "hsfs.util.create_mysql_engine_from_options"
+        )
+        mocker.patch(
+            "hsfs.core.vector_server.VectorServer._get_transformation_fns",
+            return_value={},
+        )
+        mock_get_prepared_statements = mocker.patch(
+            "hsfs.core.vector_server.VectorServer._get_prepared_statements",
+            side_effect=lambda entity, batch: self._arrange_prepared_statements(),
+        )
+        mock_sc_api = mocker.patch(
+            "hsfs.core.storage_connector_api.StorageConnectorApi"
+        )
+        server = vector_server.VectorServer(feature_store_id=99)
+
+        # Act
+        server.init_serving(mocker.MagicMock(), None, False)
+
+        # Assert
+        assert sorted(
+            call.args[1] for call in mock_get_prepared_statements.call_args_list
+        ) == [False, True]
+        # one connection pool to the online feature store for both kinds of retrieval
+        assert mock_sc_api.return_value.get_online_connector.call_count == 1
+        assert mock_create_mysql_engine.call_count == 1
+        assert str(server.prepared_statements[0]).endswith("`fg0`.`id` = :id")
+        assert str(server.batch_prepared_statements[0]).endswith(
+            "`fg0`.`id` = :batch_ids"
+        )
+        assert server.serving_keys == {"id"}
+        assert len(server._serving_key_by_serving_index[0]) == 1
+
+    def test_init_serving_batch_only(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+        mocker.patch("hsfs.util.get_online_connection_options")
+        mocker.patch("hsfs.util.create_mysql_engine_from_options")
+        mocker.patch(
+            "hsfs.core.vector_server.VectorServer._get_transformation_fns",
+            return_value={},
+        )
+        mock_get_prepared_statements = mocker.patch(
+            "hsfs.core.vector_server.VectorServer._get_prepared_statements",
+            side_effect=lambda entity, batch: self._arrange_prepared_statements(),
+        )
+        mocker.patch("hsfs.core.storage_connector_api.StorageConnectorApi")
+        server = vector_server.VectorServer(feature_store_id=99)
+
+        # Act
+        server.init_serving(mocker.MagicMock(), True, False)
+
+        # Assert
+        assert mock_get_prepared_statements.call_count == 1
+        assert server.prepared_statements is None
+        assert server.batch_prepared_statements is not None
+
+    def test_init_missing_prepared_statement(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+        mock_get_online_connection_options = mocker.patch(
+            "hsfs.util.get_online_connection_options"
+        )
+        mock_create_mysql_engine = mocker.patch(
+            "hsfs.util.create_mysql_engine_from_options"
+        )
+        mocker.patch(
+            "hsfs.core.vector_server.VectorServer._get_transformation_fns",
+            return_value={},
+        )
+        mock_get_prepared_statements = mocker.patch(
+            "hsfs.core.vector_server.VectorServer._get_prepared_statements",
+            side_effect=lambda entity, batch: self._arrange_prepared_statements(),
+        )
+        mocker.patch("hsfs.core.storage_connector_api.StorageConnectorApi")
+        server = vector_server.VectorServer(feature_store_id=99)
+        server.init_serving(mocker.MagicMock(), True, True)
+
+        # Act
+        server.init_missing_prepared_statement(mocker.MagicMock(), False)
+
+        # Assert
+        assert mock_get_prepared_statements.call_count == 2
+        assert mock_get_prepared_statements.call_args.args[1] is False
+        assert mock_create_mysql_engine.call_count == 1
+        assert mock_get_online_connection_options.call_args.args[1] is True
+        assert server._external is True
+        assert str(server.prepared_statements[0]).endswith("`fg0`.`id` = :id")
+        assert server.batch_prepared_statements is not None
+
+    def _arrange_initialised_server(self, mocker):
+        mocker.patch("hsfs.client.get_instance")
+        mocker.patch(
+            "hsfs.util.get_online_connection_options",
+            return_value={
+                "url": "jdbc:mysql://10.0.2.15:3306/test",
+                "user": "test_user",
+                "password": "secret",
+            },
+        )
+        mocker.patch("hsfs.util.create_mysql_engine_from_options")
+        mocker.patch(
+            "hsfs.core.vector_server.VectorServer._get_transformation_fns",
+            return_value={},
+        )
+        mocker.patch(
+            "hsfs.core.vector_server.VectorServer._get_prepared_statements",
+            side_effect=lambda entity, batch: self._arrange_prepared_statements(),
+        )
+        mock_sc_api = mocker.patch(
+            "hsfs.core.storage_connector_api.StorageConnectorApi"
+        )
+        mock_sc_api.return_value.get_online_connector.return_value.spark_options.return_value = {
+            "url": "jdbc:mysql://10.0.2.15:3306/test"
+        }
+        fv = feature_view.FeatureView(
+            name="test", query=mocker.MagicMock(), featurestore_id=99, version=1
+        )
+        server = vector_server.VectorServer(feature_store_id=99)
+        server.init_serving(fv, None, False)
+        return server, fv
+
+    def test_save_serving_state(self, mocker, tmp_path):
+        # Arrange
+        server, fv = self._arrange_initialised_server(mocker)
+        path = str(tmp_path / "serving_state.json")
+
+        # Act
+        server.save_serving_state(fv, path)
+
+        # Assert
+        with open(path) as state_file:
+            state = json.load(state_file)
+        assert state["entity"] == {
+            "type": "FeatureView",
+            "name": "test",
+            "version": 1,
+            "features": [],
+        }
+        assert state["online_connection"] == {
+            "url": "jdbc:mysql://10.0.2.15:3306/test",
+            "user": "test_user",
+        }
+        assert sorted(state["prepared_statements"]) == ["batch", "single"]
+
+    def test_init_serving_from_state(self, mocker, tmp_path):
+        # Arrange
+        server, fv = self._arrange_initialised_server(mocker)
+        path = str(tmp_path / "serving_state.json")
+        server.save_serving_state(fv, path)
+        mock_create_mysql_engine = mocker.patch(
+            "hsfs.util.create_mysql_engine_from_options"
+        )
+        mock_get_prepared_statements = mocker.patch(
+            "hsfs.core.vector_server.VectorServer._get_prepared_statements"
+        )
+        mock_sc_api = mocker.patch(
+            "hsfs.core.storage_connector_api.StorageConnectorApi"
+        )
+        restored_server = vector_server.VectorServer(feature_store_id=99)
+
+        # Act
+        restored_server.init_serving_from_state(fv, path, password="secret")
+
+        # Assert
+        assert mock_get_prepared_statements.call_count == 0
+        assert mock_sc_api.return_value.get_online_connector.call_count == 0
+        assert mock_create_mysql_engine.call_args[0][0] == {
+            "url": "jdbc:mysql://10.0.2.15:3306/test",
+            "user": "test_user",
+            "password": "secret",
+        }
+        assert restored_server.training_dataset_version is None
+        assert restored_server.serving_keys == {"id"}
+        assert str(restored_server.prepared_statements[0]) == str(
+            server.prepared_statements[0]
+        )
+        assert str(restored_server.batch_prepared_statements[0]) == str(
+            server.batch_prepared_statements[0]
+        )
+
+    def test_init_serving_from_state_external(self, mocker, tmp_path):
+        # Arrange
+        server, fv = self._arrange_initialised_server(mocker)
+        path = str(tmp_path / "serving_state.json")
+        server.save_serving_state(fv, path)
+        mocker.patch(
+            "hsfs.core.variable_api.VariableApi.get_loadbalancer_external_domain",
+            return_value="hopsworks.ai",
+        )
+        mock_create_mysql_engine = mocker.patch(
+            "hsfs.util.create_mysql_engine_from_options"
+        )
+        restored_server = vector_server.VectorServer(feature_store_id=99)
+
+        # Act
+        restored_server.init_serving_from_state(
+            fv, path, password="secret", external=True
+        )
+
+        # Assert
+        assert restored_server._external is True
+        assert (
+            mock_create_mysql_engine.call_args[0][0]["url"]
+            == "jdbc:mysql://hopsworks.ai:3306/test"
+        )
+
+    def test_init_serving_from_state_builtin_transformation(self, mocker, tmp_path):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+        mocker.patch("hsfs.util.create_mysql_engine_from_options")
+        mocker.patch(
+            "hsfs.core.vector_server.VectorServer._get_prepared_statements",
+            side_effect=lambda entity, batch: self._arrange_prepared_statements(),
+        )
+        mock_sc_api = mocker.patch(
+            "hsfs.core.storage_connector_api.StorageConnectorApi"
+        )
+        mock_sc_api.return_value.get_online_connector.return_value.spark_options.return_value = {
+            "url": "jdbc:mysql://10.0.2.15:3306/test"
+        }
+        tf = transformation_function.TransformationFunction(
+            99,
+            name="min_max_scaler",
+            version=1,
+            output_type="double",
+            source_code_content=json.dumps(
+                {
+                    "module_imports": "",
+                    "transformer_code": "def min_max_scaler(value, min_value, max_value):\n"
+                    "    return (value - min_value) / (max_value - min_value)\n",
+                }
+            ),
+        )
+        mocker.patch(
+            "hsfs.core.feature_view_engine.FeatureViewEngine.get_attached_transformation_fn",
+            return_value={"a": tf},
+        )
+        mocker.patch(
+            "hsfs.core.vector_server.VectorServer._get_transformation_statistics",
+            return_value=statistics.Statistics(
+                commit_time=1,
+                content=json.dumps(
+                    {
+                        "columns": [
+                            {
+                                "column": "a",
+                                "dataType": "Fractional",
+                                "minimum": 0.0,
+                                "maximum": 4.0,
+                            }
+                        ]
+                    }
+                ),
+            ),
+        )
+        fv = feature_view.FeatureView(
+            name="test", query=mocker.MagicMock(), featurestore_id=99, version=1
+        )
+        server = vector_server.VectorServer(
+            feature_store_id=99, training_dataset_version=1
+        )
+        server.init_serving(fv, None, False)
+        path = str(tmp_path / "serving_state.json")
+        server.save_serving_state(fv, path)
+        restored_server = vector_server.VectorServer(feature_store_id=99)
+
+        # Act
+        restored_server.init_serving_from_state(fv, path, password="secret")
+
+        # Assert
+        assert restored_server._apply_transformation({"id": 1, "a": 1.0}) == {
+            "id": 1,
+            "a": 0.25,
+        }
+        assert restored_server._apply_transformation(
+            {"id": 1, "a": 3.0}
+        ) == server._apply_transformation({"id": 1, "a": 3.0})
+
+    def test_init_serving_from_state_version_mismatch(self, mocker, tmp_path):
+        # Arrange
+        server, fv = self._arrange_initialised_server(mocker)
+        path = str(tmp_path / "serving_state.json")
+        server.save_serving_state(fv, path)
+        fv.version = 2
+
+        # Act
+        with pytest.raises(FeatureStoreException) as e_info:
+            vector_server.VectorServer(feature_store_id=99).init_serving_from_state(
+                fv, path, password="secret"
+            )
+
+        # Assert
+        assert "does not match FeatureView `test` version 2" in str(e_info.value)
@@ -14,6 +14,7 @@
 #   limitations under the License.
 #
 import decimal
+import json
 
 import pytest
 import pandas as pd
@@ -31,7 +32,13 @@ from hsfs import (
     util,
 )
 from hsfs.engine import python
-from hsfs.core import inode, execution, job
+from hsfs.core import (
+    inode,
+    execution,
+    job,
+    column_profiler,
+    transformation_function_engine,
+)
 from hsfs.constructor import query
 from hsfs.client import exceptions
 from hsfs.constructor.hudi_feature_group_alias import HudiFeatureGroupAlias
@@ -493,6 +500,116 @@ class TestPython:
         assert mock_boto3_client.call_count == 1
         assert mock_python_engine_read_pandas.call_count == 2
 
+    def test_get_file_openers_s3(self, mocker):
+        # Arrange
+        mock_boto3_client = mocker.patch("boto3.client")
+        mocker.patch("hsfs.storage_connector.S3Connector.refetch")
+
+        python_engine = python.Engine()
+
+        connector = storage_connector.S3Connector(
+            id=1, name="test_connector", featurestore_id=1, bucket="bucket"
+        )
+
+        mock_boto3_client.return_value.list_objects_v2.return_value = {
+            "is_truncated": False,
+            "Contents": [
+                {"Key": "td/train/_SUCCESS", "Size": 0},
+                {"Key": "td/train/part-0.parquet", "Size": 1},
+                {"Key": "td/train/part-1.parquet", "Size": 1},
+            ],
+        }
+        mock_boto3_client.return_value.get_object.return_value = {
+            "Body": mocker.Mock(read=mocker.Mock(return_value=b"content"))
+        }
+
+        # Act
+        file_openers = python_engine.get_file_openers(
+            storage_connector=connector, location="s3://bucket/td/train"
+        )
+
+        # Assert
+        assert len(file_openers) == 2
+        assert mock_boto3_client.return_value.get_object.call_count == 0
+        assert file_openers[1]().read() == b"content"
+        assert mock_boto3_client.return_value.get_object.call_args[1] == {
+            "Bucket": "bucket",
+            "Key": "td/train/part-1.parquet",
+        }
+
+    def test_get_file_openers_s3_sorted(self, mocker):
+        # Arrange
+        mock_boto3_client = mocker.patch("boto3.client")
+        mocker.patch("hsfs.storage_connector.S3Connector.refetch")
+
+        python_engine = python.Engine()
+
+        connector = storage_connector.S3Connector(
+            id=1, name="test_connector", featurestore_id=1, bucket="bucket"
+        )
+
+        mock_boto3_client.return_value.list_objects_v2.return_value = {
+            "is_truncated": False,
+            "Contents": [
+                {"Key": "td/train/part-1.parquet", "Size": 1},
+                {"Key": "td/train/part-0.parquet", "Size": 1},
+            ],
+        }
+        mock_boto3_client.return_value.get_object.return_value = {
+            "Body": mocker.Mock(read=mocker.Mock(return_value=b"content"))
+        }
+
+        # Act
+        file_openers = python_engine.get_file_openers(
+            storage_connector=connector, location="s3://bucket/td/train"
+        )
+        file_openers[0]()
+
+        # Assert
+        assert mock_boto3_client.return_value.get_object.call_args[1] == {
+            "Bucket": "bucket",
+            "Key": "td/train/part-0.parquet",
+        }
+
+    def test_get_file_openers_hopsfs_remote_sorted(self, mocker):
+        # Arrange
+        mock_dataset_api = mocker.patch("hsfs.core.dataset_api.DatasetApi")
+
+        python_engine = python.Engine()
+
+        mock_dataset_api.return_value.list_files.return_value = (
+            3,
+            [
+                mocker.Mock(path="td/train/part-1.parquet"),
+                mocker.Mock(path="td/train/_SUCCESS"),
+                mocker.Mock(path="td/train/part-0.parquet"),
+            ],
+        )
+        mock_dataset_api.return_value.read_content.return_value.content = b"content"
+
+        # Act
+        file_openers = python_engine._get_hopsfs_remote_file_openers("td/train")
+        file_openers[0]()
+
+        # Assert
+        assert len(file_openers) == 2
+        assert (
+            mock_dataset_api.return_value.read_content.call_args[0][0]
+            == "td/train/part-0.parquet"
+        )
+
+    def test_get_file_openers_other_connector(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        connector = storage_connector.JdbcConnector(
+            id=1, name="test_connector", featurestore_id=1
+        )
+
+        # Act
+        with pytest.raises(NotImplementedError):
+            python_engine.get_file_openers(storage_connector=connector, location=None)
+
     def test_read_s3_session_token(self, mocker):
         # Arrange
         mock_boto3_client = mocker.patch("boto3.client")
@@ -772,200 +889,139 @@ class TestPython:
             + "environment with Spark Engine."
         )
 
-    def test_profile(self, mocker):
+    def test_profile(self):
         # Arrange
-        mock_python_engine_convert_pandas_statistics = mocker.patch(
-            "hsfs.engine.python.Engine._convert_pandas_statistics"
+        python_engine = python.Engine()
+
+        d = {"col1": ["1", "2", None], "col2": [3, 4, 5]}
+        df = pd.DataFrame(data=d)
+
+        # Act
+        result = json.loads(
+            python_engine.profile(
+                df=df,
+                relevant_columns=None,
+                correlations=False,
+                histograms=True,
+                exact_uniqueness=True,
+            )
         )
 
-        python_engine = python.Engine()
+        # Assert
+        col1, col2 = result["columns"]
+        assert col1["column"] == "col1"
+        assert col1["dataType"] == "String"
+        assert col1["completeness"] == 2 / 3
+        assert col1["approximateNumDistinctValues"] == 2
+        assert col1["exactNumDistinctValues"] == 2
+        assert {"value": "NullValue", "count": 1, "ratio": 1 / 3} in col1["histogram"]
+        assert "mean" not in col1
+        assert col2["column"] == "col2"
+        assert col2["dataType"] == "Integral"
+        assert col2["completeness"] == 1
+        assert col2["mean"] == 4
+        assert col2["minimum"] == 3
+        assert col2["maximum"] == 5
+        assert col2["sum"] == 12
+        assert col2["stdDev"] == pytest.approx(np.std([3, 4, 5]))
+        assert len(col2["approxPercentiles"]) == 100
+        assert col2["approxPercentiles"][49] == 4
+        assert col2["uniqueness"] == 1
+        assert "correlations" not in col2
 
-        mock_python_engine_convert_pandas_statistics.side_effect = [
-            {"test_key": "test_value"},
-            {"test_key": "test_value"},
-        ]
+    def test_profile_relevant_columns(self):
+        # Arrange
+        python_engine = python.Engine()
 
-        d = {"col1": ["1", "2"], "col2": ["3", "4"]}
+        d = {"col1": [1.0, 2.0, 3.0], "col2": [3, 4, 5], "col3": ["a", "b", "c"]}
         df = pd.DataFrame(data=d)
 
         # Act
-        result = python_engine.profile(
-            df=df,
-            relevant_columns=None,
-            correlations=None,
-            histograms=None,
-            exact_uniqueness=True,
+        result = json.loads(
+            python_engine.profile(
+                df=df,
+                relevant_columns=["col1", "col2"],
+                correlations=True,
+                histograms=False,
+                exact_uniqueness=False,
+            )
         )
 
         # Assert
-        assert (
-            result == '{"columns": [{"test_key": "test_value", "dataType": "Integral", '
-            '"isDataTypeInferred": "false", "column": "col1", "completeness": 1}, '
-            '{"test_key": "test_value", "dataType": "Integral", "isDataTypeInferred": '
-            '"false", "column": "col2", "completeness": 1}]}'
-        )
-        assert mock_python_engine_convert_pandas_statistics.call_count == 2
+        assert [col["column"] for col in result["columns"]] == ["col1", "col2"]
+        col1 = result["columns"][0]
+        assert col1["dataType"] == "Fractional"
+        assert "histogram" not in col1
+        assert "exactNumDistinctValues" not in col1
+        assert col1["correlations"][1]["column"] == "col2"
+        assert col1["correlations"][1]["correlation"] == pytest.approx(1)
 
-    def test_profile_relevant_columns(self, mocker):
+    def test_profile_chunks(self):
         # Arrange
-        mock_python_engine_convert_pandas_statistics = mocker.patch(
-            "hsfs.engine.python.Engine._convert_pandas_statistics"
+        df = pd.DataFrame(
+            data={"col1": np.arange(1000, dtype="float64"), "col2": [None, "a"] * 500}
         )
+        df.loc[::100, "col1"] = np.nan
 
-        python_engine = python.Engine()
+        # Act
+        chunked = json.loads(
+            column_profiler.ColumnProfiler(chunk_size=7).update(df).to_json()
+        )
+        single = json.loads(column_profiler.ColumnProfiler().update(df).to_json())
 
-        mock_python_engine_convert_pandas_statistics.return_value = {
-            "test_key": "test_value"
-        }
+        # Assert
+        for chunked_col, single_col in zip(chunked["columns"], single["columns"]):
+            assert chunked_col.keys() == single_col.keys()
+            for key in ["completeness", "mean", "stdDev", "sum", "distinctness"]:
+                if key in single_col:
+                    assert chunked_col[key] == pytest.approx(single_col[key])
+            if "approxPercentiles" in single_col:
+                assert chunked_col["approxPercentiles"] == pytest.approx(
+                    single_col["approxPercentiles"], abs=1
+                )
 
-        d = {"col1": [1, 2], "col2": [3, 4]}
-        df = pd.DataFrame(data=d)
+    def test_profile_empty_dataframe(self):
+        # Arrange
+        df = pd.DataFrame({"col1": pd.Series(dtype="float64"), "col2": []})
 
         # Act
-        result = python_engine.profile(
-            df=df,
-            relevant_columns=["col1"],
-            correlations=None,
-            histograms=None,
-            exact_uniqueness=True,
+        result = json.loads(
+            column_profiler.ColumnProfiler().update(df).to_json(include_sketches=True)
         )
+        restored = column_profiler.ColumnProfiler.from_sketches(result["sketches"])
 
         # Assert
-        assert (
-            result
-            == '{"columns": [{"test_key": "test_value", "dataType": "Fractional", '
-            '"isDataTypeInferred": "false", "column": "col1", "completeness": 1}]}'
-        )
-        assert mock_python_engine_convert_pandas_statistics.call_count == 1
+        assert result["columns"][0]["numRecordsNonNull"] == 0
+        assert "correlations" not in result["columns"][0]
+        assert json.loads(restored.to_json())["columns"] == result["columns"]
 
-    def test_convert_pandas_statistics(self):
+    def test_profile_large_integers_distinct(self):
         # Arrange
-        python_engine = python.Engine()
+        # consecutive integers above 2**53 are not distinct as float64
+        df = pd.DataFrame({"col1": np.arange(2**60, 2**60 + 1000, dtype="int64")})
 
-        stat = {
-            "25%": 25,
-            "50%": 50,
-            "75%": 75,
-            "mean": 50,
-            "count": 100,
-            "max": 10,
-            "std": 33,
-            "min": 1,
-        }
+        # Act
+        result = json.loads(
+            column_profiler.ColumnProfiler(exact_uniqueness=False).update(df).to_json()
+        )
+
+        # Assert
+        assert result["columns"][0]["approximateNumDistinctValues"] == pytest.approx(
+            1000, rel=0.05
+        )
+
+    def test_profile_integral_floats_distinct(self):
+        # Arrange
+        profiler = column_profiler.ColumnProfiler(exact_uniqueness=False)
 
         # Act
-        result = python_engine._convert_pandas_statistics(stat=stat)
+        profiler.update(pd.DataFrame({"col1": np.arange(100, dtype="int64")}))
+        profiler.update(pd.DataFrame({"col1": np.arange(100, dtype="float64")}))
 
         # Assert
-        assert result == {
-            "approxPercentiles": [
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                25,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                50,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                75,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-            ],
-            "maximum": 10,
-            "mean": 50,
-            "minimum": 1,
-            "stdDev": 33,
-            "sum": 5000,
-        }
+        assert json.loads(profiler.to_json())["columns"][0][
+            "approximateNumDistinctValues"
+        ] == pytest.approx(100, rel=0.05)
 
     def test_validate(self):
         # Arrange
@@ -1739,6 +1795,115 @@ class TestPython:
         # Assert
         assert mock_python_engine_prepare_transform_split_df.call_count == 1
 
+    def test_get_training_data_streaming_splits(self, mocker, tmp_path):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+        mock_python_engine_prepare_transform_split_df = mocker.patch(
+            "hsfs.engine.python.Engine._prepare_transform_split_df"
+        )
+        mocker.patch(
+            "hsfs.engine.python.Engine._read_query_batches",
+            return_value=iter(
+                [
+                    pd.DataFrame({"col1": range(0, 50), "label": range(0, 50)}),
+                    pd.DataFrame({"col1": range(50, 100), "label": range(50, 100)}),
+                ]
+            ),
+        )
+
+        python_engine = python.Engine()
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={"train": 0.5, "test": 0.5},
+            seed=5,
+            id=10,
+        )
+        td.transformation_functions = {}
+
+        # Act
+        result = python_engine.get_training_data(
+            training_dataset_obj=td,
+            feature_view_obj=None,
+            query_obj=mocker.Mock(),
+            read_options={"streaming": True, "streaming_dir": str(tmp_path)},
+        )
+        features, labels = python_engine.split_labels(result["train"], ["label"])
+
+        # Assert
+        assert mock_python_engine_prepare_transform_split_df.call_count == 0
+        assert len(result["train"]) + len(result["test"]) == 100
+        assert len(result["train"].paths) == 2
+        assert all(path.startswith(str(tmp_path)) for path in result["train"].paths)
+        assert sorted(
+            result["train"].read()["col1"].tolist()
+            + result["test"].read()["col1"].tolist()
+        ) == list(range(100))
+        assert features.read().columns.tolist() == ["col1"]
+        assert labels.read().columns.tolist() == ["label"]
+        assert json.loads(result["test"].statistics)["columns"][0]["column"] == "col1"
+
+    def test_get_training_data_streaming_transformation_functions(
+        self, mocker, tmp_path
+    ):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        mock_statistics_api = mocker.patch("hsfs.core.statistics_api.StatisticsApi")
+        mocker.patch(
+            "hsfs.engine.python.Engine._read_query_batches",
+            return_value=iter(
+                [
+                    pd.DataFrame({"a": [1, 2], "c": ["x", "y"]}),
+                    pd.DataFrame({"a": [3, 5], "c": ["z", "x"]}),
+                ]
+            ),
+        )
+
+        python_engine = python.Engine()
+
+        def min_max_scaler(value, min_value, max_value):
+            return (value - min_value) / (max_value - min_value)
+
+        def label_encoder(value, value_to_index):
+            return value_to_index[value]
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={},
+            id=10,
+        )
+        td.transformation_functions = {
+            "a": transformation_function.TransformationFunction(
+                99, transformation_fn=min_max_scaler, output_type="double", version=1
+            ),
+            "c": transformation_function.TransformationFunction(
+                99, transformation_fn=label_encoder, output_type="int", version=1
+            ),
+        }
+
+        # Act
+        result = python_engine.get_training_data(
+            training_dataset_obj=td,
+            feature_view_obj=None,
+            query_obj=mocker.Mock(),
+            read_options={"streaming": True, "streaming_dir": str(tmp_path)},
+        )
+
+        # Assert
+        assert mock_statistics_api.return_value.post.call_count == 1
+        assert result.read()["a"].tolist() == [0.0, 0.25, 0.5, 1.0]
+        assert result.read()["c"].tolist() == [0, 1, 2, 0]
+        assert len(result) == 4
+        # the untransformed shards are removed after the second pass
+        assert not (tmp_path / "raw").exists()
+
     def test_split_labels(self):
         # Arrange
         python_engine = python.Engine()
@@ -1970,6 +2135,41 @@ class TestPython:
         for column in list(result):
             assert not result[column].empty
 
+    def test_random_split_seed(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+
+        python_engine = python.Engine()
+
+        d = {"col1": list(range(100)), "col2": list(range(100))}
+        df = pd.DataFrame(data=d)
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={"train": 0.7, "test": 0.3},
+            seed=42,
+            id=10,
+        )
+
+        # Act
+        result = python_engine._random_split(df=df, training_dataset_obj=td)
+        result_again = python_engine._random_split(df=df, training_dataset_obj=td)
+
+        # Assert
+        assert len(result["train"]) == 70
+        assert len(result["test"]) == 30
+        assert list(df.columns) == ["col1", "col2"]
+        assert result["train"].equals(result_again["train"])
+        assert result["test"].equals(result_again["test"])
+        # rows keep their order within a split
+        assert result["train"]["col1"].is_monotonic_increasing
+        assert set(result["train"]["col1"]) | set(result["test"]["col1"]) == set(
+            range(100)
+        )
+
     def test_random_split_size_precision_1(self, mocker):
         # In python sum([0.6, 0.3, 0.1]) != 1.0 due to floating point precision.
         # This test checks if different split ratios can be handled.
@@ -2169,6 +2369,46 @@ class TestPython:
         for column in list(result):
             assert result[column].equals(expected[column])
 
+    def test_time_series_split_datetime(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+
+        python_engine = python.Engine()
+
+        d = {
+            "col1": [1, 2, 3, 4],
+            "event_time": pd.to_datetime(
+                ["2022-01-01", "2022-02-01", "2022-01-15", "2022-03-01"]
+            ),
+        }
+        df = pd.DataFrame(data=d)
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={"col1": None, "col2": None},
+            id=10,
+            train_start=1640995200000,
+            train_end=1643673600000,
+            test_end=1646092800000,
+        )
+
+        # Act
+        result = python_engine._time_series_split(
+            df=df,
+            training_dataset_obj=td,
+            event_time="event_time",
+            drop_event_time=True,
+        )
+
+        # Assert
+        assert list(result) == ["train", "test"]
+        assert result["train"]["col1"].tolist() == [1, 3]
+        assert result["test"]["col1"].tolist() == [2]
+        assert list(result["train"].columns) == ["col1"]
+
     def test_convert_to_unix_timestamp_pandas(self):
         # Act
         result = util.convert_event_time_to_timestamp(
@@ -2297,6 +2537,109 @@ class TestPython:
         assert mock_td_api.return_value.compute.call_count == 1
         assert mock_python_engine_wait_for_job.call_count == 1
 
+    def test_write_training_dataset_arrow_flight_splits(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type")
+        mock_fv_api = mocker.patch("hsfs.core.feature_view_api.FeatureViewApi")
+        mock_td_api = mocker.patch("hsfs.core.training_dataset_api.TrainingDatasetApi")
+        mock_python_engine_wait_for_job = mocker.patch(
+            "hsfs.engine.python.Engine.wait_for_job"
+        )
+        mock_flight_client = mocker.patch(
+            "hsfs.core.arrow_flight_client.get_instance"
+        ).return_value
+        mock_flight_client.is_query_supported.return_value = True
+        mock_flight_client.is_training_dataset_supported.return_value = True
+        mock_flight_client.create_training_dataset.return_value = json.dumps(
+            {"transformation_statistics": {"columns": []}}
+        ).encode()
+        mock_populate = mocker.patch(
+            "hsfs.core.transformation_function_engine.TransformationFunctionEngine.populate_builtin_transformation_functions"
+        )
+
+        python_engine = python.Engine()
+
+        q = mocker.Mock()
+        q._prep_read.return_value = ({"query_string": "SELECT 1"}, None)
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="parquet",
+            featurestore_id=99,
+            splits={"train": 0.8, "test": 0.2},
+            train_split="train",
+        )
+        td.transformation_functions = {"a": mocker.Mock()}
+
+        fv = mocker.Mock()
+
+        # Act
+        python_engine.write_training_dataset(
+            training_dataset=td,
+            dataset=q,
+            user_write_options={},
+            save_mode=None,
+            feature_view_obj=fv,
+            to_df=False,
+        )
+
+        # Assert
+        assert mock_fv_api.return_value.compute_training_dataset.call_count == 0
+        assert mock_td_api.return_value.compute.call_count == 0
+        assert mock_python_engine_wait_for_job.call_count == 0
+        assert mock_flight_client.create_training_dataset.call_args[0] == (
+            fv,
+            td,
+            {"query_string": "SELECT 1"},
+            None,
+            False,
+        )
+        assert mock_populate.call_args[1]["stat_content"] == json.dumps({"columns": []})
+
+    def test_write_training_dataset_arrow_flight_missing_statistics(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type")
+        mocker.patch("hsfs.core.feature_view_api.FeatureViewApi")
+        mocker.patch("hsfs.core.training_dataset_api.TrainingDatasetApi")
+        mock_flight_client = mocker.patch(
+            "hsfs.core.arrow_flight_client.get_instance"
+        ).return_value
+        mock_flight_client.is_query_supported.return_value = True
+        mock_flight_client.is_training_dataset_supported.return_value = True
+        mock_flight_client.create_training_dataset.return_value = json.dumps(
+            {}
+        ).encode()
+
+        python_engine = python.Engine()
+
+        q = mocker.Mock()
+        q._prep_read.return_value = ({"query_string": "SELECT 1"}, None)
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="parquet",
+            featurestore_id=99,
+            splits={"train": 0.8, "test": 0.2},
+            train_split="train",
+        )
+        td.transformation_functions = {"a": mocker.Mock()}
+
+        # Act
+        with pytest.raises(exceptions.FeatureStoreException) as e_info:
+            python_engine.write_training_dataset(
+                training_dataset=td,
+                dataset=q,
+                user_write_options={},
+                save_mode=None,
+                feature_view_obj=mocker.Mock(),
+                to_df=False,
+            )
+
+        # Assert
+        assert "transformation_statistics" in str(e_info.value)
+
     def test_write_training_dataset_query_fv(self, mocker):
         # Arrange
         mocker.patch("hsfs.engine.get_type")
@@ -2600,6 +2943,79 @@ class TestPython:
         assert mock_job_api.return_value.last_execution.call_count == 1
         assert str(e_info.value) == "The Hopsworks Job was stopped"
 
+    def test_wait_for_job_backoff(self, mocker):
+        # Arrange
+        mock_job_api = mocker.patch("hsfs.core.job_api.JobApi")
+        mock_sleep = mocker.patch("time.sleep")
+        mocker.patch("random.uniform", return_value=1.0)
+
+        python_engine = python.Engine()
+
+        mock_job_api.return_value.last_execution.side_effect = [
+            [execution.Execution(id=1, state=None, final_status="undefined")],
+            [execution.Execution(id=1, state=None, final_status="undefined")],
+            [execution.Execution(id=1, state=None, final_status="undefined")],
+            [execution.Execution(id=1, state=None, final_status="succeeded")],
+        ]
+
+        # Act
+        python_engine.wait_for_job(job=None)
+
+        # Assert
+        assert mock_job_api.return_value.last_execution.call_count == 4
+        assert [call[0][0] for call in mock_sleep.call_args_list] == [0.5, 1.0, 2.0]
+
+    def test_wait_for_job_timeout(self, mocker):
+        # Arrange
+        mock_job_api = mocker.patch("hsfs.core.job_api.JobApi")
+        mocker.patch("time.sleep")
+        mocker.patch("time.monotonic", side_effect=[0, 5, 11])
+
+        python_engine = python.Engine()
+
+        mock_job_api.return_value.last_execution.return_value = [
+            execution.Execution(id=1, state=None, final_status="undefined")
+        ]
+        job = mocker.Mock()
+        job.name = "test_job"
+
+        # Act
+        with pytest.raises(exceptions.FeatureStoreException) as e_info:
+            python_engine.wait_for_job(job=job, timeout=10)
+
+        # Assert
+        assert mock_job_api.return_value.last_execution.call_count == 2
+        assert (
+            str(e_info.value)
+            == "Timed out after 10 seconds waiting for the Hopsworks Jobs ['test_job'] to finish"
+        )
+
+    def test_wait_for_jobs(self, mocker):
+        # Arrange
+        mock_job_api = mocker.patch("hsfs.core.job_api.JobApi")
+        mock_sleep = mocker.patch("time.sleep")
+
+        python_engine = python.Engine()
+
+        job_1, job_2 = mocker.Mock(), mocker.Mock()
+        final_status = {
+            job_1: iter(["succeeded"]),
+            job_2: iter(["undefined", "succeeded"]),
+        }
+        mock_job_api.return_value.last_execution.side_effect = lambda job: [
+            execution.Execution(id=1, state=None, final_status=next(final_status[job]))
+        ]
+
+        # Act
+        python_engine.wait_for_jobs([job_1, job_2])
+
+        # Assert
+        assert [
+            call[0][0]
+            for call in mock_job_api.return_value.last_execution.call_args_list
+        ] == [job_1, job_2, job_2]
+        assert mock_sleep.call_count == 1
+
     def test_add_file(self):
         # Arrange
         python_engine = python.Engine()
@@ -2654,6 +3070,92 @@ class TestPython:
         assert result["tf_name"][0] == 2
         assert result["tf_name"][1] == 3
 
+    def test_apply_transformation_function_vectorized(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+
+        python_engine = python.Engine()
+
+        def plus_one(a):
+            return a + 1
+
+        tf = transformation_function.TransformationFunction(
+            99,
+            transformation_fn=plus_one,
+            output_type="int",
+            vectorized=True,
+        )
+        mock_map = mocker.patch("pandas.Series.map")
+
+        df = pd.DataFrame(data={"tf_name": [1, 2]})
+
+        # Act
+        result = python_engine._apply_transformation_function(
+            transformation_functions={"tf_name": tf}, dataset=df
+        )
+
+        # Assert
+        assert mock_map.call_count == 0
+        assert result["tf_name"].tolist() == [2, 3]
+        assert json.loads(tf.source_code_content)["vectorized"] is True
+
+    def test_apply_transformation_function_builtin(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+
+        python_engine = python.Engine()
+
+        def min_max_scaler(value, min_value, max_value):
+            if value is None:
+                return None
+            try:
+                return (value - min_value) / (max_value - min_value)
+            except ZeroDivisionError:
+                return 0
+
+        def label_encoder(value, value_to_index):
+            return value_to_index[value]
+
+        transformation_fns = {}
+        for name, fn in [("a", min_max_scaler), ("b", min_max_scaler)]:
+            transformation_fns[name] = transformation_function.TransformationFunction(
+                99, transformation_fn=fn, output_type="double"
+            )
+        transformation_fns["c"] = transformation_function.TransformationFunction(
+            99, transformation_fn=label_encoder, output_type="int"
+        )
+        stat_content = {
+            "columns": [
+                {"column": "a", "dataType": "Integral", "minimum": 1, "maximum": 5},
+                {"column": "b", "dataType": "Integral", "minimum": 3, "maximum": 3},
+                {"column": "c", "unique_values": ["x", "y"]},
+            ]
+        }
+        for name, tf in transformation_fns.items():
+            transformation_function_engine.TransformationFunctionEngine.populate_builtin_fn_arguments(
+                name, tf, stat_content
+            )
+        df = pd.DataFrame(
+            data={"a": [1, 3, None], "b": [3, 3, None], "c": ["y", "x", "y"]}
+        )
+        expected = {
+            name: df[name].map(tf.transformation_fn).tolist()
+            for name, tf in transformation_fns.items()
+        }
+        mock_map = mocker.patch("pandas.Series.map")
+
+        # Act
+        result = python_engine._apply_transformation_function(
+            transformation_functions=transformation_fns, dataset=df
+        )
+
+        # Assert
+        assert mock_map.call_count == 0
+        assert result["a"].tolist()[:2] == expected["a"][:2] == [0.0, 0.5]
+        assert result["b"].tolist()[:2] == expected["b"][:2] == [0, 0]
+        assert pd.isna(result["a"][2]) and pd.isna(result["b"][2])
+        assert result["c"].tolist() == expected["c"] == [1, 0, 1]
+
     def test_get_unique_values(self):
         # Arrange
         python_engine = python.Engine()
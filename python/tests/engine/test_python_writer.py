@@ -54,7 +54,7 @@ class TestPythonWriter:
         topic_mock.topics = {"topic_name": "NA"}
         producer.list_topics = mocker.MagicMock(return_value=topic_mock)
         mocker.patch(
-            "hsfs.engine.python.Producer",
+            "confluent_kafka.Producer",
             return_value=producer,
         )
         python_engine = python.Engine()
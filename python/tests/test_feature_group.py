@@ -343,6 +343,148 @@ class TestFeatureGroup:
         mock_job_api.assert_called_once
         assert fg.materialization_job == mock_job
 
+    def _arrange_incremental_statistics(self, mocker, final_state):
+        mocker.patch("hsfs.engine.get_instance", return_value=python.Engine())
+        mock_compute = mocker.patch(
+            "hsfs.core.statistics_engine.StatisticsEngine.compute_incremental_statistics"
+        )
+        mock_commit_details = mocker.patch(
+            "hsfs.feature_group.FeatureGroup.commit_details",
+            return_value={1: {}, 2: {}},
+        )
+        mock_job = mocker.Mock()
+        mock_job.get_final_state.return_value = final_state
+
+        fg = feature_group.FeatureGroup(
+            name="test_fg",
+            version=2,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            id=10,
+            time_travel_format="HUDI",
+        )
+        return fg, mock_job, mock_compute, mock_commit_details
+
+    def test_compute_incremental_statistics_job_succeeded(self, mocker):
+        # Arrange
+        (
+            fg,
+            mock_job,
+            mock_compute,
+            mock_commit_details,
+        ) = self._arrange_incremental_statistics(mocker, "SUCCEEDED")
+
+        # Act
+        fg._compute_incremental_statistics(
+            None, mock_job, {"wait_for_job": True}, overwrite=False
+        )
+
+        # Assert
+        assert mock_commit_details.call_count == 1
+        assert mock_compute.call_args[1]["feature_group_commit_id"] == 2
+        assert mock_compute.call_args[1]["materialized"] is True
+
+    def test_compute_incremental_statistics_job_running(self, mocker):
+        # Arrange
+        (
+            fg,
+            mock_job,
+            mock_compute,
+            mock_commit_details,
+        ) = self._arrange_incremental_statistics(mocker, "UNDEFINED")
+
+        # Act
+        fg._compute_incremental_statistics(
+            None, mock_job, {"wait_for_job": True}, overwrite=False
+        )
+
+        # Assert
+        assert mock_commit_details.call_count == 0
+        assert mock_compute.call_args[1]["feature_group_commit_id"] is None
+        assert mock_compute.call_args[1]["materialized"] is False
+
+    def test_compute_incremental_statistics_job_not_awaited(self, mocker):
+        # Arrange
+        # the last execution belongs to an earlier insert
+        (
+            fg,
+            mock_job,
+            mock_compute,
+            mock_commit_details,
+        ) = self._arrange_incremental_statistics(mocker, "SUCCEEDED")
+
+        # Act
+        fg._compute_incremental_statistics(
+            None, mock_job, {"wait_for_job": False}, overwrite=False
+        )
+
+        # Assert
+        assert mock_job.get_final_state.call_count == 0
+        assert mock_compute.call_args[1]["materialized"] is False
+
+    def test_compute_incremental_statistics_job_not_started(self, mocker):
+        # Arrange
+        (
+            fg,
+            mock_job,
+            mock_compute,
+            mock_commit_details,
+        ) = self._arrange_incremental_statistics(mocker, "SUCCEEDED")
+
+        # Act
+        fg._compute_incremental_statistics(
+            None,
+            mock_job,
+            {"wait_for_job": True, "start_offline_materialization": False},
+            overwrite=False,
+        )
+
+        # Assert
+        assert mock_job.get_final_state.call_count == 0
+        assert mock_compute.call_args[1]["materialized"] is False
+
+    def test_compute_incremental_statistics_job_without_executions(self, mocker):
+        # Arrange
+        (
+            fg,
+            mock_job,
+            mock_compute,
+            mock_commit_details,
+        ) = self._arrange_incremental_statistics(mocker, None)
+        mock_job.get_final_state.side_effect = FeatureStoreException(
+            "No executions found for job"
+        )
+
+        # Act
+        fg._compute_incremental_statistics(
+            None, mock_job, {"wait_for_job": True}, overwrite=False
+        )
+
+        # Assert
+        assert mock_compute.call_args[1]["materialized"] is False
+
+    def test_use_incremental_statistics_rejected(self, mocker):
+        # Arrange
+        fg = feature_group.FeatureGroup(
+            name="test_fg",
+            version=2,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            id=10,
+        )
+        ge_report = mocker.Mock()
+        ge_report.ingestion_result = "REJECTED"
+
+        # Act
+        result = fg._use_incremental_statistics(
+            {"incremental_statistics": True}, ge_report
+        )
+
+        # Assert
+        assert not result
+
     def test_multi_part_insert_return_writer(self, mocker):
         fg = feature_group.FeatureGroup(
             name="test_fg",
@@ -64,3 +64,20 @@ class TestFeatureGroupCommit:
 
         # Assert
         assert len(fg_commit) == 0
+
+    def test_update_from_response_json_write_options(self, backend_fixtures):
+        # Arrange
+        json = backend_fixtures["feature_group_commit"]["get_list"]["response"][
+            "items"
+        ][0]
+        fg_commit = feature_group_commit.FeatureGroupCommit(
+            write_options={"hoodie.bulkinsert.shuffle.parallelism": "3"}
+        )
+
+        # Act
+        fg_commit.update_from_response_json({**json, "href": "test_href"})
+
+        # Assert
+        assert fg_commit.commitid == 11
+        assert fg_commit.write_options == {"hoodie.bulkinsert.shuffle.parallelism": "3"}
+        assert "writeOptions" not in fg_commit.to_dict()
@@ -15,8 +15,12 @@
 #
 
 
-from hsfs import feature_view, training_dataset_feature, transformation_function
+import pytest
+
+from hsfs import feature_view, training_dataset_feature, transformation_function, util
+from hsfs.client.exceptions import FeatureStoreException
 from hsfs.constructor import query, fs_query
+from hsfs.core import metadata_cache
 
 
 class TestFeatureView:
@@ -98,3 +102,124 @@ class TestFeatureView:
             updated_transformation_fn_dict["tf_name"]
             != updated_transformation_fn_dict["tf1_name"]
         )
+
+    def test_init_serving(self, mocker, backend_fixtures):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type")
+        mocker.patch("hsfs.client.get_instance")
+        mock_vector_server = mocker.patch("hsfs.core.vector_server.VectorServer")
+        json = backend_fixtures["feature_view"]["get"]["response"]
+        fv = feature_view.FeatureView.from_response_json(json)
+
+        # Act
+        fv.init_serving(training_dataset_version=2)
+
+        # Assert
+        assert mock_vector_server.call_count == 1
+        assert mock_vector_server.call_args.args[2] == 2
+        # single and batch vectors are served by the same server
+        mock_vector_server.return_value.init_serving.assert_called_once_with(
+            fv, None, None, options=None, concurrent_init=True
+        )
+        assert fv._batch_scoring_server is fv._vector_server
+
+    def test_init_serving_bypass_metadata_cache(self, mocker, backend_fixtures):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type")
+        mocker.patch("hsfs.client.get_instance")
+        mocker.patch("hsfs.core.vector_server.VectorServer")
+        cache = metadata_cache.MetadataCache()
+        mocker.patch("hsfs.core.metadata_cache.get_instance", return_value=cache)
+        bypassed = []
+        mocker.patch(
+            "hsfs.feature_view.FeatureView._init_batch_scoring_for_serving",
+            side_effect=lambda version: bypassed.append(cache._local.bypass),
+        )
+        json = backend_fixtures["feature_view"]["get"]["response"]
+        fv = feature_view.FeatureView.from_response_json(json)
+
+        # Act
+        with pytest.warns(util.VersionWarning), cache.bypass():
+            fv.init_serving()
+
+        # Assert
+        # the bypass of the calling thread applies to the requests of the workers
+        assert bypassed == [True]
+
+    def test_init_serving_not_concurrent(self, mocker, backend_fixtures):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type")
+        mocker.patch("hsfs.client.get_instance")
+        mock_vector_server = mocker.patch("hsfs.core.vector_server.VectorServer")
+        mock_executor = mocker.patch("hsfs.feature_view.ThreadPoolExecutor")
+        json = backend_fixtures["feature_view"]["get"]["response"]
+        fv = feature_view.FeatureView.from_response_json(json)
+
+        # Act
+        with pytest.warns(util.VersionWarning):
+            fv.init_serving(concurrent_init=False)
+
+        # Assert
+        assert mock_executor.call_count == 0
+        assert mock_vector_server.return_value.init_batch_scoring.call_count == 1
+        mock_vector_server.return_value.init_serving.assert_called_once_with(
+            fv, None, None, options=None, concurrent_init=False
+        )
+
+    def test_init_serving_from_state(self, mocker, backend_fixtures):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type")
+        mocker.patch("hsfs.client.get_instance")
+        mock_vector_server = mocker.patch("hsfs.core.vector_server.VectorServer")
+        json = backend_fixtures["feature_view"]["get"]["response"]
+        fv = feature_view.FeatureView.from_response_json(json)
+
+        # Act
+        fv.init_serving_from_state("serving_state.json", password="secret")
+
+        # Assert
+        mock_vector_server.return_value.init_serving_from_state.assert_called_once_with(
+            fv, "serving_state.json", options=None, password="secret", external=None
+        )
+        assert mock_vector_server.return_value.init_serving.call_count == 0
+        assert fv._batch_scoring_server is fv._vector_server
+
+    def test_save_serving_state_not_initialised(self, mocker, backend_fixtures):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type")
+        mocker.patch("hsfs.client.get_instance")
+        json = backend_fixtures["feature_view"]["get"]["response"]
+        fv = feature_view.FeatureView.from_response_json(json)
+
+        # Act
+        with pytest.raises(FeatureStoreException) as e_info:
+            fv.save_serving_state("serving_state.json")
+
+        # Assert
+        assert "Call `init_serving`" in str(e_info.value)
+
+    def test_init_serving_no_training_dataset_version(self, mocker, backend_fixtures):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type")
+        mocker.patch("hsfs.client.get_instance")
+        mock_vector_server = mocker.patch("hsfs.core.vector_server.VectorServer")
+        mock_vector_server.return_value.init_batch_scoring.side_effect = [
+            ValueError("Training data version is required for transformation"),
+            None,
+        ]
+        json = backend_fixtures["feature_view"]["get"]["response"]
+        fv = feature_view.FeatureView.from_response_json(json)
+
+        # Act
+        with pytest.warns(util.VersionWarning):
+            fv.init_serving()
+
+        # Assert
+        assert mock_vector_server.return_value.init_serving.call_count == 1
+        # falls back to training dataset version 1 for batch scoring
+        assert mock_vector_server.return_value.init_batch_scoring.call_count == 2
+        assert sorted(
+            call.args[2]
+            for call in mock_vector_server.call_args_list
+            if call.args[2] is not None
+        ) == [1, 1]
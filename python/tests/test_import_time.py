@@ -0,0 +1,62 @@
+#
+#   Copyright 2023 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# optional dependencies only needed for validation, s3 reads, hive and kafka writes
+LAZY_MODULES = [
+    "great_expectations",
+    "boto3",
+    "botocore",
+    "pyhive",
+    "thrift",
+    "confluent_kafka",
+    "tqdm",
+    "jks",
+]
+
+IMPORT_SCRIPT = """
+import json
+import sys
+
+import hsfs
+from hsfs.engine import python
+from hsfs.core import vector_server
+
+print(json.dumps({"modules": sorted(sys.modules)}))
+"""
+
+
+class TestImportTime:
+    @pytest.fixture(scope="class")
+    def import_result(self):
+        # a fresh interpreter, as the test session has imported everything already
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        return json.loads(output.splitlines()[-1])
+
+    @pytest.mark.parametrize("module", LAZY_MODULES)
+    def test_import_hsfs_lazy_module(self, import_result, module):
+        # Assert
+        assert module not in import_result["modules"]
@@ -111,6 +111,51 @@ class TestTrainingDataset:
         assert isinstance(td.statistics_config, statistics_config.StatisticsConfig)
         assert td.label == []
 
+    def test_get_serving_vector_after_batch_init(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+        mock_vector_server = mocker.patch("hsfs.core.vector_server.VectorServer")
+        mock_vector_server.return_value.prepared_statements = None
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={},
+        )
+
+        # Act
+        td.get_serving_vector({"id": 1}, external=False)
+
+        # Assert
+        mock_vector_server.return_value.init_serving.assert_not_called()
+        mock_vector_server.return_value.init_missing_prepared_statement.assert_called_once_with(
+            td, False
+        )
+
+    def test_get_serving_vector_not_initialised(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+        mock_vector_server = mocker.patch("hsfs.core.vector_server.VectorServer")
+        mock_vector_server.return_value.prepared_statements = None
+        mock_vector_server.return_value.batch_prepared_statements = None
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={},
+        )
+
+        # Act
+        td.get_serving_vector({"id": 1}, external=False)
+
+        # Assert
+        mock_vector_server.return_value.init_serving.assert_called_once_with(
+            td, None, False
+        )
+        mock_vector_server.return_value.init_missing_prepared_statement.assert_not_called()
+
     def test_from_response_json_empty(self, mocker, backend_fixtures):
         # Arrange
         mocker.patch("hsfs.client.get_instance")
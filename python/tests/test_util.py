@@ -16,6 +16,8 @@
 
 from datetime import datetime, date
 from hsfs import util
+import numpy as np
+import pandas as pd
 import pytest
 import pytz
 
@@ -51,6 +53,31 @@ class TestUtil:
         dt = util.convert_event_time_to_timestamp("2022-01-01T00:00:00.000000Z")
         assert dt == 1640995200000
 
+    def test_convert_event_time_column_to_timestamp_datetime(self):
+        timestamps = util.convert_event_time_column_to_timestamp(
+            pd.Series([datetime(2022, 1, 1, 0, 0, 0), None])
+        )
+        assert timestamps[0] == 1640995200000
+        assert np.isnan(timestamps[1])
+
+    def test_convert_event_time_column_to_timestamp_datetime_tz(self):
+        timestamps = util.convert_event_time_column_to_timestamp(
+            pd.Series([pd.Timestamp("2021-12-31 16:00:00", tz="US/Pacific")])
+        )
+        assert timestamps.tolist() == [1640995200000]
+
+    def test_convert_event_time_column_to_timestamp_int(self):
+        timestamps = util.convert_event_time_column_to_timestamp(
+            pd.Series([1640995200, 1640995200000])
+        )
+        assert timestamps.tolist() == [1640995200000, 1640995200000]
+
+    def test_convert_event_time_column_to_timestamp_date(self):
+        timestamps = util.convert_event_time_column_to_timestamp(
+            pd.Series([date(2022, 1, 1), "2022-01-01 00:00:00"])
+        )
+        assert timestamps.tolist() == [1640995200000, 1640995200000]
+
     def test_convert_event_time_to_timestamp_yyyy_mm_dd(self):
         timestamp = util.get_timestamp_from_date_string("2022-01-01")
         assert timestamp == 1640995200000